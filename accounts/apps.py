@@ -7,3 +7,8 @@ class AccountsConfig(AppConfig):
     """To configure App "Account" """
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'accounts'
+
+    def ready(self):
+        """Register route hooks once all models are loaded."""
+        # pylint: disable=import-outside-toplevel, unused-import
+        from accounts import hooks
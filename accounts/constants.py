@@ -1 +1,2 @@
-FIVE_STAR = 5
\ No newline at end of file
+ONE_STAR = 1
+FIVE_STAR = 5
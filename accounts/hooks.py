@@ -0,0 +1,17 @@
+"""This module registers route hooks for URLs of Accounts app"""
+
+# pylint: disable=unused-argument
+from analytics.clicks import record_click
+
+from accounts.models import Seller
+from accounts.route_hooks import register_route_hook
+
+
+@register_route_hook("accounts:display_profile")
+def record_profile_click(request, pk, **kwargs):
+    """
+    Whenever a Seller profile is viewed, a click of Seller is recorded which
+    increments his clicks by 1 on next flush.
+    """
+    if request.method == "GET":
+        record_click(Seller, pk)
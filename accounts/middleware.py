@@ -1,11 +1,14 @@
 """This contains all custom middlewares for Accounts app"""
 
-# pylint: disable=unused-argument, no-self-use, no-member
-from accounts.models import Seller
+# pylint: disable=unused-argument, no-self-use
+from accounts.route_hooks import get_route_hooks
 
 
-class ProfileClicksMiddleWare:
-    """Custom midddleware to increment profile clicks."""
+class RouteHooksMiddleware:
+    """
+    Custom middleware to run hooks registered for URL name a request
+    resolved to, just before its view is called.
+    """
 
     def __init__(self, get_response):
         self.get_response = get_response
@@ -16,14 +19,8 @@ class ProfileClicksMiddleWare:
 
     def process_view(self, request, view_func, view_args, view_kwargs):
         """
-        Whenever Seller profile is clicked or viewed, view function
-        "display_profile" is called, Seller clicks are incremented by 1.
+        Run every hook registered for URL name of this request, requests
+        of URLs without hooks are left untouched.
         """
-        if view_func.__name__ == "display_profile":
-            seller_id = view_kwargs.get("seller_pk")
-            try:
-                seller = Seller.objects.get(id=seller_id)
-                seller.clicks += 1
-                seller.save()
-            except Seller.DoesNotExist:
-                pass
+        for hook in get_route_hooks(request.resolver_match.view_name):
+            hook(request, *view_args, **view_kwargs)
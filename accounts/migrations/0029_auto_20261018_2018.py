@@ -0,0 +1,27 @@
+# Generated by Django 3.2.25 on 2026-10-18 15:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0028_auto_20211115_0148'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='seller',
+            options={'ordering': ['-rating', '-providing_services_to_number_of_games']},
+        ),
+        migrations.AddField(
+            model_name='seller',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Number of reviews'),
+        ),
+        migrations.AddField(
+            model_name='seller',
+            name='rating_sum',
+            field=models.FloatField(default=0, verbose_name='Sum of review ratings'),
+        ),
+    ]
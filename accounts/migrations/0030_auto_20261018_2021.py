@@ -0,0 +1,38 @@
+# Generated by Django 3.2.25 on 2026-10-18 15:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0029_auto_20261018_2018'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='seller',
+            name='five_star_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='5 star reviews'),
+        ),
+        migrations.AddField(
+            model_name='seller',
+            name='four_star_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='4 star reviews'),
+        ),
+        migrations.AddField(
+            model_name='seller',
+            name='one_star_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='1 star reviews'),
+        ),
+        migrations.AddField(
+            model_name='seller',
+            name='three_star_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='3 star reviews'),
+        ),
+        migrations.AddField(
+            model_name='seller',
+            name='two_star_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='2 star reviews'),
+        ),
+    ]
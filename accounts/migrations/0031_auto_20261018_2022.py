@@ -0,0 +1,45 @@
+# Generated by Django 3.2.25 on 2026-10-18 15:22
+
+import accounts.models
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import ExpressionWrapper, F, FloatField
+
+
+def compute_ranking_scores(apps, schema_editor):
+    """Set ranking score of every Seller from his running rating totals."""
+    weight = settings.SELLER_RANKING_PRIOR_WEIGHT
+    prior_total = settings.SELLER_RANKING_PRIOR_RATING * weight
+    apps.get_model("accounts", "Seller").objects.update(
+        ranking_score=ExpressionWrapper(
+            (F("rating_sum") + prior_total) / (F("rating_count") + weight),
+            output_field=FloatField(),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0030_auto_20261018_2021'),
+        ('orders', '0016_backfill_rating_histograms'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='seller',
+            options={'ordering': ['-ranking_score', '-id']},
+        ),
+        migrations.AddField(
+            model_name='seller',
+            name='ranking_score',
+            field=models.FloatField(default=accounts.models.default_ranking_score, verbose_name='Ranking score'),
+        ),
+        migrations.AddIndex(
+            model_name='seller',
+            index=models.Index(fields=['-ranking_score', '-id'], name='seller_ranking_idx'),
+        ),
+        migrations.RunPython(
+            compute_ranking_scores, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-18 15:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0031_auto_20261018_2022'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='seller',
+            index=models.Index(fields=['-rating', '-id'], name='seller_rating_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 3.2.25 on 2026-10-18 15:39
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0032_seller_seller_rating_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='seller',
+            name='rating_updated_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, verbose_name='Time of last rating change'),
+        ),
+        migrations.AddField(
+            model_name='seller',
+            name='rating_version',
+            field=models.PositiveBigIntegerField(default=0, verbose_name='Version of rating'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-18 16:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0033_auto_20261018_2039'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='seller',
+            index=models.Index(fields=['rating_updated_at', 'id'], name='seller_rating_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-18 16:24
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0034_rating_updated_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='seller',
+            name='seller_rating_idx',
+        ),
+    ]
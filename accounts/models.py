@@ -3,14 +3,17 @@ This module contains all models defining our user when behaving
 as a seller, buyer etc.
 """
 
-import orders
 # pylint: disable=no-member, too-few-public-methods
+from django.apps import apps
+from django.conf import settings
 from django.contrib.auth.models import (AbstractBaseUser, BaseUserManager,
                                         PermissionsMixin)
+from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
-from django.db.models import Min
-from django.db.models.aggregates import Count
+from django.db.models import Min, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.db.models.fields.related import OneToOneField
+from django.utils import timezone
 
 from .constants import FIVE_STAR
 from .helpers import get_age_from_date_of_birth
@@ -138,6 +141,69 @@ class User(AbstractBaseUser, PermissionsMixin):
         super().save(*args, **kwargs)
 
 
+def default_ranking_score():
+    """
+    Ranking score of a Seller who has not been reviewed yet, which is the
+    prior rating every Seller starts from.
+    """
+    return float(settings.SELLER_RANKING_PRIOR_RATING)
+
+
+class RatingAggregate(models.Model):
+    """
+    Abstract model to contain the rating of anything which can be reviewed
+    through an Order, such as a Seller or a Game.
+
+    'rating_sum' and 'rating_count' are running totals of all review ratings
+    and star counts hold number of reviews rounded to each star, they are
+    updated incrementally on every review write so that neither 'rating' nor
+    its distribution has to be recomputed by scanning all reviews.
+
+    'rating_version' is incremented, and 'rating_updated_at' set, along with
+    every change of them, so clients can tell whether rating has changed.
+    """
+    HISTOGRAM_FIELDS = (
+        "one_star_count",
+        "two_star_count",
+        "three_star_count",
+        "four_star_count",
+        "five_star_count",
+    )
+
+    rating = models.FloatField("Rating", default=FIVE_STAR)
+    rating_sum = models.FloatField("Sum of review ratings", default=0)
+    rating_count = models.PositiveIntegerField("Number of reviews", default=0)
+
+    one_star_count = models.PositiveIntegerField("1 star reviews", default=0)
+    two_star_count = models.PositiveIntegerField("2 star reviews", default=0)
+    three_star_count = models.PositiveIntegerField("3 star reviews", default=0)
+    four_star_count = models.PositiveIntegerField("4 star reviews", default=0)
+    five_star_count = models.PositiveIntegerField("5 star reviews", default=0)
+
+    rating_version = models.PositiveBigIntegerField(
+        "Version of rating", default=0
+    )
+    rating_updated_at = models.DateTimeField(
+        "Time of last rating change", default=timezone.now
+    )
+
+    class Meta:
+        abstract = True
+
+    @property
+    def rating_histogram(self):
+        """
+        Number of reviews for every star from one to five.
+
+        Returns:
+            (dict): Star mapped to number of reviews rounded to that star.
+        """
+        return {
+            star: getattr(self, field)
+            for star, field in enumerate(self.HISTOGRAM_FIELDS, start=1)
+        }
+
+
 class UserCommonInfo(models.Model):
     """Abstract model to contain common info for Buyer and Seller."""
     total_number_of_completed_orders = 0
@@ -150,7 +216,36 @@ class UserCommonInfo(models.Model):
         abstract = True
 
 
-class Seller(UserCommonInfo):
+class SellerQuerySet(models.QuerySet):
+    """Custom QuerySet defined for fetching Sellers along with their stats."""
+
+    def with_listing_stats(self):
+        """
+        Annotate every Seller with stats shown on Seller listings, so that
+        they are fetched in the same query instead of a query per Seller.
+
+        Returns:
+            SellerQuerySet: Sellers annotated with 'listing_starting_price'
+                and 'listing_total_orders', their number of games is kept on
+                'providing_services_to_number_of_games'.
+        """
+        seller_games = (
+            apps.get_model("games", "SellerGame").objects
+            .filter(seller=OuterRef("pk"))
+            .order_by()
+            .values("seller")
+        )
+        return self.annotate(
+            listing_starting_price=Subquery(
+                seller_games
+                .annotate(min_price=Min("seller_price"))
+                .values("min_price")
+            ),
+            listing_total_orders=Coalesce("order_stats__total_orders", 0),
+        )
+
+
+class Seller(UserCommonInfo, RatingAggregate):
     """Model to define a Seller."""
 
     class BadgeRanks(models.IntegerChoices):
@@ -161,8 +256,8 @@ class Seller(UserCommonInfo):
         MASTER = 3, "Master"
 
     user = OneToOneField(User, related_name="seller", on_delete=models.CASCADE)
-    rating = models.FloatField("Rating", default=FIVE_STAR)
     clicks = models.PositiveBigIntegerField("profile visits", default=0)
+    # Maintained by signals of SellerGame, see games.signals
     providing_services_to_number_of_games = models.PositiveIntegerField(
         "Number of Games", default=0, blank=True
     )
@@ -175,65 +270,69 @@ class Seller(UserCommonInfo):
         default=BadgeRanks.BRONZE,
     )
 
-    class Meta:
-        ordering = ["-rating", "-providing_services_to_number_of_games"]
+    ranking_score = models.FloatField(
+        "Ranking score", default=default_ranking_score
+    )
 
-    def save(self, *args, **kwargs):
-        """
-        Saving and updating the field 'providing_services_to_number_of_games'.
-        """
-        self.providing_services_to_number_of_games = self.seller_games.count()
-        super().save(*args, **kwargs)
+    objects = SellerQuerySet.as_manager()
+
+    class Meta:
+        ordering = ["-ranking_score", "-id"]
+        indexes = [
+            models.Index(
+                fields=["-ranking_score", "-id"], name="seller_ranking_idx"
+            ),
+            models.Index(
+                fields=["rating_updated_at", "id"],
+                name="seller_rating_updated_idx",
+            ),
+        ]
 
     @property
     def starting_price(self):
         """
         Calculate price of every game the Seller is offering service for,
-        and return the minimum price among all his games
+        and return the minimum price among all his games. It is taken from
+        listing stats if this Seller was fetched along with them.
 
         Returns:
             (int): Price of his cheapest game he is offering.
         """
-        prices = Seller.objects.filter(user=self.user).aggregate(
-            min_price=Min("seller_games__seller_price")
-        )
+        if hasattr(self, "listing_starting_price"):
+            return self.listing_starting_price
+        prices = self.seller_games.aggregate(min_price=Min("seller_price"))
         return prices.get("min_price")
 
     @property
     def total_number_of_orders(self):
         """
-        Calculate total of number of orders this seller has completed
-        or cuurently ongoing.
+        Get total of number of orders this seller has completed
+        or cuurently ongoing, from listing stats if this Seller was fetched
+        along with them or else from his order counters.
 
         Returns:
             (int): Total number of orders of this seller.
         """
-        all_sellers_total_orders = Seller.objects.annotate(
-            total_orders=Count('orders')
-        )
-        return all_sellers_total_orders.get(user=self.user).total_orders
+        if hasattr(self, "listing_total_orders"):
+            return self.listing_total_orders
+        try:
+            return self.order_stats.total_orders
+        except ObjectDoesNotExist:
+            return 0
 
     @property
     def recent_buyers(self):
         """
-        Returns 3 recent buyers of this seller.
+        Returns recent buyers of this seller kept along his order counters.
 
         Returns:
-            (int): Last 3 unique buyers who initiated order with this seller.
+            (list): User names of last unique buyers who initiated order with
+                this seller, most recent first.
         """
-        orders_of_seller = (
-            self.orders
-            .values_list('id', flat=True)
-            .order_by('buyer', 'order_start_time')
-            .distinct('buyer')[:3]
-        )
-        recent_buyers = (
-            orders.models.Order.objects
-            .filter(id__in=orders_of_seller)
-            .order_by('-order_start_time')
-            .values_list('buyer__user__user_name', flat=True)
-        )
-        return recent_buyers
+        try:
+            return self.order_stats.recent_buyers
+        except ObjectDoesNotExist:
+            return []
 
 
 class Buyer(UserCommonInfo):
@@ -0,0 +1,37 @@
+"""
+This module contains registry of hooks which are run before views of
+specific URL names, such as recording a click whenever a profile is viewed.
+
+Hooks are looked up by name of the URL a request resolved to, so requests
+to URLs without hooks only pay for a single dictionary lookup.
+"""
+
+from collections import defaultdict
+
+_route_hooks = defaultdict(list)
+
+
+def register_route_hook(url_name):
+    """
+    Decorator to register a hook to be run before view of given URL name.
+
+    Hook is called with the request and keyword arguments captured from URL,
+    its return value is ignored.
+
+    Args:
+        url_name (str): Namespaced URL name such as "accounts:display_profile".
+    """
+    def decorator(hook):
+        _route_hooks[url_name].append(hook)
+        return hook
+    return decorator
+
+
+def get_route_hooks(url_name):
+    """
+    Get all hooks registered for given URL name.
+
+    Returns:
+        (list): Hooks in order they were registered, empty if none.
+    """
+    return _route_hooks.get(url_name, ())
@@ -0,0 +1,101 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from games.models import Game, SellerGame
+from orders.models import Order
+
+from accounts.models import Buyer, Seller, User
+
+
+class SellerListingStatsTestCase(TestCase):
+    """
+    Check that stats shown on Seller listings are fetched along with Sellers
+    instead of with a query per Seller.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create(
+            email="buyer@example.com", user_name="buyer"
+        )
+        self.buyer = Buyer.objects.create(user=self.user)
+        self.games = [
+            Game.objects.create(name=f"Game {index}", image="game.png")
+            for index in range(2)
+        ]
+
+    def create_seller(self, index, prices=(10,)):
+        """Create a Seller offering a Game at every given price."""
+        seller = Seller.objects.create(
+            user=User.objects.create(
+                email=f"seller{index}@example.com", user_name=f"seller{index}"
+            )
+        )
+        for game, price in zip(self.games, prices):
+            SellerGame.objects.create(
+                seller=seller, game=game, seller_price=price
+            )
+        return seller
+
+    def create_order(self, seller):
+        """Create an active Order of Seller for first Game."""
+        return Order.objects.create(
+            buyer=self.buyer,
+            seller=seller,
+            game=self.games[0],
+            price=10,
+            number_of_days_for_completing_the_order=1,
+            gaming_account_id="account",
+            gaming_account_password="password",
+        )
+
+    def test_listing_stats_match_stats_of_seller(self):
+        seller = self.create_seller(0, prices=(30, 20))
+        self.create_order(seller)
+        self.create_order(seller)
+        seller_without_games = self.create_seller(1, prices=())
+        listed = {
+            listed_seller.id: listed_seller
+            for listed_seller in Seller.objects.with_listing_stats()
+        }
+        for seller_id, listed_seller in listed.items():
+            saved_seller = Seller.objects.get(id=seller_id)
+            with self.subTest(seller=seller_id):
+                self.assertEqual(
+                    listed_seller.starting_price, saved_seller.starting_price
+                )
+                self.assertEqual(
+                    listed_seller.total_number_of_orders,
+                    saved_seller.total_number_of_orders,
+                )
+        self.assertEqual(listed[seller.id].starting_price, 20)
+        self.assertEqual(listed[seller.id].total_number_of_orders, 2)
+        self.assertIsNone(listed[seller_without_games.id].starting_price)
+        self.assertEqual(
+            listed[seller_without_games.id].total_number_of_orders, 0
+        )
+
+    def test_listing_stats_are_read_without_queries(self):
+        self.create_order(self.create_seller(0, prices=(30, 20)))
+        seller = Seller.objects.with_listing_stats().get()
+        with self.assertNumQueries(0):
+            self.assertEqual(seller.starting_price, 20)
+            self.assertEqual(seller.total_number_of_orders, 1)
+            self.assertEqual(seller.providing_services_to_number_of_games, 2)
+
+    def count_listing_queries(self):
+        """Count queries of listing all Sellers."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse("accounts:show_all"), {"choice": "Sellers"}
+            )
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_listing_queries_do_not_grow_with_sellers(self):
+        self.client.force_login(self.user)
+        self.create_seller(0)
+        queries_of_one_seller = self.count_listing_queries()
+        for index in range(1, 5):
+            self.create_order(self.create_seller(index))
+        self.assertEqual(self.count_listing_queries(), queries_of_one_seller)
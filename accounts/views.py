@@ -10,7 +10,10 @@ from django.urls import reverse
 from django.utils.decorators import method_decorator
 from django.views import generic
 from django.views.generic.base import View
+from gameboost.pagination import KeysetPaginator, get_page_urls, get_query_url
 from games.models import Game
+from search.backends import search_objects
+from search.models import SearchEntry
 
 from accounts.models import Buyer, Seller
 
@@ -78,29 +81,45 @@ class ShowGamesForCurrentSellerView(generic.DetailView):
 def show_all(request):
     """
     When a user selects a category type such as Games or Seller, He will be
-    displayed list of all Games or Sellers depending on his selection.
+    displayed list of all Games or Sellers depending on his selection. If he
+    searched for something, matching ones are listed most relevant first in
+    pages selected by "page" query parameter, otherwise all of them are
+    listed in their default order in pages selected by "cursor".
     """
     if request.user.is_superuser:
         return redirect('admin:login')
 
     Buyer.objects.get_or_create(user=request.user)
-    context = {}
-    text = ""
-    if request.GET:
-        choice = request.GET.get("choice")
-        text = request.GET.get("search_text")
-        if choice == "Sellers":
-            context = {
-                "sellers": Seller.objects
-                .filter(user__user_name__icontains=text)
-                .select_related("user")
-            }
-            return render(request, 'all_users.html', context)
-    context = {
-        "games": Game.objects.filter(name__icontains=text)
-        .prefetch_related("categories")
-    }
-    return render(request, 'all_games.html', context)
+    if request.GET.get("choice") == "Sellers":
+        queryset = Seller.objects.with_listing_stats().select_related("user")
+        kind, context_name = SearchEntry.Kind.SELLER, "sellers"
+        template_name = 'all_users.html'
+    else:
+        queryset = Game.objects.prefetch_related("categories")
+        kind, context_name = SearchEntry.Kind.GAME, "games"
+        template_name = 'all_games.html'
+
+    text = request.GET.get("search_text", "").strip()
+    if text:
+        try:
+            page = max(int(request.GET.get("page", 1)), 1)
+        except ValueError:
+            page = 1
+        objects, has_next = search_objects(queryset, text, kind, page)
+        context = {
+            context_name: objects,
+            "previous_page_url": (
+                get_query_url(request, page=page - 1) if page > 1 else None
+            ),
+            "next_page_url": (
+                get_query_url(request, page=page + 1) if has_next else None
+            ),
+        }
+    else:
+        page = KeysetPaginator(queryset).get_page(request.GET.get("cursor"))
+        context = {context_name: page.object_list}
+        context.update(get_page_urls(request, page))
+    return render(request, template_name, context)
 
 
 class LoginUserView(generic.View):
@@ -172,6 +191,14 @@ class UpdateUserProfileView(generic.edit.FormView):
 
 
 class DisplayProfileDetailView(generic.DetailView):
-    model = Seller
+    """
+    Display public profile of a Seller, fetched along with his listing stats,
+    user and recent buyers in a single query.
+    """
+    queryset = (
+        Seller.objects
+        .with_listing_stats()
+        .select_related("user", "order_stats")
+    )
     context_object_name = "seller"
     template_name = "public_profile.html"
@@ -0,0 +1,10 @@
+"""Models to be displayed on Admin panel are registered here"""
+
+from django.contrib import admin
+
+# pylint: disable=relative-beyond-top-level
+from .models import DailyClickCount, HourlyClickCount, MonthlyClickCount
+
+admin.site.register(HourlyClickCount)
+admin.site.register(DailyClickCount)
+admin.site.register(MonthlyClickCount)
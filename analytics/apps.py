@@ -0,0 +1,9 @@
+"""Apps can be configure in this module."""
+
+from django.apps import AppConfig
+
+
+class AnalyticsConfig(AppConfig):
+    """To configure App "Analytics" """
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'analytics'
@@ -0,0 +1,312 @@
+"""
+This module records clicks of Sellers and Games without writing to the
+database on every click, and counts clicks objects recieved within a window.
+
+Clicks are accumulated in memory of current process and flushed
+periodically, all objects clicked the same number of times are incremented
+with a single UPDATE using F() expressions, so concurrent flushes of
+different workers never overwrite each other's counts. Every flush also adds
+clicks to hourly buckets which are later rolled up into daily and monthly
+buckets by command 'rollup_clicks'.
+
+Clicks are only as durable as the process buffering them. They are flushed
+on a normal exit, but a process killed without exiting, such as by SIGKILL
+or the OOM killer, loses clicks recorded since its last flush, which is at
+most CLICK_BUFFER_FLUSH_INTERVAL seconds of clicks of at most
+CLICK_BUFFER_MAX_PENDING objects.
+"""
+
+# pylint: disable=no-member
+
+import atexit
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from analytics.models import (DailyClickCount, HourlyClickCount,
+                              MonthlyClickCount)
+from analytics.rollups import get_daily_rollup_start, get_monthly_rollup_start
+
+logger = logging.getLogger(__name__)
+
+
+class ClickBuffer:
+    """
+    Accumulates clicks per object in memory and flushes them to 'clicks'
+    field of their models and to their hourly buckets.
+
+    A background thread flushes every CLICK_BUFFER_FLUSH_INTERVAL seconds, a
+    click flushes by itself only when more than CLICK_BUFFER_MAX_PENDING
+    objects are waiting, and remaining clicks are flushed when the process
+    exits. Lifetime clicks and hourly buckets are flushed in separate
+    transactions, counts of a failed one are kept and retried with the next
+    flush without the other one being written twice.
+    """
+
+    def __init__(self):
+        self._pending_lifetime = Counter()
+        self._pending_hourly = Counter()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._thread = None
+
+    def record(self, model, object_id, clicks=1):
+        """
+        Record clicks of an object, they are written to database on next flush.
+
+        Args:
+            model (Model): Model of clicked object, having a 'clicks' field.
+            object_id (int): Primary key of clicked object.
+            clicks (int): Number of clicks to be recorded.
+        """
+        hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+        with self._lock:
+            self._pending_lifetime[(model, object_id)] += clicks
+            self._pending_hourly[(model, object_id, hour)] += clicks
+            pending_objects = len(self._pending_lifetime)
+        self._start_background_flush()
+        if (
+            pending_objects > settings.CLICK_BUFFER_MAX_PENDING
+            or settings.CLICK_BUFFER_FLUSH_INTERVAL <= 0
+        ):
+            self.flush()
+
+    def _is_flush_due(self):
+        """Check if flush interval has passed since the previous flush."""
+        elapsed = time.monotonic() - self._last_flush
+        return elapsed >= settings.CLICK_BUFFER_FLUSH_INTERVAL
+
+    def _take_pending(self):
+        """
+        Remove all pending clicks from buffer and return them.
+
+        Returns:
+            (tuple): Counters of lifetime clicks and of hourly clicks.
+        """
+        with self._lock:
+            lifetime, hourly = self._pending_lifetime, self._pending_hourly
+            self._pending_lifetime, self._pending_hourly = Counter(), Counter()
+            self._last_flush = time.monotonic()
+        return lifetime, hourly
+
+    def _restore_pending(self, lifetime=(), hourly=()):
+        """Put back clicks which could not be flushed."""
+        with self._lock:
+            self._pending_lifetime.update(lifetime)
+            self._pending_hourly.update(hourly)
+
+    def flush(self):
+        """
+        Write all pending clicks to database, lifetime clicks of objects and
+        their hourly buckets each in a single transaction.
+        """
+        with self._flush_lock:
+            lifetime, hourly = self._take_pending()
+            if lifetime and not _write_clicks(
+                _flush_lifetime_clicks, lifetime
+            ):
+                self._restore_pending(lifetime=lifetime)
+            if hourly and not _write_clicks(_flush_hourly_clicks, hourly):
+                self._restore_pending(hourly=hourly)
+
+    def _start_background_flush(self):
+        """Start thread flushing pending clicks periodically, only once."""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._flush_periodically,
+                name="click-buffer-flush",
+                daemon=True,
+            )
+            self._thread.start()
+        atexit.register(self.flush)
+
+    def _flush_periodically(self):
+        """Flush pending clicks every flush interval until process exits."""
+        while True:
+            time.sleep(max(settings.CLICK_BUFFER_FLUSH_INTERVAL, 1))
+            if self._is_flush_due():
+                close_old_connections()
+                self.flush()
+
+
+def _write_clicks(flush, pending):
+    """
+    Flush pending clicks with given function in a transaction.
+
+    Returns:
+        (bool): True if clicks were written, False if they have to be retried.
+    """
+    try:
+        with transaction.atomic():
+            flush(pending)
+    except Exception:  # pylint: disable=broad-except
+        logger.exception("Could not flush clicks, retrying later")
+        return False
+    return True
+
+
+def _flush_lifetime_clicks(pending):
+    """
+    Increment 'clicks' field of every clicked object, objects of the same
+    model clicked the same number of times are updated together.
+    """
+    grouped_ids = defaultdict(list)
+    for (model, object_id), clicks in pending.items():
+        grouped_ids[(model, clicks)].append(object_id)
+    for (model, clicks), object_ids in grouped_ids.items():
+        model.objects.filter(id__in=object_ids).update(
+            clicks=F("clicks") + clicks
+        )
+
+
+def _add_hourly_clicks_with_on_conflict(clicks_by_bucket):
+    """
+    Add clicks to hourly buckets with a single INSERT ... ON CONFLICT
+    statement of PostgreSQL, which never fails on a bucket created by
+    another process meanwhile.
+    """
+    table = HourlyClickCount._meta.db_table
+    rows = ", ".join(["(%s, %s, %s, %s)"] * len(clicks_by_bucket))
+    params = [
+        value
+        for (kind, object_id, hour), clicks in clicks_by_bucket.items()
+        for value in (kind, object_id, hour, clicks)
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} (kind, object_id, period_start, clicks) "
+            f"VALUES {rows} "
+            "ON CONFLICT (kind, object_id, period_start) DO UPDATE "
+            f"SET clicks = {table}.clicks + EXCLUDED.clicks",
+            params,
+        )
+
+
+def _add_hourly_clicks_with_orm(clicks_by_bucket):
+    """
+    Increment existing hourly buckets and create missing ones. If another
+    process creates a missing bucket meanwhile, unique constraint fails the
+    flush of buckets which is then retried along with the next one.
+    """
+    grouped_clicks = defaultdict(dict)
+    for (kind, object_id, hour), clicks in clicks_by_bucket.items():
+        grouped_clicks[(kind, hour)][object_id] = clicks
+    for (kind, hour), clicks_by_id in grouped_clicks.items():
+        existing_ids = set(
+            HourlyClickCount.objects
+            .filter(kind=kind, period_start=hour, object_id__in=clicks_by_id)
+            .values_list("object_id", flat=True)
+        )
+        ids_by_clicks = defaultdict(list)
+        for object_id in existing_ids:
+            ids_by_clicks[clicks_by_id[object_id]].append(object_id)
+        for clicks, object_ids in ids_by_clicks.items():
+            HourlyClickCount.objects.filter(
+                kind=kind, period_start=hour, object_id__in=object_ids
+            ).update(clicks=F("clicks") + clicks)
+        HourlyClickCount.objects.bulk_create([
+            HourlyClickCount(
+                kind=kind, object_id=object_id, period_start=hour, clicks=clicks
+            )
+            for object_id, clicks in clicks_by_id.items()
+            if object_id not in existing_ids
+        ])
+
+
+def _flush_hourly_clicks(pending):
+    """Add clicks to hourly buckets of every clicked object."""
+    clicks_by_bucket = {
+        (model._meta.label_lower, object_id, hour): clicks
+        for (model, object_id, hour), clicks in pending.items()
+    }
+    if connection.vendor == "postgresql":
+        _add_hourly_clicks_with_on_conflict(clicks_by_bucket)
+    else:
+        _add_hourly_clicks_with_orm(clicks_by_bucket)
+
+
+click_buffer = ClickBuffer()
+
+
+def record_click(model, object_id):
+    """
+    Record a single click of an object of given model.
+
+    Args:
+        model (Model): Model of clicked object, having a 'clicks' field.
+        object_id (int): Primary key of clicked object.
+    """
+    click_buffer.record(model, object_id)
+
+
+def get_click_counts(model, object_ids, since, until=None):
+    """
+    Count clicks every given object of model has recieved between 'since'
+    and 'until'.
+
+    Windows starting within hourly retention are counted from hourly buckets
+    only, at the granularity of an hour. Older windows are counted from daily
+    buckets of days before the first complete day of hourly retention, and
+    windows starting before daily retention also from monthly buckets of
+    months before the first complete month of daily retention, so only whole
+    days or months after 'since' are counted of those. Buckets of all
+    granularities are fetched in a single query. Clicks not flushed yet are
+    not counted.
+
+    Args:
+        model (Model): Either Seller or Game.
+        object_ids (list): IDs of objects whose clicks are counted.
+        since (datetime): Start of the window.
+        until (datetime): End of the window, current time if not given.
+
+    Returns:
+        (dict): Object ID mapped to its number of clicks, zero included.
+    """
+    kind = model._meta.label_lower
+    now = timezone.now()
+    until = until or now
+    hourly_since = daily_since = since
+    if since < now - timezone.timedelta(
+        days=settings.CLICK_HOURLY_RETENTION_DAYS
+    ):
+        hourly_since = get_daily_rollup_start(now)
+    if since < now - timezone.timedelta(
+        days=settings.CLICK_DAILY_RETENTION_DAYS
+    ):
+        daily_since = get_monthly_rollup_start(now)
+    counts = None
+    for bucket_model, start, end in (
+        (MonthlyClickCount, since, min(until, daily_since)),
+        (DailyClickCount, daily_since, min(until, hourly_since)),
+        (HourlyClickCount, hourly_since, until),
+    ):
+        if start >= end:
+            continue
+        bucket_counts = (
+            bucket_model.objects
+            .filter(
+                kind=kind, object_id__in=object_ids,
+                period_start__gte=start, period_start__lt=end
+            )
+            .values_list("object_id", "clicks")
+            .order_by()
+        )
+        counts = (
+            bucket_counts if counts is None
+            else counts.union(bucket_counts, all=True)
+        )
+    totals = dict.fromkeys(object_ids, 0)
+    for object_id, clicks in counts if counts is not None else ():
+        totals[object_id] += clicks
+    return totals
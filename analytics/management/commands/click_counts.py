@@ -0,0 +1,61 @@
+"""Management command to show clicks of Sellers or Games within a window."""
+
+from accounts.models import Seller
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from games.models import Game
+
+from analytics.clicks import get_click_counts
+
+# Kinds of clicked objects, along with their models.
+CLICKED_MODELS = {"seller": Seller, "game": Game}
+
+
+def _parse_time(value):
+    """
+    Parse a date and time given to the command, times without timezone are
+    taken to be in current timezone.
+
+    Raises:
+        CommandError: If value is not a valid date and time.
+    """
+    moment = parse_datetime(value)
+    if moment is None:
+        raise CommandError(f"Invalid date and time '{value}'")
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+class Command(BaseCommand):
+    """
+    Show number of clicks every given Seller or Game has received within a
+    window, counted from hourly, daily and monthly buckets of clicks.
+    """
+
+    help = "Show clicks of Sellers or Games between two times."
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", choices=sorted(CLICKED_MODELS))
+        parser.add_argument("ids", type=int, nargs="+", metavar="id")
+        parser.add_argument(
+            "--since", type=_parse_time,
+            help="Start of the window in ISO 8601, 24 hours ago by default.",
+        )
+        parser.add_argument(
+            "--until", type=_parse_time,
+            help="End of the window in ISO 8601, now by default.",
+        )
+
+    def handle(self, *args, **options):
+        since = options["since"] or (
+            timezone.now() - timezone.timedelta(hours=24)
+        )
+        counts = get_click_counts(
+            CLICKED_MODELS[options["kind"]], options["ids"], since,
+            options["until"],
+        )
+        name = options["kind"].title()
+        for object_id, clicks in counts.items():
+            self.stdout.write(f"{name} {object_id}: {clicks}")
@@ -0,0 +1,28 @@
+"""Management command to roll up and prune bucketed clicks."""
+
+from django.core.management.base import BaseCommand
+
+from analytics.clicks import click_buffer
+from analytics.rollups import (prune_clicks, roll_up_daily_clicks,
+                               roll_up_monthly_clicks)
+
+
+class Command(BaseCommand):
+    """
+    Roll up hourly clicks into daily clicks and daily clicks into monthly
+    clicks, then prune buckets older than their retention.
+
+    It is meant to be run periodically, e.g. hourly by cron.
+    """
+
+    help = "Roll up hourly clicks into days and months and prune old ones."
+
+    def handle(self, *args, **options):
+        click_buffer.flush()
+        daily = roll_up_daily_clicks()
+        monthly = roll_up_monthly_clicks()
+        hourly_deleted, daily_deleted = prune_clicks()
+        self.stdout.write(
+            f"Wrote {daily} daily and {monthly} monthly buckets, deleted "
+            f"{hourly_deleted} hourly and {daily_deleted} daily buckets"
+        )
@@ -0,0 +1,64 @@
+# Generated by Django 3.2.25 on 2026-10-18 15:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyClickCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('accounts.seller', 'Seller'), ('games.game', 'Game')], max_length=20, verbose_name='Kind of object')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='ID of object')),
+                ('period_start', models.DateTimeField(verbose_name='Start of period')),
+                ('clicks', models.PositiveBigIntegerField(default=0, verbose_name='Number of clicks')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='HourlyClickCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('accounts.seller', 'Seller'), ('games.game', 'Game')], max_length=20, verbose_name='Kind of object')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='ID of object')),
+                ('period_start', models.DateTimeField(verbose_name='Start of period')),
+                ('clicks', models.PositiveBigIntegerField(default=0, verbose_name='Number of clicks')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='MonthlyClickCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('accounts.seller', 'Seller'), ('games.game', 'Game')], max_length=20, verbose_name='Kind of object')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='ID of object')),
+                ('period_start', models.DateTimeField(verbose_name='Start of period')),
+                ('clicks', models.PositiveBigIntegerField(default=0, verbose_name='Number of clicks')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='monthlyclickcount',
+            constraint=models.UniqueConstraint(fields=('kind', 'object_id', 'period_start'), name='unique_monthly_click_count'),
+        ),
+        migrations.AddIndex(
+            model_name='hourlyclickcount',
+            index=models.Index(fields=['period_start'], name='hourly_click_period_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='hourlyclickcount',
+            constraint=models.UniqueConstraint(fields=('kind', 'object_id', 'period_start'), name='unique_hourly_click_count'),
+        ),
+        migrations.AddIndex(
+            model_name='dailyclickcount',
+            index=models.Index(fields=['period_start'], name='daily_click_period_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='dailyclickcount',
+            constraint=models.UniqueConstraint(fields=('kind', 'object_id', 'period_start'), name='unique_daily_click_count'),
+        ),
+    ]
@@ -0,0 +1,73 @@
+"""
+This module contains models storing clicks of Sellers and Games bucketed by
+hour, day and month so clicks within a time window can be counted.
+"""
+
+# pylint: disable=too-few-public-methods
+
+from django.db import models
+
+
+class ClickCount(models.Model):
+    """
+    Abstract model to contain number of clicks an object has recieved during
+    a period starting at 'period_start'.
+    """
+
+    class Kind(models.TextChoices):
+        """Contains Choices available for clicked objects"""
+        SELLER = "accounts.seller", "Seller"
+        GAME = "games.game", "Game"
+
+    kind = models.CharField("Kind of object", max_length=20, choices=Kind.choices)
+    object_id = models.PositiveBigIntegerField("ID of object")
+    period_start = models.DateTimeField("Start of period")
+    clicks = models.PositiveBigIntegerField("Number of clicks", default=0)
+
+    class Meta:
+        abstract = True
+
+    def __str__(self):
+        return f"{self.kind}_{self.object_id}_{self.period_start}"
+
+
+class HourlyClickCount(ClickCount):
+    """Clicks of an object during an hour, written by the click buffer."""
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "object_id", "period_start"],
+                name="unique_hourly_click_count",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["period_start"], name="hourly_click_period_idx"),
+        ]
+
+
+class DailyClickCount(ClickCount):
+    """Clicks of an object during a day, rolled up from hourly clicks."""
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "object_id", "period_start"],
+                name="unique_daily_click_count",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["period_start"], name="daily_click_period_idx"),
+        ]
+
+
+class MonthlyClickCount(ClickCount):
+    """Clicks of an object during a month, rolled up from daily clicks."""
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "object_id", "period_start"],
+                name="unique_monthly_click_count",
+            ),
+        ]
@@ -0,0 +1,141 @@
+"""
+This module rolls up hourly clicks into daily clicks and daily clicks into
+monthly clicks, and prunes buckets older than their retention.
+
+Periods are UTC days and months. A rollup always recomputes every complete
+period still fully covered by its source buckets, so running it again, or
+after a missed run, gives the same result.
+"""
+
+# pylint: disable=no-member
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Sum
+from django.db.models.functions import TruncDay, TruncMonth
+from django.utils import timezone
+
+from analytics.models import DailyClickCount, HourlyClickCount, MonthlyClickCount
+
+ROLLUP_BATCH_SIZE = 1000
+
+
+def _start_of_day(moment):
+    """Get start of UTC day of given moment."""
+    return moment.astimezone(timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+
+
+def _start_of_month(moment):
+    """Get start of UTC month of given moment."""
+    return _start_of_day(moment).replace(day=1)
+
+
+def get_daily_rollup_start(now=None):
+    """
+    Get first day whose hourly clicks are all still retained, clicks before
+    it can only be counted from daily buckets.
+    """
+    now = now or timezone.now()
+    hourly_retention_start = now - timezone.timedelta(
+        days=settings.CLICK_HOURLY_RETENTION_DAYS
+    )
+    return _start_of_day(hourly_retention_start) + timezone.timedelta(days=1)
+
+
+def get_monthly_rollup_start(now=None):
+    """
+    Get first month whose daily clicks are all still retained, clicks before
+    it can only be counted from monthly buckets.
+    """
+    now = now or timezone.now()
+    daily_retention_start = now - timezone.timedelta(
+        days=settings.CLICK_DAILY_RETENTION_DAYS
+    )
+    month_start = _start_of_month(daily_retention_start)
+    if month_start < daily_retention_start:
+        month_start = _start_of_month(month_start + timezone.timedelta(days=32))
+    return month_start
+
+
+def _roll_up(source, target, truncate, start, end):
+    """
+    Replace target buckets of periods in [start, end) with sums of source
+    buckets falling in those periods.
+
+    Returns:
+        (int): Number of target buckets written.
+    """
+    totals = (
+        source.objects
+        .filter(period_start__gte=start, period_start__lt=end)
+        .annotate(period=truncate("period_start", tzinfo=timezone.utc))
+        .values("kind", "object_id", "period")
+        .annotate(total_clicks=Sum("clicks"))
+        .order_by()
+    )
+    with transaction.atomic():
+        target.objects.filter(
+            period_start__gte=start, period_start__lt=end
+        ).delete()
+        buckets = [
+            target(
+                kind=total["kind"],
+                object_id=total["object_id"],
+                period_start=total["period"],
+                clicks=total["total_clicks"],
+            )
+            for total in totals.iterator()
+        ]
+        target.objects.bulk_create(buckets, batch_size=ROLLUP_BATCH_SIZE)
+    return len(buckets)
+
+
+def roll_up_daily_clicks(now=None):
+    """
+    Roll up hourly clicks of every complete day within hourly retention.
+
+    Returns:
+        (int): Number of daily buckets written.
+    """
+    now = now or timezone.now()
+    return _roll_up(
+        HourlyClickCount, DailyClickCount, TruncDay,
+        get_daily_rollup_start(now), _start_of_day(now)
+    )
+
+
+def roll_up_monthly_clicks(now=None):
+    """
+    Roll up daily clicks of every complete month within daily retention.
+
+    Returns:
+        (int): Number of monthly buckets written.
+    """
+    now = now or timezone.now()
+    return _roll_up(
+        DailyClickCount, MonthlyClickCount, TruncMonth,
+        get_monthly_rollup_start(now), _start_of_month(now)
+    )
+
+
+def prune_clicks(now=None):
+    """
+    Delete hourly and daily buckets older than their retention.
+
+    Returns:
+        (tuple): Number of hourly and daily buckets deleted.
+    """
+    now = now or timezone.now()
+    hourly_deleted, _ = HourlyClickCount.objects.filter(
+        period_start__lt=now - timezone.timedelta(
+            days=settings.CLICK_HOURLY_RETENTION_DAYS
+        )
+    ).delete()
+    daily_deleted, _ = DailyClickCount.objects.filter(
+        period_start__lt=now - timezone.timedelta(
+            days=settings.CLICK_DAILY_RETENTION_DAYS
+        )
+    ).delete()
+    return hourly_deleted, daily_deleted
@@ -0,0 +1,161 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from games.models import Game
+
+from analytics import clicks
+from analytics.clicks import ClickBuffer, get_click_counts
+from analytics.models import (DailyClickCount, HourlyClickCount,
+                              MonthlyClickCount)
+
+
+@override_settings(
+    CLICK_BUFFER_FLUSH_INTERVAL=3600, CLICK_BUFFER_MAX_PENDING=10
+)
+@mock.patch.object(ClickBuffer, "_start_background_flush")
+class ClickBufferTestCase(TestCase):
+    """
+    Check that buffered clicks reach lifetime clicks of objects and their
+    hourly buckets exactly once, even when a flush fails.
+    """
+
+    def setUp(self):
+        self.games = [
+            Game.objects.create(name=f"Game {index}", image="game.png")
+            for index in range(2)
+        ]
+        self.buffer = ClickBuffer()
+
+    def get_clicks(self, game):
+        """Get lifetime clicks of a Game as saved in database."""
+        return Game.objects.values_list("clicks", flat=True).get(id=game.id)
+
+    def get_hourly_clicks(self, game):
+        """Get sum of hourly buckets of a Game."""
+        return sum(
+            HourlyClickCount.objects
+            .filter(kind="games.game", object_id=game.id)
+            .values_list("clicks", flat=True)
+        )
+
+    def test_clicks_are_written_only_on_flush(self, start_background_flush):
+        self.buffer.record(Game, self.games[0].id)
+        self.buffer.record(Game, self.games[0].id)
+        self.buffer.record(Game, self.games[1].id)
+        self.assertEqual(self.get_clicks(self.games[0]), 0)
+        self.buffer.flush()
+        self.assertEqual(self.get_clicks(self.games[0]), 2)
+        self.assertEqual(self.get_clicks(self.games[1]), 1)
+        self.assertEqual(self.get_hourly_clicks(self.games[0]), 2)
+        self.assertEqual(self.get_hourly_clicks(self.games[1]), 1)
+
+    def test_flush_adds_to_existing_bucket(self, start_background_flush):
+        self.buffer.record(Game, self.games[0].id)
+        self.buffer.flush()
+        self.buffer.record(Game, self.games[0].id, clicks=3)
+        self.buffer.flush()
+        self.assertEqual(self.get_clicks(self.games[0]), 4)
+        self.assertEqual(
+            HourlyClickCount.objects.get(object_id=self.games[0].id).clicks, 4
+        )
+
+    def test_too_many_pending_objects_flush(self, start_background_flush):
+        with override_settings(CLICK_BUFFER_MAX_PENDING=1):
+            self.buffer.record(Game, self.games[0].id)
+            self.assertEqual(self.get_clicks(self.games[0]), 0)
+            self.buffer.record(Game, self.games[1].id)
+        self.assertEqual(self.get_clicks(self.games[0]), 1)
+        self.assertEqual(self.get_clicks(self.games[1]), 1)
+
+    def test_failed_buckets_are_retried_alone(self, start_background_flush):
+        self.buffer.record(Game, self.games[0].id)
+        with mock.patch.object(
+            clicks, "_flush_hourly_clicks", side_effect=DatabaseError
+        ), self.assertLogs("analytics.clicks", "ERROR"):
+            self.buffer.flush()
+        self.assertEqual(self.get_clicks(self.games[0]), 1)
+        self.assertEqual(self.get_hourly_clicks(self.games[0]), 0)
+        self.buffer.flush()
+        self.assertEqual(self.get_clicks(self.games[0]), 1)
+        self.assertEqual(self.get_hourly_clicks(self.games[0]), 1)
+
+    def test_failed_lifetime_clicks_are_retried_alone(
+        self, start_background_flush
+    ):
+        self.buffer.record(Game, self.games[0].id)
+        with mock.patch.object(
+            clicks, "_flush_lifetime_clicks", side_effect=DatabaseError
+        ), self.assertLogs("analytics.clicks", "ERROR"):
+            self.buffer.flush()
+        self.assertEqual(self.get_clicks(self.games[0]), 0)
+        self.assertEqual(self.get_hourly_clicks(self.games[0]), 1)
+        self.buffer.record(Game, self.games[0].id)
+        self.buffer.flush()
+        self.assertEqual(self.get_clicks(self.games[0]), 2)
+        self.assertEqual(self.get_hourly_clicks(self.games[0]), 2)
+
+
+@override_settings(
+    CLICK_HOURLY_RETENTION_DAYS=30, CLICK_DAILY_RETENTION_DAYS=400
+)
+class ClickCountsTestCase(TestCase):
+    """
+    Check that clicks within a window are counted from buckets of every
+    granularity, each click only once.
+    """
+
+    def setUp(self):
+        self.game = Game.objects.create(name="Game", image="game.png")
+        self.now = timezone.now()
+        self.add_clicks(HourlyClickCount, self.now, 1)
+        self.add_clicks(HourlyClickCount, self.days_ago(5), 2)
+        self.add_clicks(DailyClickCount, self.days_ago(5), 2)
+        self.add_clicks(DailyClickCount, self.days_ago(100), 4)
+        self.add_clicks(DailyClickCount, self.days_ago(390), 8)
+        self.add_clicks(MonthlyClickCount, self.days_ago(500), 16)
+
+    def days_ago(self, days):
+        """Get start of UTC day given number of days ago."""
+        return (self.now - timezone.timedelta(days=days)).astimezone(
+            timezone.utc
+        ).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def add_clicks(self, model, period_start, clicks):
+        """Create a bucket of clicks of Game."""
+        model.objects.create(
+            kind="games.game", object_id=self.game.id,
+            period_start=period_start, clicks=clicks,
+        )
+
+    def get_clicks(self, days):
+        """Count clicks of Game within given number of days until now."""
+        since = self.now - timezone.timedelta(days=days)
+        return get_click_counts(Game, [self.game.id], since)[self.game.id]
+
+    def test_window_within_hourly_retention(self):
+        self.assertEqual(self.get_clicks(1), 1)
+        self.assertEqual(self.get_clicks(10), 3)
+
+    def test_window_within_daily_retention(self):
+        self.assertEqual(self.get_clicks(200), 7)
+
+    def test_window_before_daily_retention(self):
+        self.assertEqual(self.get_clicks(1000), 23)
+
+    def test_objects_without_clicks(self):
+        self.assertEqual(
+            get_click_counts(Game, [self.game.id, 0], self.now, self.now),
+            {self.game.id: 0, 0: 0},
+        )
+
+    def test_click_counts_command(self):
+        output = StringIO()
+        call_command(
+            "click_counts", "game", str(self.game.id),
+            "--since", self.days_ago(10).isoformat(), stdout=output,
+        )
+        self.assertEqual(output.getvalue(), f"Game {self.game.id}: 3\n")
@@ -0,0 +1,143 @@
+"""
+This module contains base of in-memory indexes which every process builds
+from database, keeps updated from signals of its own writes and rebuilds
+periodically to pick up changes made by other processes.
+
+Database is never queried on a request thread. Builds run in a background
+thread while the index built before keeps being served, and an index is
+warmed as soon as its process starts serving requests, so only requests
+arriving before the very first build completes wait for it. Updates applied
+while a build runs are applied again once it swaps in state it loaded, which
+may have been read before they were committed.
+"""
+
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshedIndex:
+    """
+    Base of in-memory indexes, subclasses implement 'load' and 'replace'
+    and apply every update of their state through '_update'. All its methods
+    are thread safe, subclasses guard their state with '_lock'.
+
+    'generation' changes with every build and update, so results derived
+    from state of an index can be cached until it changes.
+    """
+
+    # Name of setting holding seconds after which index is rebuilt.
+    refresh_interval_setting = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._built = threading.Event()
+        self._built_at = None
+        self._updates_during_build = None
+        self.generation = 0
+
+    @property
+    def is_built(self):
+        """Check if index was built at least once."""
+        return self._built_at is not None
+
+    def load(self):
+        """Get state of whole index from database."""
+        raise NotImplementedError
+
+    def replace(self, state):
+        """Replace state of index with one got from 'load', lock is held."""
+        raise NotImplementedError
+
+    def build(self):
+        """Rebuild whole index from database in current thread."""
+        with self._lock:
+            self._updates_during_build = []
+        try:
+            state = self.load()
+            with self._lock:
+                self.replace(state)
+                for update, args in self._updates_during_build:
+                    update(*args)
+                self._built_at = time.monotonic()
+                self.generation += 1
+        finally:
+            with self._lock:
+                self._updates_during_build = None
+        self._built.set()
+
+    def _update(self, update, *args):
+        """
+        Apply an update of state to index if it is built, and remember it to
+        be applied again after a build running meanwhile, so updates have to
+        give the same state when applied twice.
+
+        Args:
+            update (callable): Updates state, called with lock held.
+            args: Arguments of update.
+        """
+        with self._lock:
+            if self._updates_during_build is not None:
+                self._updates_during_build.append((update, args))
+            if self.is_built:
+                update(*args)
+                self.generation += 1
+
+    def _build_in_background(self):
+        """Build index and close database connections of build thread."""
+        try:
+            self.build()
+        except DatabaseError:
+            logger.exception(
+                "Could not build %s, retrying later", type(self).__name__
+            )
+        finally:
+            connections.close_all()
+            self._build_lock.release()
+
+    def refresh(self):
+        """
+        Start rebuilding index in a background thread, unless it is already
+        being rebuilt.
+
+        Returns:
+            (bool): True if a rebuild was started.
+        """
+        if not self._build_lock.acquire(blocking=False):
+            return False
+        try:
+            threading.Thread(
+                target=self._build_in_background,
+                name=f"build-{type(self).__name__}",
+                daemon=True,
+            ).start()
+        except BaseException:
+            self._build_lock.release()
+            raise
+        return True
+
+    def warm(self):
+        """Start building index in background if it is not built yet."""
+        if not self.is_built:
+            self.refresh()
+
+    def ensure_fresh(self):
+        """
+        Start a rebuild if index is not built yet or refresh interval passed.
+        Stale index keeps being served while it is rebuilt, only if it was
+        never built this waits up to INDEX_BUILD_TIMEOUT seconds for it.
+        """
+        built_at = self._built_at
+        if built_at is None:
+            self.refresh()
+            self._built.wait(settings.INDEX_BUILD_TIMEOUT)
+        elif time.monotonic() - built_at > getattr(
+            settings, self.refresh_interval_setting
+        ):
+            self.refresh()
@@ -0,0 +1,204 @@
+"""
+This module contains keyset pagination of listings, where every page is
+found by filtering rows after the last row of previous page in listing
+order instead of skipping rows with an OFFSET, so every page costs the same
+as the first one when an index matches the ordering.
+"""
+
+import base64
+import binascii
+import datetime
+import decimal
+import json
+import uuid
+from collections import namedtuple
+
+from django.conf import settings
+from django.db.models import Q
+
+KeysetPage = namedtuple(
+    "KeysetPage", ["object_list", "previous_cursor", "next_cursor"]
+)
+KeysetPage.__doc__ = """
+Objects on a page along with cursors of pages before and after it, a cursor
+is None if there is no such page.
+"""
+
+NEXT = "n"
+PREVIOUS = "p"
+
+
+class CursorEncoder(json.JSONEncoder):
+    """
+    Encodes dates and times with full precision, unlike DjangoJSONEncoder
+    which drops microseconds that keyset filters depend on.
+    """
+
+    def default(self, o):  # pylint: disable=invalid-name
+        if isinstance(o, (datetime.date, datetime.time)):
+            return o.isoformat()
+        if isinstance(o, (decimal.Decimal, uuid.UUID)):
+            return str(o)
+        return super().default(o)
+
+
+def encode_cursor(values, direction):
+    """
+    Encode ordering values of a row and direction of requested page into an
+    opaque cursor string.
+
+    Args:
+        values (list): Values of ordering fields of last row seen.
+        direction (str): NEXT for rows after it, PREVIOUS for rows before it.
+
+    Returns:
+        (str): URL safe cursor.
+    """
+    data = json.dumps([direction, values], cls=CursorEncoder)
+    return base64.urlsafe_b64encode(data.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """
+    Decode a cursor made by 'encode_cursor'.
+
+    Returns:
+        (tuple): Direction and ordering values, or None if cursor is invalid.
+    """
+    try:
+        direction, values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, TypeError, ValueError, UnicodeError):
+        return None
+    if direction not in (NEXT, PREVIOUS) or not isinstance(values, list):
+        return None
+    return direction, values
+
+
+def get_query_url(request, **params):
+    """
+    Get URL of current path with given query parameters replaced, keeping
+    all other query parameters of request. Parameters set to None are
+    removed.
+    """
+    query = request.GET.copy()
+    for name, value in params.items():
+        query.pop(name, None)
+        if value is not None:
+            query[name] = value
+    return f"{request.path}?{query.urlencode()}"
+
+
+def get_page_urls(request, page, param="cursor"):
+    """
+    Get URLs of pages before and after given page of a listing.
+
+    Args:
+        request (HttpRequest): Request of current page.
+        page (KeysetPage): Current page.
+        param (str): Name of query parameter holding cursor.
+
+    Returns:
+        (dict): URLs of previous and next page, None if there is no such page.
+    """
+    return {
+        "previous_page_url": (
+            page.previous_cursor
+            and get_query_url(request, **{param: page.previous_cursor})
+        ),
+        "next_page_url": (
+            page.next_cursor
+            and get_query_url(request, **{param: page.next_cursor})
+        ),
+    }
+
+
+class KeysetPaginator:
+    """
+    Paginates a QuerySet by keyset on given ordering, whose last field has to
+    be unique, such as "id", so that every row has a distinct position.
+    Ordering fields must not be nullable.
+    """
+
+    def __init__(self, queryset, ordering=None, page_size=None):
+        """
+        Args:
+            queryset (QuerySet): Objects to be paginated.
+            ordering (tuple): Field names, prefixed with "-" for descending
+                order, ending with a unique field. Default ordering of model
+                of queryset if not given.
+            page_size (int): Number of objects on a page, LISTING_PAGE_SIZE
+                if not given.
+        """
+        self.queryset = queryset
+        self.ordering = tuple(ordering or queryset.model._meta.ordering)
+        self.fields = tuple(field.lstrip("-") for field in self.ordering)
+        self.page_size = page_size or settings.LISTING_PAGE_SIZE
+
+    def _get_values(self, obj):
+        """Get values of ordering fields of an object."""
+        values = []
+        for field in self.fields:
+            value = obj
+            for attribute in field.split("__"):
+                value = getattr(value, attribute)
+            values.append(value)
+        return values
+
+    def _get_keyset_filter(self, values, forward):
+        """
+        Build condition matching rows after given values in listing order, or
+        before them if not going forward.
+        """
+        condition = Q()
+        for index in reversed(range(len(self.ordering))):
+            descending = self.ordering[index].startswith("-")
+            lookup = "lt" if descending == forward else "gt"
+            field = self.fields[index]
+            beyond = Q(**{f"{field}__{lookup}": values[index]})
+            if index == len(self.ordering) - 1:
+                condition = beyond
+            else:
+                condition = beyond | (Q(**{field: values[index]}) & condition)
+        return condition
+
+    def get_page(self, cursor=None):
+        """
+        Get page a cursor points to, or first page if there is no cursor or
+        it is invalid.
+
+        Args:
+            cursor (str): Cursor from 'previous_cursor' or 'next_cursor' of
+                another page of this listing.
+
+        Returns:
+            KeysetPage: Requested page.
+        """
+        decoded = decode_cursor(cursor) if cursor else None
+        if decoded and len(decoded[1]) != len(self.fields):
+            decoded = None
+        queryset = self.queryset
+        forward = True
+        if decoded:
+            direction, values = decoded
+            forward = direction == NEXT
+            queryset = queryset.filter(self._get_keyset_filter(values, forward))
+        ordering = self.ordering
+        if not forward:
+            ordering = tuple(
+                field[1:] if field.startswith("-") else f"-{field}"
+                for field in ordering
+            )
+        objects = list(queryset.order_by(*ordering)[:self.page_size + 1])
+        has_more = len(objects) > self.page_size
+        objects = objects[:self.page_size]
+        if not forward:
+            objects.reverse()
+        has_next = has_more if forward else bool(decoded)
+        has_previous = bool(decoded) if forward else has_more
+        return KeysetPage(
+            objects,
+            objects and has_previous
+            and encode_cursor(self._get_values(objects[0]), PREVIOUS) or None,
+            objects and has_next
+            and encode_cursor(self._get_values(objects[-1]), NEXT) or None,
+        )
@@ -1,5 +1,6 @@
 """Django settings for gameboost project."""
 
+from importlib.util import find_spec
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -24,13 +25,22 @@ INSTALLED_APPS = [
     'accounts',
     'orders',
     'games',
+    'analytics',
+    'search',
 ]
 
 REST_FRAMEWORK = {
+    # Compact renderers are chosen by Accept header or 'format' query
+    # parameter, MessagePack only when optional package msgpack is installed.
     'DEFAULT_RENDERER_CLASSES': [
         'rest_framework.renderers.JSONRenderer',
+        'orders.api.renderers.PackedJSONRenderer',
+        *(
+            ['orders.api.renderers.MessagePackRenderer']
+            if find_spec('msgpack') else []
+        ),
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'orders.api.pagination.KeysetCursorPagination',
     'PAGE_SIZE': 10,
     'DEFAULT_VERSIONING_CLASS': 'rest_framework.versioning.NamespaceVersioning',
     'DEFAULT_PERMISSION_CLASSES': [
@@ -47,7 +57,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    "accounts.middleware.ProfileClicksMiddleWare",
+    "accounts.middleware.RouteHooksMiddleware",
 ]
 
 CORS_ORIGIN_ALLOW_ALL = True
@@ -123,3 +133,67 @@ STATICFILES_DIRS = [
 
 MEDIA_ROOT = BASE_DIR / 'static/images'
 MEDIA_URL = '/images/'
+
+# Maximum number of IDs which can be requested in a single batch API call.
+RATING_BATCH_MAX_IDS = 100
+
+# Maximum number of reviews which can be written in a single bulk request.
+REVIEW_BULK_MAX_REVIEWS = 100
+
+# Sellers are ranked by their rating pulled towards a prior rating as if they
+# had received PRIOR_WEIGHT reviews of PRIOR_RATING, so few reviews can not
+# outrank many reviews of a slightly lower rating.
+SELLER_RANKING_PRIOR_RATING = 4.0
+SELLER_RANKING_PRIOR_WEIGHT = 10
+
+# Clicks of Sellers and Games are buffered in memory and written to database
+# at most every FLUSH_INTERVAL seconds, or earlier once more than MAX_PENDING
+# objects have unwritten clicks. Interval of 0 writes every click immediately.
+# Clicks buffered by a process killed without exiting, such as by SIGKILL or
+# the OOM killer, are lost, so these bound how many clicks can be lost.
+CLICK_BUFFER_FLUSH_INTERVAL = 10
+CLICK_BUFFER_MAX_PENDING = 1000
+
+# Hourly clicks are rolled up into daily clicks and daily clicks into monthly
+# clicks by command 'rollup_clicks', after which they are kept only for these
+# many days. Monthly clicks are kept forever.
+CLICK_HOURLY_RETENTION_DAYS = 30
+CLICK_DAILY_RETENTION_DAYS = 400
+
+# Cache holding versions of API collections, it has to be shared by all
+# processes in production, such as Memcached or Redis.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# Cache alias holding responses of read only API endpoints and seconds they
+# are kept for. They are invalidated by versions above long before, so it
+# only bounds how long unreachable responses take space.
+API_RESPONSE_CACHE = 'default'
+API_RESPONSE_CACHE_TIMEOUT = 3600
+
+# Number of last distinct buyers kept for every Seller.
+SELLER_RECENT_BUYERS_LIMIT = 3
+
+# Search backend used for searching Games and Sellers, it is chosen from the
+# database vendor when not set, e.g. 'search.backends.SQLiteSearchBackend'.
+SEARCH_BACKEND = None
+SEARCH_PAGE_SIZE = 20
+
+# Number of objects on a page of keyset paginated HTML listings.
+LISTING_PAGE_SIZE = 20
+
+# Seconds a request waits for an in-memory index which was never built yet,
+# see 'gameboost.indexes'.
+INDEX_BUILD_TIMEOUT = 10
+
+# Maximum number of type-ahead suggestions, and seconds after which in-memory
+# index serving them is rebuilt from database.
+AUTOCOMPLETE_LIMIT = 10
+AUTOCOMPLETE_REFRESH_INTERVAL = 300
+
+# Seconds after which in-memory category facets of Games are rebuilt from
+# database.
+FACET_REFRESH_INTERVAL = 300
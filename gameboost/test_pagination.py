@@ -0,0 +1,68 @@
+import datetime
+
+from django.test import RequestFactory, TestCase
+from games.models import Game
+
+from gameboost.pagination import (NEXT, KeysetPaginator, decode_cursor,
+                                  encode_cursor, get_page_urls)
+
+
+class KeysetPaginatorTestCase(TestCase):
+    """
+    Check that keyset pages of a listing cover every row exactly once in
+    listing order, walking both forward and backward.
+    """
+
+    def setUp(self):
+        self.games = [
+            Game.objects.create(name=f"Game {index}", image="game.png")
+            for index in range(5)
+        ]
+        for game, rating in zip(self.games, (3, 5, 4, 5, 3)):
+            Game.objects.filter(id=game.id).update(rating=rating)
+        self.listed_ids = [
+            self.games[3].id, self.games[1].id, self.games[2].id,
+            self.games[4].id, self.games[0].id,
+        ]
+        self.paginator = KeysetPaginator(Game.objects.all(), page_size=2)
+
+    def get_ids(self, page):
+        """Get IDs of Games on a page."""
+        return [game.id for game in page.object_list]
+
+    def test_pages_forward_and_backward(self):
+        pages = [self.paginator.get_page()]
+        while pages[-1].next_cursor:
+            pages.append(self.paginator.get_page(pages[-1].next_cursor))
+        self.assertEqual(
+            [game_id for page in pages for game_id in self.get_ids(page)],
+            self.listed_ids,
+        )
+        self.assertEqual(len(pages), 3)
+        self.assertIsNone(pages[0].previous_cursor)
+        previous_page = self.paginator.get_page(pages[2].previous_cursor)
+        self.assertEqual(self.get_ids(previous_page), self.listed_ids[2:4])
+        first_page = self.paginator.get_page(previous_page.previous_cursor)
+        self.assertEqual(self.get_ids(first_page), self.listed_ids[:2])
+        self.assertIsNone(first_page.previous_cursor)
+
+    def test_invalid_cursor_gives_first_page(self):
+        for cursor in ("invalid", encode_cursor([5], NEXT), "W10="):
+            with self.subTest(cursor=cursor):
+                page = self.paginator.get_page(cursor)
+                self.assertEqual(self.get_ids(page), self.listed_ids[:2])
+
+    def test_cursor_keeps_microseconds(self):
+        moment = datetime.datetime(2026, 1, 2, 3, 4, 5, 678901)
+        self.assertEqual(
+            decode_cursor(encode_cursor([moment, 1], NEXT)),
+            (NEXT, ["2026-01-02T03:04:05.678901", 1]),
+        )
+
+    def test_page_urls_keep_other_query_parameters(self):
+        request = RequestFactory().get("/games/", {"category": 1})
+        urls = get_page_urls(request, self.paginator.get_page())
+        self.assertIsNone(urls["previous_page_url"])
+        self.assertTrue(urls["next_page_url"].startswith("/games/?"))
+        self.assertIn("category=1", urls["next_page_url"])
+        self.assertIn("cursor=", urls["next_page_url"])
@@ -11,6 +11,7 @@ urlpatterns = [
     path('accounts/', include('django.contrib.auth.urls')),
     path('orders/', include('orders.urls')),
     path('games/', include('games.urls')),
+    path('search/', include('search.urls')),
     path('api/', include('orders.api.urls', namespace="api")),
 ]
 
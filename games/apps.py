@@ -7,3 +7,11 @@ class GamesConfig(AppConfig):
     """To configure App "Game" """
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'games'
+
+    def ready(self):
+        """
+        Connect receivers of signals and register route hooks once all
+        models are loaded.
+        """
+        # pylint: disable=import-outside-toplevel, unused-import
+        from games import hooks, signals
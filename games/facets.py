@@ -0,0 +1,219 @@
+"""
+This module contains in-memory category facet index of Games, used to filter
+Games by their categories and to count Games of every category without a
+grouped query on each request.
+
+Games of every Category are kept as a bitset, a Python int whose bit N is
+set when Game with ID N belongs to it, so counting Games of a category among
+a set of Games is a single AND followed by a bit count. Index is built in
+background once the process starts serving requests, updated from signals of
+this process and rebuilt in background every FACET_REFRESH_INTERVAL seconds
+to pick up changes made by other processes, see 'gameboost.indexes'.
+"""
+
+# pylint: disable=no-member
+
+from django.db.models import Count
+from gameboost.indexes import RefreshedIndex
+
+from games.models import Category, Game
+
+MATCH_ANY = "any"
+MATCH_ALL = "all"
+
+# Maximum number of selections whose counts are cached at once.
+FACET_COUNTS_CACHE_SIZE = 256
+
+
+def count_bits(bits):
+    """Get number of set bits of a bitset."""
+    return bin(bits).count("1")
+
+
+def get_category_filter(query_params):
+    """
+    Get categories selected in "category" query parameters and whether Games
+    have to belong to "all" of them or to "any" of them, which is the default.
+
+    Args:
+        query_params (QueryDict): Query parameters of request.
+
+    Returns:
+        (tuple): List of selected Category IDs and match mode.
+    """
+    category_ids = []
+    for value in query_params.getlist("category"):
+        try:
+            category_ids.append(int(value))
+        except ValueError:
+            continue
+    match = query_params.get("match")
+    return category_ids, match if match in (MATCH_ANY, MATCH_ALL) else MATCH_ANY
+
+
+def filter_games_by_categories(queryset, category_ids, match=MATCH_ANY):
+    """
+    Filter Games belonging to any or all of given categories.
+
+    Args:
+        queryset (QuerySet): Games to be filtered.
+        category_ids (list): IDs of selected categories, nothing is filtered
+            if it is empty.
+        match (str): Either MATCH_ANY or MATCH_ALL.
+
+    Returns:
+        (QuerySet): Filtered Games.
+    """
+    if not category_ids:
+        return queryset
+    if match == MATCH_ALL:
+        return (
+            queryset
+            .filter(categories__in=category_ids)
+            .annotate(selected_categories=Count("categories", distinct=True))
+            .filter(selected_categories=len(set(category_ids)))
+        )
+    return queryset.filter(
+        id__in=Game.categories.through.objects
+        .filter(category_id__in=category_ids)
+        .values("game_id")
+    )
+
+
+class CategoryFacetIndex(RefreshedIndex):
+    """
+    Bitsets of Games of every Category, all its methods are thread safe.
+
+    Counts of Games of every Category are cached per generation of index,
+    for every set of categories selected with MATCH_ALL and once for
+    MATCH_ANY, which does not depend on selected ones.
+    """
+
+    refresh_interval_setting = "FACET_REFRESH_INTERVAL"
+
+    def __init__(self):
+        super().__init__()
+        self._names = {}
+        self._games = {}
+        self._counts = {}
+        self._counts_generation = None
+
+    def load(self):
+        """Get names and Games of every Category from database."""
+        names = dict(Category.objects.values_list("id", "name"))
+        games = dict.fromkeys(names, 0)
+        for game_id, category_id in (
+            Game.categories.through.objects.values_list("game_id", "category_id")
+        ):
+            games[category_id] = games.get(category_id, 0) | (1 << game_id)
+        return names, games
+
+    def replace(self, state):
+        """Replace names and Games of every Category."""
+        self._names, self._games = state
+
+    def _set_category(self, category_id, name):
+        """Set name of a Category, lock has to be held by caller."""
+        self._names[category_id] = name
+        self._games.setdefault(category_id, 0)
+
+    def set_category(self, category_id, name):
+        """Add a Category, or rename an existing one, if index is built."""
+        self._update(self._set_category, category_id, name)
+
+    def _remove_category(self, category_id):
+        """Remove a Category, lock has to be held by caller."""
+        self._names.pop(category_id, None)
+        self._games.pop(category_id, None)
+
+    def remove_category(self, category_id):
+        """Remove a Category if index is built."""
+        self._update(self._remove_category, category_id)
+
+    def _add_games(self, category_id, bits):
+        """Add bits of Games to a Category, lock has to be held by caller."""
+        if category_id in self._games:
+            self._games[category_id] |= bits
+
+    def add_games(self, category_id, game_ids):
+        """Add Games to a Category if index is built."""
+        bits = sum(1 << game_id for game_id in set(game_ids))
+        self._update(self._add_games, category_id, bits)
+
+    def _remove_games(self, mask, category_ids):
+        """Clear bits of Games not in mask, lock has to be held by caller."""
+        for category_id in self._games:
+            if category_ids is None or category_id in category_ids:
+                self._games[category_id] &= mask
+
+    def remove_games(self, game_ids, category_ids=None):
+        """
+        Remove Games from given categories, or from all of them if no
+        category is given, if index is built.
+        """
+        mask = ~sum(1 << game_id for game_id in set(game_ids))
+        self._update(self._remove_games, mask, category_ids)
+
+    def _get_counts(self, selected, match):
+        """
+        Get ID, name and count of Games of every Category ordered by name,
+        from cache of current generation if they were already counted, lock
+        has to be held by caller.
+        """
+        if self._counts_generation != self.generation:
+            self._counts = {}
+            self._counts_generation = self.generation
+        key = frozenset(selected) if match == MATCH_ALL else None
+        counts = self._counts.get(key)
+        if counts is None:
+            if len(self._counts) >= FACET_COUNTS_CACHE_SIZE:
+                self._counts.clear()
+            listed = -1
+            if match == MATCH_ALL:
+                for category_id in selected:
+                    listed &= self._games.get(category_id, 0)
+            counts = self._counts[key] = [
+                (
+                    category_id,
+                    name,
+                    count_bits(self._games[category_id] & listed),
+                )
+                for category_id, name in sorted(
+                    self._names.items(), key=lambda item: item[1]
+                )
+            ]
+        return counts
+
+    def get_facets(self, category_ids=(), match=MATCH_ANY):
+        """
+        Get every Category along with number of Games it would list.
+
+        With MATCH_ALL, it is number of Games belonging to the category and
+        to all selected ones, so selecting it would narrow the listing down
+        to that number. With MATCH_ANY, it is number of Games belonging to
+        the category.
+
+        Args:
+            category_ids (list): IDs of selected categories.
+            match (str): Either MATCH_ANY or MATCH_ALL.
+
+        Returns:
+            (list): Dicts holding ID, name, count of Games and whether
+                Category is selected, for every Category ordered by name.
+        """
+        self.ensure_fresh()
+        selected = set(category_ids)
+        with self._lock:
+            counts = self._get_counts(selected, match)
+        return [
+            {
+                "id": category_id,
+                "name": name,
+                "count": count,
+                "selected": category_id in selected,
+            }
+            for category_id, name, count in counts
+        ]
+
+
+category_facets = CategoryFacetIndex()
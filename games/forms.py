@@ -12,5 +12,8 @@ class AddGameForm(forms.ModelForm):
     class Meta:
         """Changing default Model behaviour"""
         model = SellerGame
-        fields = "__all__"
+        exclude = [
+            "rating", "rating_sum", "rating_count", *SellerGame.HISTOGRAM_FIELDS,
+            "rating_version", "rating_updated_at",
+        ]
         widgets = {'seller': HiddenInput()}
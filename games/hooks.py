@@ -0,0 +1,17 @@
+"""This module registers route hooks for URLs of Games app"""
+
+# pylint: disable=unused-argument
+from accounts.route_hooks import register_route_hook
+from analytics.clicks import record_click
+
+from games.models import Game
+
+
+@register_route_hook("games:show_sellers_for_current_game")
+def record_game_click(request, game_pk, **kwargs):
+    """
+    Whenever a Buyer chooses a Game to see its sellers, a click of Game is
+    recorded which increments its clicks by 1 on next flush.
+    """
+    if request.method == "GET" and not request.user.is_superuser:
+        record_click(Game, game_pk)
@@ -0,0 +1,23 @@
+# Generated by Django 3.2.25 on 2026-10-18 15:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0020_auto_20211115_0148'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='game',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Number of reviews'),
+        ),
+        migrations.AddField(
+            model_name='game',
+            name='rating_sum',
+            field=models.FloatField(default=0, verbose_name='Sum of review ratings'),
+        ),
+    ]
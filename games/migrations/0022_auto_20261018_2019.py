@@ -0,0 +1,32 @@
+# Generated by Django 3.2.25 on 2026-10-18 15:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0021_auto_20261018_2018'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sellergame',
+            name='rating',
+            field=models.FloatField(default=5, verbose_name='Rating'),
+        ),
+        migrations.AddField(
+            model_name='sellergame',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Number of reviews'),
+        ),
+        migrations.AddField(
+            model_name='sellergame',
+            name='rating_sum',
+            field=models.FloatField(default=0, verbose_name='Sum of review ratings'),
+        ),
+        migrations.AddIndex(
+            model_name='sellergame',
+            index=models.Index(fields=['seller', 'game'], name='seller_game_pair_idx'),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 3.2.25 on 2026-10-18 15:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0022_auto_20261018_2019'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='game',
+            name='five_star_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='5 star reviews'),
+        ),
+        migrations.AddField(
+            model_name='game',
+            name='four_star_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='4 star reviews'),
+        ),
+        migrations.AddField(
+            model_name='game',
+            name='one_star_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='1 star reviews'),
+        ),
+        migrations.AddField(
+            model_name='game',
+            name='three_star_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='3 star reviews'),
+        ),
+        migrations.AddField(
+            model_name='game',
+            name='two_star_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='2 star reviews'),
+        ),
+        migrations.AddField(
+            model_name='sellergame',
+            name='five_star_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='5 star reviews'),
+        ),
+        migrations.AddField(
+            model_name='sellergame',
+            name='four_star_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='4 star reviews'),
+        ),
+        migrations.AddField(
+            model_name='sellergame',
+            name='one_star_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='1 star reviews'),
+        ),
+        migrations.AddField(
+            model_name='sellergame',
+            name='three_star_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='3 star reviews'),
+        ),
+        migrations.AddField(
+            model_name='sellergame',
+            name='two_star_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='2 star reviews'),
+        ),
+    ]
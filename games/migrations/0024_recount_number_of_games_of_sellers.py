@@ -0,0 +1,36 @@
+# Generated by Django 3.2.25 on 2026-10-18 17:30
+
+from django.db import migrations
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def recount_number_of_games_of_sellers(apps, schema_editor):
+    """Set count of games of every Seller from his SellerGames."""
+    number_of_games = (
+        apps.get_model("games", "SellerGame").objects
+        .filter(seller=OuterRef("pk"))
+        .order_by()
+        .values("seller")
+        .annotate(number_of_games=Count("id"))
+        .values("number_of_games")
+    )
+    apps.get_model("accounts", "Seller").objects.update(
+        providing_services_to_number_of_games=Coalesce(
+            Subquery(number_of_games, output_field=IntegerField()), 0
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0031_auto_20261018_2022'),
+        ('games', '0023_auto_20261018_2021'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            recount_number_of_games_of_sellers, migrations.RunPython.noop
+        ),
+    ]
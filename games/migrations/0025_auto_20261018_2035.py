@@ -0,0 +1,25 @@
+# Generated by Django 3.2.25 on 2026-10-18 15:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0024_recount_number_of_games_of_sellers'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='game',
+            options={'ordering': ['-rating', '-id']},
+        ),
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(fields=['-rating', '-id'], name='game_rating_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sellergame',
+            index=models.Index(fields=['game', '-rating', '-id'], name='game_seller_rating_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-18 15:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0025_auto_20261018_2035'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='sellergame',
+            index=models.Index(fields=['seller', '-rating', '-id'], name='seller_game_rating_idx'),
+        ),
+    ]
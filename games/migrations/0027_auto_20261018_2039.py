@@ -0,0 +1,34 @@
+# Generated by Django 3.2.25 on 2026-10-18 15:39
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0026_sellergame_seller_game_rating_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='game',
+            name='rating_updated_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, verbose_name='Time of last rating change'),
+        ),
+        migrations.AddField(
+            model_name='game',
+            name='rating_version',
+            field=models.PositiveBigIntegerField(default=0, verbose_name='Version of rating'),
+        ),
+        migrations.AddField(
+            model_name='sellergame',
+            name='rating_updated_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, verbose_name='Time of last rating change'),
+        ),
+        migrations.AddField(
+            model_name='sellergame',
+            name='rating_version',
+            field=models.PositiveBigIntegerField(default=0, verbose_name='Version of rating'),
+        ),
+    ]
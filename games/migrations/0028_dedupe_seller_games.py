@@ -0,0 +1,49 @@
+# Generated by Django 3.2.25 on 2026-10-18 16:03
+
+from collections import Counter
+
+from django.db import migrations
+from django.db.models import Count, F, Min
+
+
+def dedupe_seller_games(apps, schema_editor):
+    """
+    Keep only the oldest SellerGame of every Seller and Game pair, and take
+    deleted ones back from count of games of their Sellers. Ratings of the
+    kept one already count every review of the pair, as rating changes are
+    applied to all rows of a pair.
+    """
+    SellerGame = apps.get_model("games", "SellerGame")
+    Seller = apps.get_model("accounts", "Seller")
+    duplicated = (
+        SellerGame.objects
+        .values("seller_id", "game_id")
+        .annotate(seller_games=Count("id"), oldest_id=Min("id"))
+        .filter(seller_games__gt=1)
+        .order_by()
+    )
+    removed_games = Counter()
+    for duplicate in duplicated:
+        stale_seller_games = SellerGame.objects.filter(
+            seller_id=duplicate["seller_id"], game_id=duplicate["game_id"]
+        ).exclude(id=duplicate["oldest_id"])
+        removed_games[duplicate["seller_id"]] += stale_seller_games.count()
+        stale_seller_games.delete()
+    for seller_id, number_of_games in removed_games.items():
+        Seller.objects.filter(id=seller_id).update(
+            providing_services_to_number_of_games=(
+                F("providing_services_to_number_of_games") - number_of_games
+            )
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0033_auto_20261018_2039'),
+        ('games', '0027_auto_20261018_2039'),
+    ]
+
+    operations = [
+        migrations.RunPython(dedupe_seller_games, migrations.RunPython.noop),
+    ]
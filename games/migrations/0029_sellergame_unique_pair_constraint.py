@@ -0,0 +1,21 @@
+# Generated by Django 3.2.25 on 2026-10-18 16:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0028_dedupe_seller_games'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='sellergame',
+            name='seller_game_pair_idx',
+        ),
+        migrations.AddConstraint(
+            model_name='sellergame',
+            constraint=models.UniqueConstraint(fields=('seller', 'game'), name='unique_seller_game'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 3.2.25 on 2026-10-18 16:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0029_sellergame_unique_pair_constraint'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(fields=['rating_updated_at', 'id'], name='game_rating_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sellergame',
+            index=models.Index(fields=['rating_updated_at', 'id'], name='seller_game_updated_idx'),
+        ),
+    ]
@@ -5,9 +5,17 @@ relation with Game.
 
 # pylint: disable=no-member, invalid-str-returned
 
-from accounts.models import FIVE_STAR, Seller
-from django.db import models
+from accounts.models import RatingAggregate, Seller
+from django.db import models, transaction
+from django.db.models import Count, F, OuterRef, Subquery
 from django.db.models.fields.related import ForeignKey
+from django.db.models.functions import Coalesce
+from django.dispatch import Signal
+
+# Sent with 'seller_games' holding SellerGames of all pairs given to
+# 'SellerGame.objects.bulk_create', which sends no post_save signals, so that
+# receivers can do what they do for every saved SellerGame.
+seller_games_bulk_created = Signal()
 
 
 class Category(models.Model):
@@ -21,7 +29,7 @@ class Category(models.Model):
         return self.name
 
 
-class Game(models.Model):
+class Game(RatingAggregate):
     """
     This model will handle all the listed games and will retain information of
     each game such as name and image of a given game.
@@ -30,20 +38,108 @@ class Game(models.Model):
     name = models.CharField("Name of game", max_length=100)
     description = models.TextField("Description of Game", blank=True, default="")
     categories = models.ManyToManyField(Category, related_name="games")
-    rating = models.FloatField("Rating", default=FIVE_STAR)
     clicks = models.PositiveIntegerField("Number of clicks recieved", default=0)
 
     class Meta:
-        ordering = ["-rating"]
+        ordering = ["-rating", "-id"]
+        indexes = [
+            models.Index(fields=["-rating", "-id"], name="game_rating_idx"),
+            models.Index(
+                fields=["rating_updated_at", "id"],
+                name="game_rating_updated_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
 
-class SellerGame(models.Model):
+def change_number_of_games_of_sellers(games_per_seller):
+    """
+    Atomically add given number of games to count of games of every Seller.
+
+    Args:
+        games_per_seller (Counter): Seller ID mapped to number of games
+            added, negative if games were removed.
+    """
+    for seller_id, number_of_games in games_per_seller.items():
+        if number_of_games:
+            Seller.objects.filter(id=seller_id).update(
+                providing_services_to_number_of_games=(
+                    F("providing_services_to_number_of_games") + number_of_games
+                )
+            )
+
+
+class SellerGameQuerySet(models.QuerySet):
+    """
+    Custom QuerySet defined for SellerGame to keep count of games of Sellers
+    up to date on bulk creation, which sends no signals.
+    """
+
+    def _recount_games_of_sellers(self, seller_ids):
+        """Set count of games of given Sellers to their number of games."""
+        Seller.objects.filter(id__in=seller_ids).update(
+            providing_services_to_number_of_games=Coalesce(
+                Subquery(
+                    self.model.objects
+                    .filter(seller=OuterRef("pk"))
+                    .order_by()
+                    .values("seller")
+                    .annotate(number_of_games=Count("id"))
+                    .values("number_of_games")
+                ),
+                0,
+            )
+        )
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """
+        Create all given SellerGames, recount games of their Sellers and send
+        'seller_games_bulk_created' for all given pairs.
+
+        Sellers are locked before SellerGames are inserted and recounted, so
+        pairs skipped by 'ignore_conflicts' are not counted, and a SellerGame
+        saved meanwhile is either recounted or counted after the recount.
+        """
+        objs = list(objs)
+        seller_ids = sorted({seller_game.seller_id for seller_game in objs})
+        with transaction.atomic():
+            list(
+                Seller.objects
+                .select_for_update()
+                .filter(id__in=seller_ids)
+                .order_by("id")
+                .values_list("id", flat=True)
+            )
+            created = super().bulk_create(objs, *args, **kwargs)
+            self._recount_games_of_sellers(seller_ids)
+            pairs = {
+                (seller_game.seller_id, seller_game.game_id)
+                for seller_game in objs
+            }
+            seller_games = [
+                seller_game
+                for seller_game in (
+                    self.model.objects
+                    .filter(
+                        seller_id__in=seller_ids,
+                        game_id__in={game_id for _, game_id in pairs},
+                    )
+                    .only("id", "seller_id", "game_id")
+                )
+                if (seller_game.seller_id, seller_game.game_id) in pairs
+            ]
+            seller_games_bulk_created.send(
+                sender=self.model, seller_games=seller_games
+            )
+        return created
+
+
+class SellerGame(RatingAggregate):
     """
     It will hold relation information between Seller model and Game model for
-    which he offer service.
+    which he offer service, along with rating of Seller for this Game only.
     """
     game = ForeignKey(
         Game, related_name="seller_games", on_delete=models.CASCADE
@@ -57,5 +153,26 @@ class SellerGame(models.Model):
         "Seller description of Game", blank=True, null=True
     )
 
+    objects = SellerGameQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["seller", "game"], name="unique_seller_game"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["game", "-rating", "-id"], name="game_seller_rating_idx"
+            ),
+            models.Index(
+                fields=["seller", "-rating", "-id"], name="seller_game_rating_idx"
+            ),
+            models.Index(
+                fields=["rating_updated_at", "id"],
+                name="seller_game_updated_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.id}"
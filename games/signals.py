@@ -1,17 +1,137 @@
-"""This module will define custom signals and catches it"""
+"""This module catches signals sent for models of app Games"""
 
-# pylint: disable=unused-argument
-from django.dispatch import Signal, receiver
+# pylint: disable=unused-argument, no-member
+from collections import Counter
 
-game_clicked_signal = Signal()
+from django.core.signals import request_started
+from django.db import transaction
+from django.db.models.signals import (m2m_changed, post_delete, post_save,
+                                      pre_save)
+from django.dispatch import receiver
 
+from games.facets import category_facets
+from games.models import (Category, Game, SellerGame,
+                          change_number_of_games_of_sellers)
 
-@receiver(game_clicked_signal)
-def increment_number_of_clicks_of_game(game_object, *args, **kwargs):
+
+@receiver(pre_save, sender=SellerGame)
+def remember_saved_seller_of_seller_game(instance, *args, **kwargs):
+    """
+    Before an existing SellerGame is saved, remember Seller it currently
+    belongs to in database, in case it is being moved to another Seller.
+    """
+    instance._saved_seller_id = None
+    if not instance._state.adding and instance.pk is not None:
+        instance._saved_seller_id = (
+            SellerGame.objects
+            .filter(id=instance.pk)
+            .values_list("seller_id", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=SellerGame)
+def add_saved_seller_game_to_number_of_games(instance, created, *args, **kwargs):
+    """
+    Everytime a Seller starts offering service for a Game, his count of games
+    is incremented, and if a SellerGame is moved from one Seller to another
+    the count is moved along.
+    """
+    games_per_seller = Counter()
+    if created:
+        games_per_seller[instance.seller_id] += 1
+    elif instance._saved_seller_id not in (None, instance.seller_id):
+        games_per_seller[instance._saved_seller_id] -= 1
+        games_per_seller[instance.seller_id] += 1
+    change_number_of_games_of_sellers(games_per_seller)
+
+
+@receiver(post_delete, sender=SellerGame)
+def remove_deleted_seller_game_from_number_of_games(instance, *args, **kwargs):
+    """
+    Everytime a SellerGame is deleted, either directly, in bulk or along with
+    its Game or Seller, count of games of its Seller is decremented.
+    """
+    change_number_of_games_of_sellers(Counter({instance.seller_id: -1}))
+
+
+@receiver(post_save, sender=Category)
+def add_saved_category_to_facets(instance, *args, **kwargs):
+    """
+    Everytime a Category is saved, it is added to category facets or renamed
+    there once transaction is committed.
+    """
+    transaction.on_commit(
+        lambda: category_facets.set_category(instance.id, instance.name)
+    )
+
+
+@receiver(post_delete, sender=Category)
+def remove_deleted_category_from_facets(instance, *args, **kwargs):
+    """
+    Everytime a Category is deleted, it is removed from category facets once
+    transaction is committed.
+    """
+    category_id = instance.id
+    transaction.on_commit(lambda: category_facets.remove_category(category_id))
+
+
+@receiver(post_delete, sender=Game)
+def remove_deleted_game_from_facets(instance, *args, **kwargs):
+    """
+    Everytime a Game is deleted, it is removed from all category facets once
+    transaction is committed.
+    """
+    game_id = instance.id
+    transaction.on_commit(lambda: category_facets.remove_games([game_id]))
+
+
+@receiver(m2m_changed, sender=Game.categories.through)
+def update_facets_of_changed_categories(
+    instance, action, reverse, pk_set, *args, **kwargs
+):
+    """
+    Everytime categories of a Game change, either from Game or from Category
+    side, category facets are updated once transaction is committed.
+    """
+    if action == "pre_clear":
+        if reverse:
+            instance._cleared_facet_pairs = [
+                (instance.id, game_id)
+                for game_id in instance.games.values_list("id", flat=True)
+            ]
+        else:
+            instance._cleared_facet_pairs = [
+                (category_id, instance.id)
+                for category_id in instance.categories.values_list(
+                    "id", flat=True
+                )
+            ]
+        return
+    if action == "post_clear":
+        pairs = getattr(instance, "_cleared_facet_pairs", [])
+    elif action in ("post_add", "post_remove"):
+        if reverse:
+            pairs = [(instance.id, game_id) for game_id in pk_set]
+        else:
+            pairs = [(category_id, instance.id) for category_id in pk_set]
+    else:
+        return
+
+    def apply_pairs():
+        for category_id, game_id in pairs:
+            if action == "post_add":
+                category_facets.add_games(category_id, [game_id])
+            else:
+                category_facets.remove_games([game_id], {category_id})
+
+    transaction.on_commit(apply_pairs)
+
+
+@receiver(request_started)
+def warm_category_facets(*args, **kwargs):
     """
-    Everytime a Buyer chooses a Game or clicks on it, a signal will be
-    generated and recieve by this method and in reponse, it will increment
-    total clicks the game has revieved it yet.
+    Once process starts serving requests, category facets start being built
+    in background, so they are ready before they are first needed.
     """
-    game_object.clicks += 1
-    game_object.save()
+    category_facets.warm()
@@ -0,0 +1,119 @@
+from unittest import mock
+
+from django.http import QueryDict
+from django.test import TestCase
+
+from games import facets
+from games.facets import (MATCH_ALL, MATCH_ANY, CategoryFacetIndex,
+                          category_facets, filter_games_by_categories,
+                          get_category_filter)
+from games.models import Category, Game
+
+
+class CategoryFacetTestCase(TestCase):
+    """
+    Check that category facets count Games of every Category like database
+    does, and stay up to date with signals, even during a rebuild.
+    """
+
+    def setUp(self):
+        self.games = [
+            Game.objects.create(name=f"Game {index}", image="game.png")
+            for index in range(3)
+        ]
+        self.action = Category.objects.create(name="Action")
+        self.racing = Category.objects.create(name="Racing")
+        self.action.games.add(*self.games[:2])
+        self.racing.games.add(*self.games[1:])
+        self.index = CategoryFacetIndex()
+        self.index.build()
+
+    def get_counts(self, index, category_ids=(), match=MATCH_ANY):
+        """Get count of Games of every Category by its name."""
+        return {
+            facet["name"]: facet["count"]
+            for facet in index.get_facets(category_ids, match)
+        }
+
+    def test_counts(self):
+        self.assertEqual(
+            self.get_counts(self.index), {"Action": 2, "Racing": 2}
+        )
+        self.assertEqual(
+            self.get_counts(self.index, [self.action.id], MATCH_ALL),
+            {"Action": 2, "Racing": 1},
+        )
+        facets_of_selection = self.index.get_facets([self.racing.id])
+        self.assertEqual(
+            [facet["selected"] for facet in facets_of_selection],
+            [False, True],
+        )
+
+    def test_filter_games_by_categories(self):
+        for category_ids, match, number_of_games in (
+            ([], MATCH_ALL, 3),
+            ([self.action.id], MATCH_ANY, 2),
+            ([self.action.id, self.racing.id], MATCH_ANY, 3),
+            ([self.action.id, self.racing.id], MATCH_ALL, 1),
+        ):
+            with self.subTest(category_ids=category_ids, match=match):
+                listed = filter_games_by_categories(
+                    Game.objects.all(), category_ids, match
+                )
+                self.assertEqual(listed.count(), number_of_games)
+
+    def test_get_category_filter(self):
+        self.assertEqual(
+            get_category_filter(QueryDict("category=1&category=x&match=all")),
+            ([1], MATCH_ALL),
+        )
+        self.assertEqual(
+            get_category_filter(QueryDict("match=none")), ([], MATCH_ANY)
+        )
+
+    def test_signals_update_facets(self):
+        category_facets.build()
+        with self.captureOnCommitCallbacks(execute=True):
+            puzzle = Category.objects.create(name="Puzzle")
+            puzzle.games.add(self.games[0])
+            self.action.games.remove(self.games[0])
+        self.assertEqual(
+            self.get_counts(category_facets),
+            {"Action": 1, "Puzzle": 1, "Racing": 2},
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.games[2].delete()
+            puzzle.delete()
+        self.assertEqual(
+            self.get_counts(category_facets), {"Action": 1, "Racing": 1}
+        )
+
+    def test_updates_during_rebuild_are_kept(self):
+        load = self.index.load
+
+        def load_before_update():
+            state = load()
+            self.index.add_games(self.action.id, [self.games[2].id])
+            self.index.set_category(self.racing.id, "Driving")
+            return state
+
+        with mock.patch.object(self.index, "load", load_before_update):
+            self.index.build()
+        self.assertEqual(
+            self.get_counts(self.index), {"Action": 3, "Driving": 2}
+        )
+
+    def test_counts_are_cached_until_index_changes(self):
+        with mock.patch.object(
+            facets, "count_bits", wraps=facets.count_bits
+        ) as count_bits:
+            self.index.get_facets()
+            self.index.get_facets([self.racing.id])
+            self.assertEqual(count_bits.call_count, 2)
+            self.index.get_facets([self.racing.id], MATCH_ALL)
+            self.assertEqual(count_bits.call_count, 4)
+            self.index.remove_games([self.games[0].id])
+            self.assertEqual(
+                self.get_counts(self.index), {"Action": 1, "Racing": 2}
+            )
+            self.assertEqual(count_bits.call_count, 6)
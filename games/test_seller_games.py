@@ -0,0 +1,107 @@
+from accounts.models import Buyer, Seller, User
+from django.test import TestCase
+from orders.models import Order, Review
+
+from games.models import Game, SellerGame
+
+
+class SellerGameCountTestCase(TestCase):
+    """
+    Check that count of games of every Seller follows his SellerGames, and
+    that SellerGames created in bulk get ratings of reviews of their pairs.
+    """
+
+    def setUp(self):
+        self.sellers = [
+            Seller.objects.create(
+                user=User.objects.create(
+                    email=f"seller{index}@example.com",
+                    user_name=f"seller{index}",
+                )
+            )
+            for index in range(2)
+        ]
+        self.games = [
+            Game.objects.create(name=f"Game {index}", image="game.png")
+            for index in range(3)
+        ]
+
+    def get_number_of_games(self, seller):
+        """Get count of games of Seller as saved in database."""
+        return Seller.objects.values_list(
+            "providing_services_to_number_of_games", flat=True
+        ).get(id=seller.id)
+
+    def assertCountsMatchSellerGames(self):
+        """Check count of games of every Seller against his SellerGames."""
+        for seller in self.sellers:
+            with self.subTest(seller=seller.id):
+                self.assertEqual(
+                    self.get_number_of_games(seller),
+                    SellerGame.objects.filter(seller=seller).count(),
+                )
+
+    def test_save_move_and_delete(self):
+        seller_game = SellerGame.objects.create(
+            seller=self.sellers[0], game=self.games[0]
+        )
+        SellerGame.objects.create(seller=self.sellers[0], game=self.games[1])
+        self.assertEqual(self.get_number_of_games(self.sellers[0]), 2)
+        seller_game.seller = self.sellers[1]
+        seller_game.save()
+        self.assertCountsMatchSellerGames()
+        self.assertEqual(self.get_number_of_games(self.sellers[1]), 1)
+        seller_game.delete()
+        self.assertCountsMatchSellerGames()
+        self.assertEqual(self.get_number_of_games(self.sellers[1]), 0)
+
+    def test_bulk_create(self):
+        SellerGame.objects.bulk_create([
+            SellerGame(seller=seller, game=game)
+            for seller in self.sellers
+            for game in self.games[:2]
+        ])
+        self.assertCountsMatchSellerGames()
+        self.assertEqual(self.get_number_of_games(self.sellers[0]), 2)
+
+    def test_bulk_create_ignoring_existing_pairs(self):
+        SellerGame.objects.create(seller=self.sellers[0], game=self.games[0])
+        SellerGame.objects.bulk_create(
+            [
+                SellerGame(seller=self.sellers[0], game=game)
+                for game in self.games
+            ],
+            ignore_conflicts=True,
+        )
+        self.assertCountsMatchSellerGames()
+        self.assertEqual(self.get_number_of_games(self.sellers[0]), 3)
+
+    def test_bulk_create_seeds_ratings_of_pairs(self):
+        seller, game = self.sellers[0], self.games[0]
+        SellerGame.objects.create(seller=seller, game=game)
+        order = Order.objects.create(
+            buyer=Buyer.objects.create(
+                user=User.objects.create(
+                    email="buyer@example.com", user_name="buyer"
+                )
+            ),
+            seller=seller,
+            game=game,
+            price=10,
+            number_of_days_for_completing_the_order=1,
+            status=Order.Status.COMPLETED,
+            gaming_account_id="account",
+            gaming_account_password="password",
+        )
+        Review.objects.create(order=order, rating=2)
+        SellerGame.objects.filter(seller=seller, game=game).delete()
+        SellerGame.objects.bulk_create([
+            SellerGame(seller=seller, game=game),
+            SellerGame(seller=seller, game=self.games[1]),
+        ])
+        seeded = SellerGame.objects.get(seller=seller, game=game)
+        self.assertEqual(seeded.rating_count, 1)
+        self.assertEqual(seeded.rating, 2)
+        self.assertEqual(seeded.rating_histogram[2], 1)
+        unreviewed = SellerGame.objects.get(seller=seller, game=self.games[1])
+        self.assertEqual(unreviewed.rating_count, 0)
@@ -6,8 +6,10 @@ from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
+from gameboost.pagination import KeysetPaginator, get_page_urls
 
-from games.signals import game_clicked_signal
+from games.facets import (category_facets, filter_games_by_categories,
+                          get_category_filter)
 
 from .forms import AddGameForm
 from .models import Game, SellerGame
@@ -17,30 +19,50 @@ from .models import Game, SellerGame
 def show_all_games(request):
     """
     If user is logged in then redirect him to Admin page else show him all
-    the Games currently available to buy.
+    the Games currently available to buy. Games can be filtered by selecting
+    "category" query parameters, and "match" decides if they have to belong
+    to "all" of them or to "any" of them. Sidebar shows number of Games of
+    every category, counted from in-memory category facets. Games are listed
+    in pages selected by "cursor" query parameter.
     """
     if request.user.is_superuser:
         return redirect('admin:login')
-    context = {"games": Game.objects.prefetch_related("categories")}
+    category_ids, match = get_category_filter(request.GET)
+    page = KeysetPaginator(
+        filter_games_by_categories(
+            Game.objects.prefetch_related("categories"), category_ids, match
+        )
+    ).get_page(request.GET.get("cursor"))
+    context = {
+        "games": page.object_list,
+        "facets": category_facets.get_facets(category_ids, match),
+        "match": match,
+        **get_page_urls(request, page),
+    }
     return render(request, 'all_games.html', context)
 
 
 def show_sellers_for_current_game(request, game_pk):
     """
-    After a buyer selects a game, A signal will be sent for the game he choosed
+    After a buyer selects a game, a click is recorded for it by a route hook
     and He will be shown a list of all those sellers who offers service for
-    this game.
+    this game, best rated first, in pages selected by "cursor" query
+    parameter.
     """
     if request.user.is_superuser:
         return redirect('admin:login')
     game = get_object_or_404(Game, id=game_pk)
-    game_clicked_signal.send(sender=None, game_object=game)
-    game_sellers = (
+    page = KeysetPaginator(
         SellerGame.objects
         .filter(game=game)
-        .select_related("seller")
-    )
-    context = {"game_sellers": game_sellers}
+        .select_related("game", "seller__user"),
+        ordering=("-rating", "-id"),
+    ).get_page(request.GET.get("cursor"))
+    context = {
+        "game": game,
+        "game_sellers": page.object_list,
+        **get_page_urls(request, page),
+    }
     return render(request, 'game_sellers.html', context)
 
 
@@ -3,7 +3,8 @@
 from django.contrib import admin
 
 # pylint: disable=relative-beyond-top-level
-from .models import Order, Review
+from .models import Order, Review, SellerOrderStats
 
 admin.site.register(Order)
 admin.site.register(Review)
+admin.site.register(SellerOrderStats)
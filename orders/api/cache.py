@@ -0,0 +1,102 @@
+"""
+This module caches whole responses of read only API endpoints, so a request
+repeating an earlier one is answered without querying the database or
+serializing anything.
+
+Cache keys contain versions of collections and objects a response was built
+from, which are bumped by every write of them, see 'orders.versions'. A
+write therefore only makes responses depending on it unreachable, they are
+never flushed and simply expire, while all other responses stay cached.
+"""
+
+import hashlib
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe, urlencode
+from orders.versions import get_collection_versions, get_object_collection
+
+CACHE_KEY_PREFIX = "api_response"
+
+
+def _get_cache_key(request, collections):
+    """
+    Get key of cached response to request, built from collections at their
+    current versions.
+
+    Requests differing in path, query parameters, API version namespace or
+    accepted media types get different keys.
+    """
+    resolver_match = getattr(request, "resolver_match", None)
+    request_key = "\n".join((
+        request.path,
+        urlencode(sorted(request.GET.lists()), doseq=True),
+        (resolver_match and resolver_match.namespace) or "",
+        request.META.get("HTTP_ACCEPT", ""),
+    ))
+    versions = ".".join(map(str, get_collection_versions(collections)))
+    digest = hashlib.md5(request_key.encode()).hexdigest()
+    return f"{CACHE_KEY_PREFIX}:{digest}:{versions}"
+
+
+def _get_cached_response(request, response):
+    """
+    Answer request with a cached response, or with 304 if client already
+    has it as identified by its ETag and Last-Modified headers.
+    """
+    return get_conditional_response(
+        request,
+        etag=response.get("ETag"),
+        last_modified=parse_http_date_safe(response.get("Last-Modified", "")),
+        response=response,
+    ) or response
+
+
+def cache_api_response(*collections, object_kwargs=()):
+    """
+    Decorator for read only API views, which caches their successful GET
+    responses until anything they depend on changes.
+
+    It has to wrap the whole view, outside of 'api_view' for function views
+    and as decorator of 'dispatch' for class based views, so that cached
+    responses are already rendered.
+
+    Args:
+        collections (str): Names of collections response is built from,
+            constants of 'orders.versions'.
+        object_kwargs (tuple): Names of URL keyword arguments identifying a
+            single object response is built from, when given versions of that
+            object in given collections are used instead of versions of
+            whole collections.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapped_view(request, *args, **kwargs):
+            if request.method not in ("GET", "HEAD"):
+                return view(request, *args, **kwargs)
+            cache = caches[settings.API_RESPONSE_CACHE]
+            key = _get_cache_key(request, [
+                get_object_collection(
+                    collection, *(kwargs[name] for name in object_kwargs)
+                ) if object_kwargs else collection
+                for collection in collections
+            ])
+            response = cache.get(key)
+            if response is not None:
+                return _get_cached_response(request, response)
+
+            response = view(request, *args, **kwargs)
+            if request.method != "GET" or response.status_code != 200:
+                return response
+            timeout = settings.API_RESPONSE_CACHE_TIMEOUT
+            if callable(getattr(response, "render", None)):
+                response.add_post_render_callback(
+                    lambda rendered: cache.set(key, rendered, timeout)
+                )
+            else:
+                cache.set(key, response, timeout)
+            return response
+        return wrapped_view
+    return decorator
@@ -0,0 +1,115 @@
+"""
+This module answers conditional GET requests of API with 304 Not Modified
+before anything is serialized. Ratings are tagged with their version stamps
+and lists with version of collection they belong to, along with format of
+renderer a response is negotiated to, as every format is a different
+representation.
+"""
+
+from functools import wraps
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from orders.versions import get_collection_version
+from rest_framework.response import Response
+
+# pylint: disable=no-member
+
+
+def _get_renderer_format(request):
+    """Get format of renderer request was negotiated to, if it was."""
+    renderer = getattr(request, "accepted_renderer", None)
+    return getattr(renderer, "format", "")
+
+
+def get_rating_etag(request, model, obj):
+    """
+    Get strong ETag of rating of an object in format requested, which
+    changes with every change of its rating.
+
+    Args:
+        request (Request): Request for rating.
+        model (Model): Model of object, one keeping rating aggregates.
+        obj: Model instance or row having 'id' and 'rating_version'.
+
+    Returns:
+        (str): Quoted ETag.
+    """
+    return (
+        f'"{model._meta.model_name}-{obj.id}-{obj.rating_version}'
+        f'-{_get_renderer_format(request)}"'
+    )
+
+
+def get_conditional_rating_response(request, model, obj, get_response):
+    """
+    Answer request for rating of an object with 304 if client already has
+    its current version, otherwise with response built by 'get_response'.
+    Both carry ETag and Last-Modified of rating.
+
+    Args:
+        request (Request): Request for rating.
+        model (Model): Model of object, one keeping rating aggregates.
+        obj: Model instance or row having 'id', 'rating_version' and
+            'rating_updated_at'.
+        get_response (callable): Builds full response when it is needed.
+
+    Returns:
+        Response: Either 304 or full response.
+    """
+    etag = get_rating_etag(request, model, obj)
+    last_modified = int(obj.rating_updated_at.timestamp())
+    response = get_conditional_response(
+        request, etag=etag, last_modified=last_modified
+    )
+    if response is None:
+        response = get_response()
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    return response
+
+
+class ConditionalRatingMixin:
+    """
+    Mixin for RetrieveAPIView of ratings, answering with 304 when client
+    already has current version of requested rating.
+    """
+
+    def retrieve(self, request, *args, **kwargs):
+        """Get rating of requested object, unless client has it already."""
+        instance = self.get_object()
+        return get_conditional_rating_response(
+            request,
+            self.get_queryset().model,
+            instance,
+            lambda: Response(self.get_serializer(instance).data),
+        )
+
+
+def conditional_on_collection(collection):
+    """
+    Decorator for list views, which answers with 304 when client already has
+    the list at current version of collection, without calling the view.
+    Version is read before the view runs, so a change committed meanwhile
+    can only make the next request miss, never serve stale data.
+
+    Args:
+        collection (str): Name of collection listed by view, one of
+            constants of 'orders.versions'.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapped_view(request, *args, **kwargs):
+            etag = (
+                f'"{collection}-{get_collection_version(collection)}'
+                f'-{_get_renderer_format(request)}"'
+            )
+            response = get_conditional_response(request, etag=etag)
+            if response is None:
+                response = view(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+            response["ETag"] = etag
+            return response
+        return wrapped_view
+    return decorator
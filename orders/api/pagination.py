@@ -0,0 +1,109 @@
+"""
+This module contains pagination of API lists by keyset, which unlike
+PageNumberPagination runs no COUNT(*) query and filters by position of last
+row seen instead of using OFFSET, so deep pages cost as much as the first.
+"""
+
+import json
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db import connections
+from gameboost.pagination import KeysetPaginator
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def get_approximate_count(queryset):
+    """
+    Estimate number of rows of queryset. On PostgreSQL it is row estimate of
+    query planner, which costs no scan, other databases count rows exactly.
+
+    Returns:
+        (int): Approximate number of rows.
+    """
+    queryset = queryset.order_by()
+    if connections[queryset.db].vendor == "postgresql":
+        plan = json.loads(queryset.explain(format="json"))
+        return int(plan[0]["Plan"]["Plan Rows"])
+    return queryset.count()
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    Paginates API lists by keyset on best rated first, with ties broken by
+    ID. Views can list in other order by setting 'cursor_ordering', whose
+    last field has to be unique.
+
+    Total number of rows is not counted, unless "total=approximate" query
+    parameter is given, then an estimate is included in response.
+    """
+
+    ordering = ("-rating", "-id")
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    total_query_param = "total"
+
+    def __init__(self, ordering=None):
+        if ordering:
+            self.ordering = tuple(ordering)
+        self.page = None
+        self.request = None
+        self.approximate_count = None
+
+    def get_page_size(self, request):
+        """Get page size requested in query parameter, or PAGE_SIZE."""
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return settings.REST_FRAMEWORK["PAGE_SIZE"]
+        return min(max(page_size, 1), self.max_page_size)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        ordering = getattr(view, "cursor_ordering", None) or self.ordering
+        self.page = KeysetPaginator(
+            queryset, ordering, self.get_page_size(request)
+        ).get_page(request.query_params.get(self.cursor_query_param))
+        if request.query_params.get(self.total_query_param) == "approximate":
+            self.approximate_count = get_approximate_count(queryset)
+        return self.page.object_list
+
+    def _get_cursor_link(self, cursor):
+        """Get absolute URL of page a cursor points to."""
+        if not cursor:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, cursor
+        )
+
+    def get_next_link(self):
+        """Get URL of next page, or None if this is the last page."""
+        return self._get_cursor_link(self.page.next_cursor)
+
+    def get_previous_link(self):
+        """Get URL of previous page, or None if this is the first page."""
+        return self._get_cursor_link(self.page.previous_cursor)
+
+    def get_paginated_response(self, data):
+        response = OrderedDict([
+            ("next", self.get_next_link()),
+            ("previous", self.get_previous_link()),
+        ])
+        if self.approximate_count is not None:
+            response["approximate_count"] = self.approximate_count
+        response["results"] = data
+        return Response(response)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True},
+                "previous": {"type": "string", "nullable": True},
+                "approximate_count": {"type": "integer"},
+                "results": schema,
+            },
+        }
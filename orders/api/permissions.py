@@ -1,9 +1,69 @@
 """All permissions for the api are defined here"""
 
+# pylint: disable=no-member
+
+from accounts.models import Buyer, Seller, User
+from django.core.exceptions import ObjectDoesNotExist
 from django.utils import timezone
+from orders.models import Order
 from rest_framework import permissions
 
 
+def _memoize_on_request(request, key, compute):
+    """
+    Get result of 'compute' saved on request under key, computing it only on
+    first call, so permission checks repeated within a request are free.
+    """
+    results = getattr(request, "_permission_results", None)
+    if results is None:
+        results = request._permission_results = {}
+    if key not in results:
+        results[key] = compute()
+    return results[key]
+
+
+def get_buyer_id(request):
+    """
+    Get ID of Buyer of current user, reusing Buyer already loaded on user.
+
+    Returns:
+        (int): ID of Buyer, None if user is anonymous or not a Buyer.
+    """
+    user = request.user
+    if not user.is_authenticated:
+        return None
+    if User.buyer.is_cached(user):
+        try:
+            return user.buyer.id
+        except ObjectDoesNotExist:
+            return None
+    return _memoize_on_request(
+        request,
+        ("buyer_id",),
+        lambda: (
+            Buyer.objects
+            .filter(user_id=user.id)
+            .values_list("id", flat=True)
+            .first()
+        ),
+    )
+
+
+def get_time_limit_for_changing_requirements(order):
+    """
+    Get hours within which requirements of an Order can be changed, reusing
+    Seller already loaded on Order, otherwise fetching only that column.
+    """
+    if Order.seller.is_cached(order):
+        return order.seller.time_limit_in_hours_for_changing_requirements
+    return (
+        Seller.objects
+        .filter(id=order.seller_id)
+        .values_list("time_limit_in_hours_for_changing_requirements", flat=True)
+        .get()
+    )
+
+
 class HasCompletedOrderOrReadOnly(permissions.BasePermission):
     """
     Only allowed to make a read api call but if update or create api call is
@@ -17,17 +77,20 @@ class HasCompletedOrderOrReadOnly(permissions.BasePermission):
         """
         Buyer will be allowed permission to give review if user who is
         giving review is buyer of this order and this order should be
-        marked as completed.
+        marked as completed, which is checked on the Order itself.
         """
         if request.method in permissions.SAFE_METHODS:
             return True
-        all_orders_buyer_has_completed = (
-            request.user.buyer
-            .orders
-            .filter(status='cp')
-            .values_list('id', flat=True)
+        buyer_id = get_buyer_id(request)
+        return _memoize_on_request(
+            request,
+            (type(self).__name__, obj.pk),
+            lambda: (
+                buyer_id is not None
+                and obj.buyer_id == buyer_id
+                and obj.status == Order.Status.COMPLETED
+            ),
         )
-        return obj.id in all_orders_buyer_has_completed
 
 
 class IsOrderRequirementsChangeableOrReadOnly(permissions.BasePermission):
@@ -46,13 +109,16 @@ class IsOrderRequirementsChangeableOrReadOnly(permissions.BasePermission):
         """
         if request.method in permissions.SAFE_METHODS:
             return True
-        if obj.buyer == request.user.buyer:
-            due_time_for_changing_requirement = (
+        buyer_id = get_buyer_id(request)
+        if buyer_id is None or obj.buyer_id != buyer_id:
+            return False
+        return _memoize_on_request(
+            request,
+            (type(self).__name__, obj.pk),
+            lambda: timezone.now() < (
                 obj.order_start_time
                 + timezone.timedelta(
-                    hours=obj.seller.time_limit_in_hours_for_changing_requirements
+                    hours=get_time_limit_for_changing_requirements(obj)
                 )
-            )
-            if timezone.now() < due_time_for_changing_requirement:
-                return True
-        return False
+            ),
+        )
@@ -0,0 +1,96 @@
+"""
+This module contains compact renderers of API responses, negotiated by
+Accept header or 'format' query parameter, for clients which care about
+size of responses.
+
+PackedJSONRenderer sends every list of objects as names of their fields
+followed by a list of values of every object, so field names are sent once
+per list instead of once per object. Lists of rating rows are serialized
+already packed, without building an object of every row.
+MessagePackRenderer sends responses as binary MessagePack, it is only
+available when package msgpack is installed.
+"""
+
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def pack_lists(data):
+    """
+    Pack every list of objects having the same fields within data into
+    {"fields": [...], "rows": [[...], ...]}, other values are kept as they are.
+
+    Args:
+        data: Serialized data of response.
+
+    Returns:
+        Data with lists of objects packed.
+    """
+    if isinstance(data, dict):
+        return {key: pack_lists(value) for key, value in data.items()}
+    if not isinstance(data, list) or not data:
+        return data
+    first = data[0]
+    if isinstance(first, list):
+        return [pack_lists(item) for item in data]
+    if not isinstance(first, dict):
+        return data
+    fields = list(first)
+    if any(
+        not isinstance(item, dict) or list(item) != fields for item in data
+    ):
+        return [pack_lists(item) for item in data]
+    return {
+        "fields": fields,
+        "rows": [
+            [
+                pack_lists(value) if isinstance(value, (dict, list)) else value
+                for value in item.values()
+            ]
+            for item in data
+        ],
+    }
+
+
+class PackedJSONRenderer(JSONRenderer):
+    """
+    Renders JSON with every list of objects packed by 'pack_lists', which
+    saves repeating field names of every object. Serializers which can pack
+    their lists themselves do so when it is the accepted renderer.
+    """
+
+    media_type = "application/vnd.gameboost.packed+json"
+    format = "packed"
+    packs_rows = True
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return super().render(
+            pack_lists(data), accepted_media_type, renderer_context
+        )
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Renders binary MessagePack, it has to be listed in renderers only when
+    package msgpack is installed.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if msgpack is None:
+            raise ImproperlyConfigured(
+                "MessagePackRenderer requires package msgpack to be installed"
+            )
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=JSONEncoder().default)
@@ -1,8 +1,11 @@
 """All custom serialzers are defined here"""
 
-# pylint: disable=too-few-public-methods
+# pylint: disable=too-few-public-methods, abstract-method
+from accounts.constants import FIVE_STAR, ONE_STAR
+from django.utils.functional import cached_property
 from orders.models import Order, Review
 from rest_framework import serializers
+from rest_framework.utils.serializer_helpers import ReturnDict
 
 
 class OrderSerializer(serializers.ModelSerializer):
@@ -11,6 +14,20 @@ class OrderSerializer(serializers.ModelSerializer):
         """Changing default Serializer behaviour"""
         model = Review
         fields = '__all__'
+        extra_kwargs = {
+            "rating": {"min_value": ONE_STAR, "max_value": FIVE_STAR},
+        }
+
+
+class ReviewWriteSerializer(serializers.Serializer):
+    """To Validate a review to be written for an Order"""
+    order = serializers.IntegerField()
+    rating = serializers.FloatField(
+        min_value=ONE_STAR, max_value=FIVE_STAR, default=FIVE_STAR
+    )
+    comment = serializers.CharField(
+        max_length=500, allow_blank=True, default=""
+    )
 
 
 class OrderRequirementsSerializer(serializers.ModelSerializer):
@@ -30,9 +47,143 @@ class OrderRequirementsSerializer(serializers.ModelSerializer):
         ]
 
 
-class RatingSerializer(serializers.ModelSerializer):
-    """To Serialize rating for requested object"""
+class RatingRowListSerializer(serializers.ListSerializer):
+    """
+    Serializer of many rating rows, which packs them into names of their
+    fields and a list of their values when "pack_rows" is set in context,
+    without building a dict of every row.
+    """
+
+    def to_representation(self, data):
+        if not self.context.get("pack_rows"):
+            return super().to_representation(data)
+        fields = self.child.selected_fields
+        size = len(fields)
+        return {"fields": list(fields), "rows": [row[:size] for row in data]}
+
+    @property
+    def data(self):
+        if not self.context.get("pack_rows"):
+            return super().data
+        if not hasattr(self, "_data"):
+            self._data = self.to_representation(self.instance)
+        return ReturnDict(self._data, serializer=self)
+
+
+class RatingRowSerializer(serializers.BaseSerializer):
+    """
+    Read only serializer of rating rows fetched by 'get_rows', which selects
+    only needed columns as tuples instead of building model instances.
+
+    Clients can ask for only some of 'row_fields' in comma separated 'fields'
+    query parameter, then only their columns are selected and serialized.
+    Selected fields are passed to serializer as "row_fields" in its context,
+    see 'get_context'.
+    """
+    row_fields = ()
+    # Columns fetched after 'row_fields' without being serialized, such as
+    # ones rows are ordered by or ones conditional requests are checked by.
+    extra_row_fields = ("id", "rating", "rating_version", "rating_updated_at")
+    fields_query_param = "fields"
+
     class Meta:
         """Changing default Serializer behaviour"""
-        model = Review
-        fields = ['id', 'rating']
+        list_serializer_class = RatingRowListSerializer
+
+    @classmethod
+    def get_requested_fields(cls, query_params):
+        """
+        Get fields requested in 'fields' query parameter, in order of
+        'row_fields'.
+
+        Args:
+            query_params (QueryDict): Query parameters of request.
+
+        Raises:
+            ValidationError: If an unknown field is requested.
+
+        Returns:
+            (tuple): Requested fields, all 'row_fields' if none is requested.
+        """
+        value = query_params.get(cls.fields_query_param, "")
+        requested = {field.strip() for field in value.split(",")} - {""}
+        if not requested:
+            return cls.row_fields
+        unknown = requested.difference(cls.row_fields)
+        if unknown:
+            raise serializers.ValidationError({
+                cls.fields_query_param: (
+                    f"Unknown fields {', '.join(sorted(unknown))}, "
+                    f"available are {', '.join(cls.row_fields)}"
+                )
+            })
+        return tuple(field for field in cls.row_fields if field in requested)
+
+    @classmethod
+    def get_context(cls, request):
+        """
+        Get context of serializer of rows for a request, with fields it
+        requested and whether renderer it accepted packs rows.
+
+        Returns:
+            (dict): Context with "row_fields" and "pack_rows".
+        """
+        renderer = getattr(request, "accepted_renderer", None)
+        return {
+            "row_fields": cls.get_requested_fields(request.query_params),
+            "pack_rows": getattr(renderer, "packs_rows", False),
+        }
+
+    @classmethod
+    def get_rows(cls, queryset, fields=None):
+        """
+        Select columns this serializer needs from queryset.
+
+        Args:
+            queryset (QuerySet): Objects to be serialized.
+            fields (tuple): Fields to be serialized, all 'row_fields' if not
+                given.
+
+        Returns:
+            (QuerySet): Named tuples of fields and 'extra_row_fields'.
+        """
+        return queryset.values_list(
+            *dict.fromkeys((*(fields or cls.row_fields), *cls.extra_row_fields)),
+            named=True
+        )
+
+    @cached_property
+    def selected_fields(self):
+        """Fields serialized by this serializer, looked up only once."""
+        return self.context.get("row_fields") or self.row_fields
+
+    def to_representation(self, instance):
+        return dict(zip(self.selected_fields, instance))
+
+
+class SellerRatingSerializer(RatingRowSerializer):
+    """To Serialize rating of a Seller"""
+    row_fields = ("id", "rating")
+    extra_row_fields = (*RatingRowSerializer.extra_row_fields, "ranking_score")
+
+
+class GameRatingSerializer(RatingRowSerializer):
+    """To Serialize rating of a Game"""
+    row_fields = ("id", "rating")
+
+
+class SellerGameRatingSerializer(RatingRowSerializer):
+    """To Serialize rating of a Seller for a specific Game"""
+    row_fields = ("seller", "game", "rating", "rating_count")
+
+
+class RatingHistogramSerializer(serializers.Serializer):
+    """To Serialize star by star rating distribution of a Seller or Game"""
+    id = serializers.IntegerField(read_only=True)
+    rating = serializers.FloatField(read_only=True)
+    rating_count = serializers.IntegerField(read_only=True)
+    histogram = serializers.DictField(
+        source="rating_histogram",
+        child=serializers.IntegerField(),
+        read_only=True
+    )
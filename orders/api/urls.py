@@ -39,6 +39,30 @@ urlpatterns = [
         name='game_rating'
     ),
 
+    path(
+        'rating/seller/histogram/',
+        views.seller_rating_histograms,
+        name='seller_rating_histograms'
+    ),
+
+    path(
+        'rating/game/histogram/',
+        views.game_rating_histograms,
+        name='game_rating_histograms'
+    ),
+
+    path(
+        'rating/seller/<int:pk>/histogram/',
+        views.SellerRatingHistogram.as_view(),
+        name='seller_rating_histogram'
+    ),
+
+    path(
+        'rating/game/<int:pk>/histogram/',
+        views.GameRatingHistogram.as_view(),
+        name='game_rating_histogram'
+    ),
+
     path(
         'rating/seller/<int:pk>/game/',
         views.all_games_rating_for_given_seller,
@@ -68,12 +92,23 @@ urlpatterns = [
         views.OrderReviewList.as_view(),
         name='all_orders_review'
     ),
+    path(
+        'review/order/bulk/',
+        views.OrderReviewBulk.as_view(),
+        name='bulk_orders_review'
+    ),
     path(
         'review/order/<int:pk>/',
         views.OrderReviewDetail.as_view(),
         name='detail_order_review'
     ),
 
+    path(
+        'export/<str:kind>/',
+        views.export_rows,
+        name='export_rows'
+    ),
+
     path(
         'order/<int:pk>/',
         views.ChangeOrderRequirements.as_view(),
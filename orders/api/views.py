@@ -1,10 +1,19 @@
 """Contains all the view fucntions for the API"""
 
-from accounts.models import Seller
-from games.models import Game
+from accounts.models import RatingAggregate, Seller
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from games.facets import filter_games_by_categories, get_category_filter
+from games.models import Game, SellerGame
+from orders.export import (EXPORTS, NDJSON_CONTENT_TYPE, iter_export_rows,
+                           iter_ndjson, parse_since)
 from orders.models import Order, Review
+from orders.reviews import ReviewWrite, upsert_reviews
+from orders.versions import GAMES, ORDERS, REVIEWS, SELLER_GAMES, SELLERS
 from rest_framework import status
 from rest_framework.decorators import api_view
+from rest_framework.exceptions import ParseError, ValidationError
 from rest_framework.generics import ListAPIView, RetrieveAPIView
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from rest_framework.response import Response
@@ -13,14 +22,26 @@ from rest_framework.views import APIView
 # pylint: disable=relative-beyond-top-level, no-member, invalid-name, unused-argument, no-self-use
 
 
+from .cache import cache_api_response
+from .conditional import (ConditionalRatingMixin, conditional_on_collection,
+                          get_conditional_rating_response)
+from .pagination import KeysetCursorPagination
 from .permissions import (
     HasCompletedOrderOrReadOnly, IsOrderRequirementsChangeableOrReadOnly
 )
 from .serializers import (
-    OrderRequirementsSerializer, OrderSerializer, RatingSerializer
+    GameRatingSerializer, OrderRequirementsSerializer, OrderSerializer,
+    RatingHistogramSerializer, RatingRowSerializer, ReviewWriteSerializer,
+    SellerGameRatingSerializer, SellerRatingSerializer
+)
+
+HISTOGRAM_QUERY_FIELDS = (
+    "id", "rating", "rating_count", *RatingAggregate.HISTOGRAM_FIELDS,
+    "rating_version", "rating_updated_at",
 )
 
 
+@cache_api_response()
 @api_view(["GET"])
 def api_overview(request):
     """
@@ -28,33 +49,122 @@ def api_overview(request):
     """
     api_urls = {
         "List All Seller's ratings": "/api/rating/seller/",
+        "View Sellers ratings": "/api/rating/seller/?ids=<id>,<id>",
         "View a Seller rating": "/api/rating/seller/<seller_id>/",
         "List all Games rating for a Seller": "/api/rating/seller/<seller_id>/game/",
         "View Game rating for Seller": "/rating/seller/<seller_id>/game/<game_id>/",
         "List All Game's ratings": "/api/rating/game/",
+        "View Games ratings": "/api/rating/game/?ids=<id>,<id>",
+        "List Game's ratings by categories": "/api/rating/game/?category=<category_id>&match=<all|any>",
         "View a Game rating": "/api/rating/game/<game_id>/",
         "List all Seller's rating for a Game": "/api/rating/game/<game_id>/seller/",
         "View Seller rating for Game": "/rating/game/<game_id>/seller/<seller_id>/",
+        "View a Seller rating histogram": "/api/rating/seller/<seller_id>/histogram/",
+        "View Sellers rating histograms": "/api/rating/seller/histogram/?ids=<id>,<id>",
+        "View a Game rating histogram": "/api/rating/game/<game_id>/histogram/",
+        "View Games rating histograms": "/api/rating/game/histogram/?ids=<id>,<id>",
         "List Review of Order": "/api/review/order/",
         "Detail Review Order": "/api/review/order/<id>",
+        "Create/Replace Reviews of many Orders": "/api/review/order/bulk/",
         "Update/Delete order requirement": "/api/order",
+        "Export reviews or ratings as NDJSON": "/api/export/<reviews|sellers|games|seller_games>/?since=<time>",
+        "Select fields of ratings": "/api/rating/<...>/?fields=<field>,<field>",
+        "Packed or MessagePack responses": "/api/<...>/?format=<packed|msgpack>",
     }
     return Response(api_urls)
 
 
-class SellerRatingList(ListAPIView):
-    """Display ratings of all Sellers"""
+class RatingRowsMixin:
+    """
+    Mixin for generic views serialized by a RatingRowSerializer, which
+    selects only columns of fields requested in 'fields' query parameter.
+    """
+
+    def get_rows(self, queryset):
+        """Select columns of requested fields from queryset."""
+        serializer_class = self.get_serializer_class()
+        return serializer_class.get_rows(
+            queryset,
+            serializer_class.get_requested_fields(self.request.query_params),
+        )
+
+    def get_queryset(self):
+        return self.get_rows(super().get_queryset())
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context.update(self.get_serializer_class().get_context(self.request))
+        return context
+
+
+class AllFieldsMixin:
+    """
+    Mixin for views which always serialize every field, rejecting 'fields'
+    query parameter instead of silently ignoring it.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        fields_query_param = RatingRowSerializer.fields_query_param
+        if fields_query_param in request.query_params:
+            raise ValidationError({
+                fields_query_param: "Fields can only be selected for ratings"
+            })
+
+
+class BatchRatingListMixin:
+    """
+    Mixin for ListAPIView of ratings, which lists only ratings of objects
+    requested as comma separated query parameter 'ids', fetched with a
+    single query and keyed by ID, along with IDs not found.
+    """
+
+    def list(self, request, *args, **kwargs):
+        if "ids" not in request.query_params:
+            return super().list(request, *args, **kwargs)
+        ids = _get_requested_ids(request)
+        rows = list(self.get_queryset().filter(id__in=ids).order_by())
+        context = {**self.get_serializer_context(), "pack_rows": False}
+        return _get_keyed_response(
+            ids, rows, self.get_serializer(rows, many=True, context=context).data
+        )
+
+
+@method_decorator(cache_api_response(SELLERS), name="dispatch")
+@method_decorator(conditional_on_collection(SELLERS), name="get")
+class SellerRatingList(RatingRowsMixin, BatchRatingListMixin, ListAPIView):
+    """
+    Display ratings of all Sellers, best ranked first, or ratings of Sellers
+    requested in 'ids' query parameter keyed by their ID.
+    """
     queryset = Seller.objects.all()
-    serializer_class = RatingSerializer
+    serializer_class = SellerRatingSerializer
+    cursor_ordering = ("-ranking_score", "-id")
 
 
-class GameRatingList(ListAPIView):
-    """Display ratings of all Games"""
-    queryset = Game.objects.all()
-    serializer_class = RatingSerializer
+@method_decorator(cache_api_response(GAMES), name="dispatch")
+@method_decorator(conditional_on_collection(GAMES), name="get")
+class GameRatingList(RatingRowsMixin, BatchRatingListMixin, ListAPIView):
+    """
+    Display ratings of all Games, best rated first, filtered by categories
+    selected in "category" query parameters. "match" decides if Games have
+    to belong to "all" of them or to "any" of them, which is the default.
+    Ratings of Games requested in 'ids' query parameter are keyed by their
+    ID instead.
+    """
+    serializer_class = GameRatingSerializer
+
+    def get_queryset(self):
+        category_ids, match = get_category_filter(self.request.query_params)
+        return self.get_rows(
+            filter_games_by_categories(Game.objects.all(), category_ids, match)
+        )
 
 
-class SellerRating(RetrieveAPIView):
+@method_decorator(
+    cache_api_response(SELLERS, object_kwargs=("pk",)), name="dispatch"
+)
+class SellerRating(RatingRowsMixin, ConditionalRatingMixin, RetrieveAPIView):
     """
     GET rating for a specific Seller based on "pk" of Seller.
 
@@ -65,10 +175,13 @@ class SellerRating(RetrieveAPIView):
         (Json Fomat): Rating for requested Seller in Json format.
     """
     queryset = Seller.objects.all()
-    serializer_class = RatingSerializer
+    serializer_class = SellerRatingSerializer
 
 
-class GameRating(RetrieveAPIView):
+@method_decorator(
+    cache_api_response(GAMES, object_kwargs=("pk",)), name="dispatch"
+)
+class GameRating(RatingRowsMixin, ConditionalRatingMixin, RetrieveAPIView):
     """
     GET rating for a specific Game based on "pk" of Game.
 
@@ -79,29 +192,195 @@ class GameRating(RetrieveAPIView):
         (Json Fomat): Rating for requested Game in Json format.
     """
     queryset = Game.objects.all()
-    serializer_class = RatingSerializer
+    serializer_class = GameRatingSerializer
+
+
+@method_decorator(
+    cache_api_response(SELLERS, object_kwargs=("pk",)), name="dispatch"
+)
+class SellerRatingHistogram(ConditionalRatingMixin, RetrieveAPIView):
+    """
+    GET number of reviews for every star of a specific Seller.
+
+    Args:
+        pk (int): Primary key or ID of required Seller.
+
+    Returns:
+        (Json Fomat): Rating histogram of requested Seller in Json format.
+    """
+    queryset = Seller.objects.only(*HISTOGRAM_QUERY_FIELDS)
+    serializer_class = RatingHistogramSerializer
+
+
+@method_decorator(
+    cache_api_response(GAMES, object_kwargs=("pk",)), name="dispatch"
+)
+class GameRatingHistogram(ConditionalRatingMixin, RetrieveAPIView):
+    """
+    GET number of reviews for every star of a specific Game.
+
+    Args:
+        pk (int): Primary key or ID of required Game.
+
+    Returns:
+        (Json Fomat): Rating histogram of requested Game in Json format.
+    """
+    queryset = Game.objects.only(*HISTOGRAM_QUERY_FIELDS)
+    serializer_class = RatingHistogramSerializer
+
+
+def _get_requested_ids(request):
+    """
+    Get IDs requested as comma separated query parameter 'ids'.
+
+    Returns:
+        (list): Unique requested IDs in order they were requested.
+
+    Raises:
+        ParseError: If IDs are missing, are not integers or exceed the limit.
+    """
+    raw_ids = request.query_params.get("ids", "")
+    try:
+        ids = list(dict.fromkeys(
+            int(raw_id) for raw_id in raw_ids.split(",") if raw_id.strip()
+        ))
+    except ValueError as error:
+        raise ParseError("'ids' must be comma separated integers") from error
+    if not ids:
+        raise ParseError("'ids' query parameter is required")
+    if len(ids) > settings.RATING_BATCH_MAX_IDS:
+        raise ParseError(
+            f"At most {settings.RATING_BATCH_MAX_IDS} ids can be requested"
+        )
+    return ids
+
+
+def _get_keyed_response(ids, objects, data):
+    """
+    Build response with serialized objects keyed by their ID.
+
+    Args:
+        ids (list): Requested IDs.
+        objects (list): Objects or rows found, each having an 'id'.
+        data (list): Serialized objects, in the same order.
+
+    Returns:
+        Response: Objects keyed by ID along with requested IDs not found.
+    """
+    results = {obj.id: item for obj, item in zip(objects, data)}
+    missing = [object_id for object_id in ids if object_id not in results]
+    return Response(
+        {"results": results, "missing": missing}, status=status.HTTP_200_OK
+    )
+
+
+def _get_rating_histograms_response(request, model):
+    """
+    Build response with rating histograms of all requested objects of model,
+    fetched with a single query.
 
+    Returns:
+        Response: Histograms keyed by ID along with IDs not found.
+    """
+    ids = _get_requested_ids(request)
+    objects = list(
+        model.objects
+        .filter(id__in=ids)
+        .only(*HISTOGRAM_QUERY_FIELDS)
+        .order_by()
+    )
+    return _get_keyed_response(
+        ids, objects, RatingHistogramSerializer(objects, many=True).data
+    )
 
+
+@cache_api_response(SELLERS)
 @api_view(["GET"])
+@conditional_on_collection(SELLERS)
+def seller_rating_histograms(request):
+    """
+    GET rating histograms of all Sellers requested in 'ids' query parameter.
+
+    Returns:
+        (Json Fomat): Histograms keyed by Seller ID and IDs not found.
+    """
+    return _get_rating_histograms_response(request, Seller)
+
+
+@cache_api_response(GAMES)
+@api_view(["GET"])
+@conditional_on_collection(GAMES)
+def game_rating_histograms(request):
+    """
+    GET rating histograms of all Games requested in 'ids' query parameter.
+
+    Returns:
+        (Json Fomat): Histograms keyed by Game ID and IDs not found.
+    """
+    return _get_rating_histograms_response(request, Game)
+
+
+def _get_rating_rows(request, serializer_class, queryset):
+    """
+    Select columns of fields requested in 'fields' query parameter from
+    queryset serialized by a RatingRowSerializer.
+
+    Returns:
+        (tuple): Rows, and serializer context for them.
+    """
+    context = serializer_class.get_context(request)
+    return serializer_class.get_rows(queryset, context["row_fields"]), context
+
+
+def _get_paginated_response(
+    request, queryset, serializer_class, ordering=None, context=None
+):
+    """
+    Build response containing a page of queryset, paginated by keyset on
+    given ordering, best rated first if not given.
+
+    Returns:
+        Response: Serialized objects of requested page along with links of
+            pages before and after it.
+    """
+    paginator = KeysetCursorPagination(ordering)
+    page = paginator.paginate_queryset(queryset, request)
+    serializer = serializer_class(page, many=True, context=context or {})
+    return paginator.get_paginated_response(serializer.data)
+
+
+@cache_api_response(SELLER_GAMES)
+@api_view(["GET"])
+@conditional_on_collection(SELLER_GAMES)
 def all_games_rating_for_given_seller(request, pk):
     """
-    GET all game ratings for which current seller has offered his serices.
+    GET ratings of this seller for every game he has offered his serices,
+    best rated first, in pages selected by 'cursor' query parameter.
 
     Args:
         pk (int): Primary key or ID of required seller.
 
     Returns:
-        (Json Fomat): Game_id, Game_rating of all games for this seller.
+        (Json Fomat): Seller_id, Game_id and rating of this seller for each
+            of his games.
     """
-    seller_games_review = Game.objects.filter(seller_games__seller=pk)
-    serializer = RatingSerializer(seller_games_review, many=True)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    rows, context = _get_rating_rows(
+        request,
+        SellerGameRatingSerializer,
+        SellerGame.objects.filter(seller=pk),
+    )
+    return _get_paginated_response(
+        request, rows, SellerGameRatingSerializer, context=context
+    )
 
 
+@cache_api_response(SELLER_GAMES)
 @api_view(["GET"])
+@conditional_on_collection(SELLER_GAMES)
 def all_sellers_rating_for_given_game(request, pk):
     """
-    GET all sellers rating who have offered services of this game.
+    GET rating for this game of every seller who have offered its services,
+    best rated first, in pages selected by 'cursor' query parameter.
 
     Args:
         pk (int): Primary key or ID of required game.
@@ -109,11 +388,47 @@ def all_sellers_rating_for_given_game(request, pk):
     Returns:
         (Json Fomat): Rating of all sellers for this game.
     """
-    game_sellers_review = Seller.objects.filter(seller_games__game=pk)
-    serializer = RatingSerializer(game_sellers_review, many=True)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    rows, context = _get_rating_rows(
+        request,
+        SellerGameRatingSerializer,
+        SellerGame.objects.filter(game=pk),
+    )
+    return _get_paginated_response(
+        request, rows, SellerGameRatingSerializer, context=context
+    )
+
+
+def _get_seller_game_rating_response(request, seller_pk, game_pk):
+    """
+    Build response containing rating of a seller for a specific game, or 304
+    if client already has its current version.
 
+    Returns:
+        Response: Rating of seller for this game, or 404 if seller does not
+            offer services of this game.
+    """
+    rows, context = _get_rating_rows(
+        request,
+        SellerGameRatingSerializer,
+        SellerGame.objects.filter(seller=seller_pk, game=game_pk),
+    )
+    seller_game = rows.first()
+    if not seller_game:
+        return Response("Object not found", status=status.HTTP_404_NOT_FOUND)
+    return get_conditional_rating_response(
+        request,
+        SellerGame,
+        seller_game,
+        lambda: Response(
+            SellerGameRatingSerializer(seller_game, context=context).data,
+            status=status.HTTP_200_OK
+        ),
+    )
 
+
+@cache_api_response(
+    SELLER_GAMES, object_kwargs=("seller_pk", "game_pk")
+)
 @api_view(["GET"])
 def seller_rating_for_given_game(request, game_pk, seller_pk):
     """
@@ -127,13 +442,12 @@ def seller_rating_for_given_game(request, game_pk, seller_pk):
     Returns:
         (Json Fomat): Rating of seller for this game.
     """
-    game_seller_review = Seller.objects.filter(
-        seller_games__game=game_pk, id=seller_pk
-    )
-    serializer = RatingSerializer(game_seller_review, many=True)
-    return Response(serializer.data, status=status.HTTP_200_OK)
+    return _get_seller_game_rating_response(request, seller_pk, game_pk)
 
 
+@cache_api_response(
+    SELLER_GAMES, object_kwargs=("seller_pk", "game_pk")
+)
 @api_view(["GET"])
 def game_rating_for_given_seller(request, seller_pk, game_pk):
     """
@@ -147,53 +461,135 @@ def game_rating_for_given_seller(request, seller_pk, game_pk):
     Returns:
         (Json Fomat): Rating of game for this seller.
     """
-    seller_game_review = Game.objects.filter(
-        id=game_pk, seller_games__seller=seller_pk
+    return _get_seller_game_rating_response(request, seller_pk, game_pk)
+
+
+@api_view(["GET"])
+def export_rows(request, kind):
+    """
+    GET all reviews, or ratings of all Sellers, Games or their pairs, as
+    NDJSON streamed while rows are read, earliest changed first, so memory
+    used does not grow with their number.
+
+    Args:
+        kind (str): Either reviews, sellers, games or seller_games.
+
+    Returns:
+        (NDJSON Format): One row per line, only rows changed at or after
+            ISO 8601 time in 'since' query parameter if given.
+    """
+    if kind not in EXPORTS:
+        return Response("Object not found", status=status.HTTP_404_NOT_FOUND)
+    try:
+        since = parse_since(request.query_params.get("since"))
+    except ValueError as error:
+        return Response(str(error), status=status.HTTP_400_BAD_REQUEST)
+    return StreamingHttpResponse(
+        iter_ndjson(iter_export_rows(kind, since)),
+        content_type=NDJSON_CONTENT_TYPE,
     )
-    serializer = RatingSerializer(seller_game_review, many=True)
-    return Response(serializer.data, status=status.HTTP_200_OK)
 
 
-class OrderReviewList(APIView):
+@method_decorator(cache_api_response(REVIEWS), name="dispatch")
+class OrderReviewList(AllFieldsMixin, APIView):
     """List all Order reviews, or create a new Order review."""
 
     permission_classes = [IsAuthenticatedOrReadOnly, HasCompletedOrderOrReadOnly]
 
+    @method_decorator(conditional_on_collection(REVIEWS))
     def get(self, request):
-        """Get review of all Orders"""
-        all_completed_orders_review = Review.objects.all()
-        serializer = OrderSerializer(all_completed_orders_review, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        """Get review of all Orders, latest first"""
+        return _get_paginated_response(
+            request, Review.objects.all(), OrderSerializer, ordering=("-id",)
+        )
 
     def put(self, request):
         """
         Replace if exists or Create a new review for an order but order should
         exists and should be of current buyer and should also be marked as
-        completed.
+        completed. Review is written, and ratings updated, only once.
         """
+        serializer = ReviewWriteSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(status=status.HTTP_400_BAD_REQUEST)
         try:
-            order = Order.objects.get(id=request.data.get("order"))
+            order = Order.objects.get(id=serializer.validated_data["order"])
         except Order.DoesNotExist:
             return Response("Order not found", status=status.HTTP_404_NOT_FOUND)
 
         self.check_object_permissions(request, order)
-        request.data["buyer"] = request.user.buyer.id
-        try:
-            review = Review.objects.get(order=order)
-        except Review.DoesNotExist:
-            review = Review.objects.create(
+        review, = upsert_reviews([
+            ReviewWrite(
                 order=order,
-                rating=request.data.get("rating", 5),
-                comment=request.data.get("comment", "")
+                rating=serializer.validated_data["rating"],
+                comment=serializer.validated_data["comment"],
             )
-        serializer = OrderSerializer(instance=review, data=request.data)
-        if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
-        return Response(status=status.HTTP_400_BAD_REQUEST)
+        ])
+        return Response(
+            OrderSerializer(review).data, status=status.HTTP_201_CREATED
+        )
+
 
+class OrderReviewBulk(APIView):
+    """Create or replace reviews of many Orders at once."""
 
-class OrderReviewDetail(APIView):
+    permission_classes = [IsAuthenticatedOrReadOnly, HasCompletedOrderOrReadOnly]
+
+    def post(self, request):
+        """
+        Replace if exists or Create reviews of all Orders in a list, every
+        order should exist, appear once, be of current buyer and be marked
+        as completed. Reviews are written in a single upsert and rating of
+        every affected seller and game is updated once.
+        """
+        if not isinstance(request.data, list):
+            return Response(
+                "A list of reviews is expected",
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(request.data) > settings.REVIEW_BULK_MAX_REVIEWS:
+            return Response(
+                f"At most {settings.REVIEW_BULK_MAX_REVIEWS} reviews can be "
+                "written at once",
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        serializer = ReviewWriteSerializer(data=request.data, many=True)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        order_ids = [review["order"] for review in serializer.validated_data]
+        if len(set(order_ids)) != len(order_ids):
+            return Response(
+                "Every order can be reviewed only once",
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        orders = Order.objects.in_bulk(order_ids)
+        missing = [order_id for order_id in order_ids if order_id not in orders]
+        if missing:
+            return Response(
+                {"missing": missing}, status=status.HTTP_404_NOT_FOUND
+            )
+        for order in orders.values():
+            self.check_object_permissions(request, order)
+        reviews = upsert_reviews([
+            ReviewWrite(
+                order=orders[review["order"]],
+                rating=review["rating"],
+                comment=review["comment"],
+            )
+            for review in serializer.validated_data
+        ])
+        return Response(
+            OrderSerializer(reviews, many=True).data,
+            status=status.HTTP_201_CREATED
+        )
+
+
+@method_decorator(
+    cache_api_response(REVIEWS, ORDERS, object_kwargs=("pk",)),
+    name="dispatch"
+)
+class OrderReviewDetail(AllFieldsMixin, APIView):
     """Get, Update, Delete Review of an Order provided 'pk' of Order."""
 
     permission_classes = [IsAuthenticatedOrReadOnly, HasCompletedOrderOrReadOnly]
@@ -209,12 +605,8 @@ class OrderReviewDetail(APIView):
             Review: Review Objects containing review of requested Order.
         """
         try:
-            order = Order.objects.get(id=pk)
-            try:
-                return Review.objects.get(order=order)
-            except Review.DoesNotExist:
-                return None
-        except Order.DoesNotExist:
+            return Review.objects.select_related("order").get(order_id=pk)
+        except Review.DoesNotExist:
             return None
 
     def get(self, request, pk, *args, **kwargs):
@@ -233,6 +625,7 @@ class OrderReviewDetail(APIView):
         review = self.get_object(pk)
         if not review:
             return Response("Object not found", status=status.HTTP_404_NOT_FOUND)
+        self.check_object_permissions(request, review.order)
         serializer = OrderSerializer(instance=review, data=request.data)
         if serializer.is_valid():
             serializer.save()
@@ -244,6 +637,7 @@ class OrderReviewDetail(APIView):
         review = self.get_object(pk)
         if not review:
             return Response("Object not found", status=status.HTTP_404_NOT_FOUND)
+        self.check_object_permissions(request, review.order)
         review.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -266,7 +660,7 @@ class ChangeOrderRequirements(APIView):
             Order: Requested Order will be returned.
         """
         try:
-            return Order.objects.get(id=pk)
+            return Order.objects.select_related("seller").get(id=pk)
         except Order.DoesNotExist:
             return None
 
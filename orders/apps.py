@@ -7,3 +7,8 @@ class OrdersConfig(AppConfig):
     """App Order is to be configured"""
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'orders'
+
+    def ready(self):
+        """Connect receivers of signals once all models are loaded."""
+        # pylint: disable=import-outside-toplevel, unused-import
+        from orders import signals
@@ -0,0 +1,109 @@
+"""
+This module exports all reviews, or ratings of all Sellers, Games and their
+pairs, as newline delimited JSON (NDJSON) with one object per line.
+
+Rows are read through a chunked iterator, a server-side cursor on
+PostgreSQL, and encoded one line at a time, so memory used by an export does
+not grow with the number of exported rows. Rows are ordered by the time they
+were last changed, so an export can continue from the last timestamp it
+saw by passing it as 'since'.
+"""
+
+# pylint: disable=no-member
+
+from accounts.models import RatingAggregate, Seller
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from gameboost.pagination import CursorEncoder
+from games.models import Game, SellerGame
+
+from orders.models import Review
+
+RATING_EXPORT_FIELDS = (
+    "rating", "rating_sum", "rating_count", *RatingAggregate.HISTOGRAM_FIELDS,
+    "rating_version", "rating_updated_at",
+)
+
+# Every kind of export, along with model it exports, fields of every row and
+# field holding time a row was last changed.
+EXPORTS = {
+    "reviews": (
+        Review,
+        ("id", "order_id", "rating", "comment", "updated_at"),
+        "updated_at",
+    ),
+    "sellers": (Seller, ("id", *RATING_EXPORT_FIELDS), "rating_updated_at"),
+    "games": (Game, ("id", *RATING_EXPORT_FIELDS), "rating_updated_at"),
+    "seller_games": (
+        SellerGame,
+        ("id", "seller_id", "game_id", *RATING_EXPORT_FIELDS),
+        "rating_updated_at",
+    ),
+}
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+DEFAULT_CHUNK_SIZE = 2000
+
+
+def parse_since(value):
+    """
+    Parse 'since' filter of an export, times without timezone are taken to
+    be in current timezone.
+
+    Args:
+        value (str): ISO 8601 date and time, or None or empty for no filter.
+
+    Raises:
+        ValueError: If value is not a valid date and time.
+
+    Returns:
+        (datetime): Aware date and time, None if no filter is given.
+    """
+    if not value:
+        return None
+    since = parse_datetime(value)
+    if since is None:
+        raise ValueError(f"Invalid date and time '{value}'")
+    if timezone.is_naive(since):
+        since = timezone.make_aware(since)
+    return since
+
+
+def iter_export_rows(kind, since=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Iterate over rows of an export, earliest changed first.
+
+    Args:
+        kind (str): Kind of export, one of keys of EXPORTS.
+        since (datetime): Export only rows changed at or after this time.
+        chunk_size (int): Number of rows fetched from database at once.
+
+    Returns:
+        (iterator): Dict of fields of every row.
+    """
+    model, fields, updated_field = EXPORTS[kind]
+    queryset = model.objects.all()
+    if since is not None:
+        queryset = queryset.filter(**{f"{updated_field}__gte": since})
+    return (
+        queryset
+        .order_by(updated_field, "id")
+        .values(*fields)
+        .iterator(chunk_size=chunk_size)
+    )
+
+
+def iter_ndjson(rows):
+    """
+    Encode rows as NDJSON lines, dates and times keep their microseconds so
+    they can be passed back as 'since' exactly.
+
+    Args:
+        rows (iterable): Dicts to be encoded.
+
+    Returns:
+        (iterator): One line of text per row.
+    """
+    encoder = CursorEncoder(separators=(",", ":"))
+    for row in rows:
+        yield encoder.encode(row) + "\n"
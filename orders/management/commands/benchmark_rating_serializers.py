@@ -0,0 +1,129 @@
+"""
+Management command to compare throughput of serializing Game ratings from
+model instances with ModelSerializer against serializing them from rows
+fetched with values_list(), with all fields or only requested ones, and
+size and time of rendering them with every available renderer.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from games.models import Game
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+
+from orders.api.renderers import (MessagePackRenderer, PackedJSONRenderer,
+                                  msgpack)
+from orders.api.serializers import GameRatingSerializer
+
+# pylint: disable=no-member, too-few-public-methods
+
+
+class ModelRatingSerializer(serializers.ModelSerializer):
+    """Serializer of Game ratings from model instances, used as baseline."""
+    class Meta:
+        """Changing default Serializer behaviour"""
+        model = Game
+        fields = ["id", "rating"]
+
+
+class Command(BaseCommand):
+    """
+    Create given number of Games inside a transaction which is rolled back
+    afterwards, then report items serialized per second by fetching and
+    serializing all of them with model instances, with rows and with rows of
+    only their IDs, followed by size of rendering all of them with every
+    renderer and time of serializing and rendering them.
+    """
+
+    help = "Benchmark ModelSerializer against row serializer of ratings."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, default=100000,
+            help="Number of Games serialized.",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=3,
+            help="Number of runs of each serializer, best one is reported.",
+        )
+
+    def _measure(self, serialize, repeat):
+        """Get shortest time in seconds taken by 'serialize' over runs."""
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            serialize()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    def handle(self, *args, **options):
+        rows = options["rows"]
+        with transaction.atomic():
+            Game.objects.bulk_create(
+                (
+                    Game(name=f"Benchmark game {number}", rating=number % 5 + 1)
+                    for number in range(rows)
+                ),
+                batch_size=1000,
+            )
+            games = Game.objects.order_by("-rating", "-id")[:rows]
+            results = {
+                "ModelSerializer": self._measure(
+                    lambda: ModelRatingSerializer(games.all(), many=True).data,
+                    options["repeat"],
+                ),
+                "Row serializer": self._measure(
+                    lambda: GameRatingSerializer(
+                        GameRatingSerializer.get_rows(games.all()), many=True
+                    ).data,
+                    options["repeat"],
+                ),
+                "Row serializer of IDs": self._measure(
+                    lambda: GameRatingSerializer(
+                        GameRatingSerializer.get_rows(games.all(), ("id",)),
+                        many=True,
+                        context={"row_fields": ("id",)},
+                    ).data,
+                    options["repeat"],
+                ),
+            }
+            rows_of_games = list(GameRatingSerializer.get_rows(games.all()))
+            transaction.set_rollback(True)
+
+        baseline = results["ModelSerializer"]
+        for name, seconds in results.items():
+            self.stdout.write(
+                f"{name}: {rows / seconds:,.0f} items/s "
+                f"({seconds:.3f}s, {baseline / seconds:.1f}x)"
+            )
+        self._benchmark_renderers(rows_of_games, options["repeat"])
+
+    def _benchmark_renderers(self, rows, repeat):
+        """
+        Report size of rows rendered with every renderer, along with time of
+        serializing and rendering them, rows are packed while serialized for
+        renderers which pack rows.
+        """
+        renderers = [JSONRenderer(), PackedJSONRenderer()]
+        if msgpack is not None:
+            renderers.append(MessagePackRenderer())
+        baseline_size = baseline_seconds = None
+        for renderer in renderers:
+            context = {"pack_rows": getattr(renderer, "packs_rows", False)}
+
+            def render(renderer=renderer, context=context):
+                return renderer.render(
+                    GameRatingSerializer(rows, many=True, context=context).data
+                )
+
+            size = len(render())
+            seconds = self._measure(render, repeat)
+            baseline_size = baseline_size or size
+            baseline_seconds = baseline_seconds or seconds
+            self.stdout.write(
+                f"{type(renderer).__name__}: {size:,} bytes "
+                f"({size / baseline_size:.0%}), {seconds:.3f}s "
+                f"({baseline_seconds / seconds:.1f}x)"
+            )
@@ -0,0 +1,46 @@
+"""Management command to export all reviews or ratings as NDJSON."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from orders.export import (DEFAULT_CHUNK_SIZE, EXPORTS, iter_export_rows,
+                           iter_ndjson, parse_since)
+
+
+class Command(BaseCommand):
+    """
+    Write all reviews, or ratings of all Sellers, Games or their pairs, as
+    NDJSON to a file or standard output, earliest changed first. Rows are
+    streamed in chunks, so memory used does not grow with their number.
+    """
+
+    help = "Export reviews or ratings as newline delimited JSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", choices=sorted(EXPORTS))
+        parser.add_argument(
+            "--since",
+            help="Export only rows changed at or after this ISO 8601 time.",
+        )
+        parser.add_argument(
+            "--output", default="-",
+            help="File to write rows to, standard output by default.",
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+            help="Number of rows fetched from database at once.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            since = parse_since(options["since"])
+        except ValueError as error:
+            raise CommandError(error) from error
+        lines = iter_ndjson(iter_export_rows(
+            options["kind"], since, options["chunk_size"]
+        ))
+        if options["output"] == "-":
+            for line in lines:
+                self.stdout.write(line, ending="")
+            return
+        with open(options["output"], "w", encoding="utf-8") as output_file:
+            output_file.writelines(lines)
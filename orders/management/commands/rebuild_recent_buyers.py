@@ -0,0 +1,52 @@
+"""Management command to rebuild recent buyers of every Seller."""
+
+from accounts.models import Seller
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from orders.models import SellerOrderStats
+from orders.stats import find_recent_buyers
+
+# pylint: disable=no-member
+
+
+class Command(BaseCommand):
+    """
+    Rebuild recent buyers of every Seller having orders from his order
+    history. Sellers are walked in chunks ordered by their ID.
+    """
+
+    help = "Rebuild recent buyers of every Seller from his orders."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size", type=int, default=1000,
+            help="Number of Sellers rebuilt in a single transaction.",
+        )
+
+    def handle(self, *args, **options):
+        last_id = 0
+        rebuilt = 0
+        while True:
+            seller_ids = list(
+                Seller.objects
+                .filter(id__gt=last_id, orders__isnull=False)
+                .distinct()
+                .order_by("id")
+                .values_list("id", flat=True)[:options["chunk_size"]]
+            )
+            if not seller_ids:
+                break
+            with transaction.atomic():
+                for seller_id in seller_ids:
+                    SellerOrderStats.objects.update_or_create(
+                        seller_id=seller_id,
+                        defaults={
+                            "recent_buyers": find_recent_buyers(seller_id)
+                        },
+                    )
+            rebuilt += len(seller_ids)
+            last_id = seller_ids[-1]
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt recent buyers of {rebuilt} Sellers")
+        )
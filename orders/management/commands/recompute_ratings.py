@@ -0,0 +1,113 @@
+"""Management command to rebuild ratings of all Sellers and Games."""
+
+import json
+import os
+
+from accounts.models import Seller
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from games.models import Game, SellerGame
+
+from orders.ratings import (RATED_COLLECTIONS, RATED_MODELS,
+                            get_rated_object_collections,
+                            get_rating_aggregate_fields,
+                            recompute_rating_aggregates)
+from orders.versions import bump_collection_versions
+
+# pylint: disable=no-member
+
+DEFAULT_CHECKPOINT_FILE = ".recompute_ratings_checkpoint.json"
+
+
+class Command(BaseCommand):
+    """
+    Rebuild rating aggregates of every Seller, Game and SellerGame pair from
+    their reviews, along with ranking scores of Sellers so that they can also
+    be refreshed after ranking settings are changed.
+
+    Objects are walked in chunks ordered by their ID, every chunk is written
+    back in its own transaction and ID of its last object is saved to a
+    checkpoint file, so an interrupted run continues from where it stopped.
+    """
+
+    help = "Rebuild ratings of all Sellers, Games and their pairs from reviews."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size", type=int, default=1000,
+            help="Number of objects rebuilt in a single transaction.",
+        )
+        parser.add_argument(
+            "--checkpoint", default=DEFAULT_CHECKPOINT_FILE,
+            help="File in which progress is saved to resume after a crash.",
+        )
+        parser.add_argument(
+            "--restart", action="store_true",
+            help="Ignore saved progress and start from the beginning.",
+        )
+
+    def _load_checkpoint(self, path, restart):
+        """Get ID of last rebuilt object of every model from checkpoint."""
+        if restart or not os.path.exists(path):
+            return {}
+        with open(path, encoding="utf-8") as checkpoint_file:
+            return json.load(checkpoint_file)
+
+    def _save_checkpoint(self, path, checkpoint):
+        """Atomically replace checkpoint file with current progress."""
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as checkpoint_file:
+            json.dump(checkpoint, checkpoint_file)
+        os.replace(temporary_path, path)
+
+    def _recompute_model(self, model, chunk_size, checkpoint, path):
+        """
+        Walk all objects of model in chunks after the last checkpointed ID
+        and write rebuilt aggregates of every chunk with a bulk update, then
+        bump versions of objects whose ratings changed.
+        """
+        name = model._meta.label_lower
+        lookup_fields = next(
+            lookup_fields
+            for rated_model, _, lookup_fields in RATED_MODELS
+            if rated_model is model
+        )
+        last_id = checkpoint.get(name, 0)
+        total = 0
+        while True:
+            versions = dict(
+                model.objects
+                .filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", "rating_version")[:chunk_size]
+            )
+            if not versions:
+                break
+            object_ids = list(versions)
+            with transaction.atomic():
+                objects = recompute_rating_aggregates(model, object_ids)
+                model.objects.bulk_update(
+                    objects, get_rating_aggregate_fields(model)
+                )
+            bump_collection_versions(*get_rated_object_collections(model, [
+                tuple(getattr(obj, field) for field in lookup_fields)
+                for obj in objects
+                if obj.rating_version != versions[obj.id]
+            ]))
+            last_id = object_ids[-1]
+            total += len(object_ids)
+            checkpoint[name] = last_id
+            self._save_checkpoint(path, checkpoint)
+        self.stdout.write(f"Rebuilt ratings of {total} objects of {name}")
+
+    def handle(self, *args, **options):
+        path = options["checkpoint"]
+        checkpoint = self._load_checkpoint(path, options["restart"])
+        for model in (Seller, Game, SellerGame):
+            self._recompute_model(
+                model, options["chunk_size"], checkpoint, path
+            )
+        if os.path.exists(path):
+            os.remove(path)
+        bump_collection_versions(*RATED_COLLECTIONS)
+        self.stdout.write(self.style.SUCCESS("Ratings rebuilt successfully"))
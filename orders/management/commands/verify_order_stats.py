@@ -0,0 +1,113 @@
+"""Management command to detect and repair drift of Seller order counters."""
+
+from accounts.models import Seller
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from orders.models import SellerOrderStats
+from orders.stats import ORDER_COUNT_FIELDS, count_orders_of_sellers
+
+# pylint: disable=no-member
+
+
+class Command(BaseCommand):
+    """
+    Compare order counters of every Seller with his actual orders and report
+    every Seller whose counters have drifted, optionally repairing them.
+
+    Sellers are walked in chunks ordered by their ID, orders of a whole chunk
+    are counted with a single grouped query.
+    """
+
+    help = "Detect, and optionally repair, drift of Seller order counters."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size", type=int, default=1000,
+            help="Number of Sellers verified at once.",
+        )
+        parser.add_argument(
+            "--repair", action="store_true",
+            help="Overwrite drifted counters with actual order counts.",
+        )
+
+    def _verify_chunk(self, seller_ids, repair):
+        """
+        Verify counters of given Sellers and repair them if asked.
+
+        Counters are locked before orders are counted, and missing ones are
+        created first when repairing so they are locked too, so an order
+        committed meanwhile is either counted or applies its change after
+        the repair, never being undone by it.
+
+        Returns:
+            (int): Number of Sellers whose counters have drifted.
+        """
+        with transaction.atomic():
+            if repair:
+                SellerOrderStats.objects.bulk_create(
+                    [
+                        SellerOrderStats(seller_id=seller_id)
+                        for seller_id in seller_ids
+                    ],
+                    ignore_conflicts=True,
+                )
+            stats_of_sellers = {
+                stats.seller_id: stats
+                for stats in (
+                    SellerOrderStats.objects
+                    .select_for_update()
+                    .filter(seller_id__in=seller_ids)
+                    .order_by("seller_id")
+                )
+            }
+            actual_counts = count_orders_of_sellers(seller_ids)
+            drifted_stats = []
+            for seller_id, counts in actual_counts.items():
+                stats = stats_of_sellers.get(seller_id)
+                if stats is None:
+                    if not counts["total_orders"]:
+                        continue
+                    stats = SellerOrderStats(seller_id=seller_id)
+                elif all(
+                    getattr(stats, field) == count
+                    for field, count in counts.items()
+                ):
+                    continue
+                drifted_stats.append(stats)
+                self.stdout.write(
+                    f"Seller {seller_id}: expected {counts}, found "
+                    f"{ {field: getattr(stats, field) for field in counts} }"
+                )
+                for field, count in counts.items():
+                    setattr(stats, field, count)
+            if repair:
+                SellerOrderStats.objects.bulk_update(
+                    drifted_stats, ORDER_COUNT_FIELDS
+                )
+        return len(drifted_stats)
+
+    def handle(self, *args, **options):
+        last_id = 0
+        drifted = 0
+        while True:
+            seller_ids = list(
+                Seller.objects
+                .filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", flat=True)[:options["chunk_size"]]
+            )
+            if not seller_ids:
+                break
+            drifted += self._verify_chunk(seller_ids, options["repair"])
+            last_id = seller_ids[-1]
+        if not drifted:
+            self.stdout.write(self.style.SUCCESS("No drift found"))
+        elif options["repair"]:
+            self.stdout.write(
+                self.style.SUCCESS(f"Repaired counters of {drifted} Sellers")
+            )
+        else:
+            self.stdout.write(
+                self.style.WARNING(f"Counters of {drifted} Sellers drifted")
+            )
@@ -0,0 +1,43 @@
+# Generated by Django 3.2.25 on 2026-10-18 15:20
+
+from django.db import migrations
+from django.db.models import Count, Sum
+
+
+def _backfill(model, reviews, key):
+    """Set running totals and average rating of every reviewed object."""
+    totals = (
+        reviews
+        .values(key)
+        .annotate(rating_sum=Sum("rating"), rating_count=Count("id"))
+    )
+    for total in totals:
+        model.objects.filter(id=total[key]).update(
+            rating_sum=total["rating_sum"],
+            rating_count=total["rating_count"],
+            rating=total["rating_sum"] / total["rating_count"],
+        )
+
+
+def backfill_rating_aggregates(apps, schema_editor):
+    """Fill running rating totals of Sellers and Games from existing reviews."""
+    reviews = apps.get_model("orders", "Review").objects.filter(
+        order__isnull=False
+    ).order_by()
+    _backfill(apps.get_model("accounts", "Seller"), reviews, "order__seller_id")
+    _backfill(apps.get_model("games", "Game"), reviews, "order__game_id")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0029_auto_20261018_2018'),
+        ('games', '0021_auto_20261018_2018'),
+        ('orders', '0013_alter_order_status'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_rating_aggregates, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 3.2.25 on 2026-10-18 15:40
+
+from django.db import migrations
+from django.db.models import Count, Sum
+
+
+def backfill_seller_game_ratings(apps, schema_editor):
+    """Fill rating aggregates of every SellerGame pair from existing reviews."""
+    SellerGame = apps.get_model("games", "SellerGame")
+    totals = (
+        apps.get_model("orders", "Review").objects
+        .filter(order__isnull=False)
+        .order_by()
+        .values("order__seller_id", "order__game_id")
+        .annotate(rating_sum=Sum("rating"), rating_count=Count("id"))
+    )
+    for total in totals:
+        SellerGame.objects.filter(
+            seller_id=total["order__seller_id"],
+            game_id=total["order__game_id"],
+        ).update(
+            rating_sum=total["rating_sum"],
+            rating_count=total["rating_count"],
+            rating=total["rating_sum"] / total["rating_count"],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0022_auto_20261018_2019'),
+        ('orders', '0014_backfill_rating_aggregates'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_seller_game_ratings, migrations.RunPython.noop
+        ),
+    ]
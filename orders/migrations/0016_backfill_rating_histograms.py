@@ -0,0 +1,63 @@
+# Generated by Django 3.2.25 on 2026-10-18 16:05
+
+from django.db import migrations
+from django.db.models import Count, Q
+
+HISTOGRAM_FILTERS = {
+    "one_star_count": Q(rating__lt=1.5),
+    "two_star_count": Q(rating__gte=1.5, rating__lt=2.5),
+    "three_star_count": Q(rating__gte=2.5, rating__lt=3.5),
+    "four_star_count": Q(rating__gte=3.5, rating__lt=4.5),
+    "five_star_count": Q(rating__gte=4.5),
+}
+
+
+def _backfill(model, reviews, review_keys, lookup_fields):
+    """Set star counts of every reviewed object."""
+    totals = (
+        reviews
+        .values(*review_keys)
+        .annotate(**{
+            field: Count("id", filter=condition)
+            for field, condition in HISTOGRAM_FILTERS.items()
+        })
+    )
+    for total in totals:
+        model.objects.filter(**{
+            lookup_field: total[review_key]
+            for lookup_field, review_key in zip(lookup_fields, review_keys)
+        }).update(**{field: total[field] for field in HISTOGRAM_FILTERS})
+
+
+def backfill_rating_histograms(apps, schema_editor):
+    """Fill star counts of Sellers, Games and their pairs from reviews."""
+    reviews = apps.get_model("orders", "Review").objects.filter(
+        order__isnull=False
+    ).order_by()
+    _backfill(
+        apps.get_model("accounts", "Seller"), reviews,
+        ("order__seller_id",), ("id",)
+    )
+    _backfill(
+        apps.get_model("games", "Game"), reviews,
+        ("order__game_id",), ("id",)
+    )
+    _backfill(
+        apps.get_model("games", "SellerGame"), reviews,
+        ("order__seller_id", "order__game_id"), ("seller_id", "game_id")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0030_auto_20261018_2021'),
+        ('games', '0023_auto_20261018_2021'),
+        ('orders', '0015_backfill_seller_game_ratings'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            backfill_rating_histograms, migrations.RunPython.noop
+        ),
+    ]
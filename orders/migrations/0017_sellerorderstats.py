@@ -0,0 +1,65 @@
+# Generated by Django 3.2.25 on 2026-10-18 15:25
+
+from django.db import migrations, models
+from django.db.models import Count
+import django.db.models.deletion
+
+STATUS_COUNT_FIELDS = {
+    "at": "active_orders",
+    "cp": "completed_orders",
+    "dl": "delivered_orders",
+    "cd": "canceled_orders",
+    "lt": "late_orders",
+}
+
+
+def backfill_seller_order_stats(apps, schema_editor):
+    """Create order counters of every Seller having orders."""
+    SellerOrderStats = apps.get_model("orders", "SellerOrderStats")
+    stats = {}
+    status_counts = (
+        apps.get_model("orders", "Order").objects
+        .order_by()
+        .values("seller_id", "status")
+        .annotate(number_of_orders=Count("id"))
+    )
+    for status_count in status_counts:
+        seller_stats = stats.setdefault(
+            status_count["seller_id"],
+            SellerOrderStats(seller_id=status_count["seller_id"])
+        )
+        seller_stats.total_orders += status_count["number_of_orders"]
+        field = STATUS_COUNT_FIELDS.get(status_count["status"])
+        if field:
+            setattr(
+                seller_stats, field,
+                getattr(seller_stats, field) + status_count["number_of_orders"]
+            )
+    SellerOrderStats.objects.bulk_create(stats.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0031_auto_20261018_2022'),
+        ('orders', '0016_backfill_rating_histograms'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SellerOrderStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_orders', models.PositiveIntegerField(default=0, verbose_name='Total orders')),
+                ('active_orders', models.PositiveIntegerField(default=0, verbose_name='Active orders')),
+                ('completed_orders', models.PositiveIntegerField(default=0, verbose_name='Completed orders')),
+                ('delivered_orders', models.PositiveIntegerField(default=0, verbose_name='Delivered orders')),
+                ('canceled_orders', models.PositiveIntegerField(default=0, verbose_name='Canceled orders')),
+                ('late_orders', models.PositiveIntegerField(default=0, verbose_name='Late orders')),
+                ('seller', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='order_stats', to='accounts.seller')),
+            ],
+        ),
+        migrations.RunPython(
+            backfill_seller_order_stats, migrations.RunPython.noop
+        ),
+    ]
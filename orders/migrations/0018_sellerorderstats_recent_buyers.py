@@ -0,0 +1,38 @@
+# Generated by Django 3.2.25 on 2026-10-18 15:27
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def backfill_recent_buyers(apps, schema_editor):
+    """Fill recent buyers of every Seller having order counters."""
+    Order = apps.get_model("orders", "Order")
+    SellerOrderStats = apps.get_model("orders", "SellerOrderStats")
+    for stats in SellerOrderStats.objects.only("id", "seller_id").iterator():
+        stats.recent_buyers = list(
+            Order.objects
+            .filter(seller_id=stats.seller_id)
+            .values("buyer__user__user_name")
+            .annotate(last_order_time=Max("order_start_time"))
+            .order_by("-last_order_time")
+            .values_list("buyer__user__user_name", flat=True)
+            [:settings.SELLER_RECENT_BUYERS_LIMIT]
+        )
+        stats.save(update_fields=["recent_buyers"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0017_sellerorderstats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sellerorderstats',
+            name='recent_buyers',
+            field=models.JSONField(blank=True, default=list, verbose_name='User names of recent buyers'),
+        ),
+        migrations.RunPython(backfill_recent_buyers, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-18 15:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0018_sellerorderstats_recent_buyers'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['buyer', '-order_start_time', '-id'], name='buyer_order_time_idx'),
+        ),
+    ]
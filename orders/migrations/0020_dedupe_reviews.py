@@ -0,0 +1,117 @@
+# Generated by Django 3.2.25 on 2026-10-18 16:10
+
+from django.conf import settings
+from django.db import migrations
+from django.db.models import Count, Max
+from django.utils import timezone
+
+HISTOGRAM_FIELDS = (
+    "one_star_count",
+    "two_star_count",
+    "three_star_count",
+    "four_star_count",
+    "five_star_count",
+)
+FIVE_STAR = 5
+
+
+def _rebuild(objects, ratings_of, is_seller):
+    """Rebuild rating aggregates of objects from their remaining ratings."""
+    updated_at = timezone.now()
+    for obj in objects:
+        ratings = ratings_of(obj)
+        obj.rating_sum = sum(ratings)
+        obj.rating_count = len(ratings)
+        obj.rating = (
+            obj.rating_sum / obj.rating_count
+            if obj.rating_count else float(FIVE_STAR)
+        )
+        for field in HISTOGRAM_FIELDS:
+            setattr(obj, field, 0)
+        for rating in ratings:
+            star = min(max(int(rating + 0.5), 1), len(HISTOGRAM_FIELDS))
+            field = HISTOGRAM_FIELDS[star - 1]
+            setattr(obj, field, getattr(obj, field) + 1)
+        if is_seller:
+            weight = settings.SELLER_RANKING_PRIOR_WEIGHT
+            obj.ranking_score = (
+                obj.rating_sum + settings.SELLER_RANKING_PRIOR_RATING * weight
+            ) / (obj.rating_count + weight)
+        obj.rating_version += 1
+        obj.rating_updated_at = updated_at
+        obj.save()
+
+
+def dedupe_reviews(apps, schema_editor):
+    """
+    Keep only the latest Review of every Order and rebuild ratings of
+    Sellers, Games and their pairs which deleted Reviews counted towards.
+    """
+    Review = apps.get_model("orders", "Review")
+    duplicated = (
+        Review.objects
+        .filter(order__isnull=False)
+        .values("order_id")
+        .annotate(reviews=Count("id"), latest_id=Max("id"))
+        .filter(reviews__gt=1)
+        .order_by()
+    )
+    affected_pairs = set()
+    for duplicate in duplicated:
+        stale_reviews = Review.objects.filter(
+            order_id=duplicate["order_id"]
+        ).exclude(id=duplicate["latest_id"])
+        affected_pairs.update(
+            stale_reviews.values_list("order__seller_id", "order__game_id")
+        )
+        stale_reviews.delete()
+    if not affected_pairs:
+        return
+
+    reviews = Review.objects.filter(order__isnull=False)
+    seller_ids = {seller_id for seller_id, _ in affected_pairs}
+    game_ids = {game_id for _, game_id in affected_pairs}
+    _rebuild(
+        apps.get_model("accounts", "Seller").objects.filter(id__in=seller_ids),
+        lambda seller: list(
+            reviews.filter(order__seller_id=seller.id)
+            .values_list("rating", flat=True)
+        ),
+        is_seller=True,
+    )
+    _rebuild(
+        apps.get_model("games", "Game").objects.filter(id__in=game_ids),
+        lambda game: list(
+            reviews.filter(order__game_id=game.id)
+            .values_list("rating", flat=True)
+        ),
+        is_seller=False,
+    )
+    _rebuild(
+        [
+            seller_game
+            for seller_game in apps.get_model("games", "SellerGame").objects
+            .filter(seller_id__in=seller_ids, game_id__in=game_ids)
+            if (seller_game.seller_id, seller_game.game_id) in affected_pairs
+        ],
+        lambda seller_game: list(
+            reviews.filter(
+                order__seller_id=seller_game.seller_id,
+                order__game_id=seller_game.game_id,
+            ).values_list("rating", flat=True)
+        ),
+        is_seller=False,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0033_auto_20261018_2039'),
+        ('games', '0027_auto_20261018_2039'),
+        ('orders', '0019_order_buyer_order_time_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(dedupe_reviews, migrations.RunPython.noop),
+    ]
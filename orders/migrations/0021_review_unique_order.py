@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-18 15:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0020_dedupe_reviews'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='review',
+            constraint=models.UniqueConstraint(fields=('order',), name='unique_review_per_order'),
+        ),
+    ]
@@ -9,13 +9,15 @@ import datetime
 
 from accounts.constants import FIVE_STAR
 from accounts.models import Buyer, Seller
-from django.db import models
-from django.db.models.aggregates import Avg
-from django.db.models.fields.related import ForeignKey
+from django.db import models, transaction
+from django.db.models.fields.related import ForeignKey, OneToOneField
 from django.utils import timezone
 from django.utils.translation import gettext as _
 from games.models import Game
 
+from orders.ratings import RatingChange, apply_rating_changes
+from orders.stats import OrderChange, apply_order_changes, record_recent_buyer
+
 
 class Order(models.Model):
     """
@@ -61,6 +63,80 @@ class Order(models.Model):
         default=Status.ACTIVE
     )
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["buyer", "-order_start_time", "-id"],
+                name="buyer_order_time_idx",
+            ),
+        ]
+
+    def _get_saved_order(self):
+        """
+        Lock this order and get Seller, Game and status it currently holds in
+        database, so they can be taken back before saving.
+
+        Returns:
+            (tuple): Seller ID, Game ID and status, None if this order is not
+                saved yet.
+        """
+        if self._state.adding or self.pk is None:
+            return None
+        return (
+            Order.objects
+            .select_for_update()
+            .filter(id=self.pk)
+            .values_list("seller_id", "game_id", "status")
+            .first()
+        )
+
+    def _move_review_rating(self, saved_seller_id, saved_game_id):
+        """
+        Move rating of review of this order from Seller and Game it was saved
+        with to its current ones, after either of them has been changed.
+        """
+        rating = (
+            Review.objects
+            .filter(order_id=self.pk)
+            .values_list("rating", flat=True)
+            .first()
+        )
+        if rating is None:
+            return
+        apply_rating_changes([
+            RatingChange(
+                saved_seller_id, saved_game_id, added=None, removed=rating
+            ),
+            RatingChange(self.seller_id, self.game_id, added=rating, removed=None),
+        ])
+
+    def save(self, *args, **kwargs):
+        """
+        After saving this order, order counters of its Seller are updated by
+        the difference this order makes to them, and Buyer of a new order
+        becomes most recent buyer of its Seller. If Seller or Game of a
+        reviewed order is changed, rating of its review is moved to them.
+        """
+        with transaction.atomic():
+            changes = []
+            saved_order = self._get_saved_order()
+            if saved_order:
+                saved_seller_id, saved_game_id, saved_status = saved_order
+                changes.append(
+                    OrderChange(saved_seller_id, added=None, removed=saved_status)
+                )
+            super().save(*args, **kwargs)
+            changes.append(
+                OrderChange(self.seller_id, added=self.status, removed=None)
+            )
+            apply_order_changes(changes)
+            if not saved_order:
+                record_recent_buyer(self.seller_id, self.buyer_id)
+            elif (saved_seller_id, saved_game_id) != (
+                self.seller_id, self.game_id
+            ):
+                self._move_review_rating(saved_seller_id, saved_game_id)
+
     @property
     def get_remaining_time_for_order_delivery(self):
         """
@@ -94,6 +170,30 @@ class Order(models.Model):
         return f"{self.id}_{self.status}"
 
 
+class SellerOrderStats(models.Model):
+    """
+    Number of orders of a Seller in total and by their status, along with
+    user names of his last few distinct buyers, most recent first. They are
+    maintained on every order write so that they never have to be queried
+    from orders.
+    """
+    seller = OneToOneField(
+        Seller, related_name="order_stats", on_delete=models.CASCADE
+    )
+    total_orders = models.PositiveIntegerField("Total orders", default=0)
+    active_orders = models.PositiveIntegerField("Active orders", default=0)
+    completed_orders = models.PositiveIntegerField("Completed orders", default=0)
+    delivered_orders = models.PositiveIntegerField("Delivered orders", default=0)
+    canceled_orders = models.PositiveIntegerField("Canceled orders", default=0)
+    late_orders = models.PositiveIntegerField("Late orders", default=0)
+    recent_buyers = models.JSONField(
+        "User names of recent buyers", default=list, blank=True
+    )
+
+    def __str__(self):
+        return f"{self.seller_id}_{self.total_orders}"
+
+
 class Review(models.Model):
     """
     This class defines a Review and relation formed based on review of buyer,
@@ -106,50 +206,69 @@ class Review(models.Model):
         "Review Comment", max_length=500, blank=True, default=""
     )
     rating = models.FloatField("Rating", default=FIVE_STAR)
+    updated_at = models.DateTimeField(auto_now=True)
 
-    def _update_rating_of_seller_of_this_order(self):
-        """
-        Get all orders rating for seller of this order, find average and set it
-        as this seller overall rating.
-        """
-        average_rating_of_current_seller = (
-            Seller.objects
-            .filter(id=self.order.seller.id)
-            .aggregate(avg_rating=Avg("orders__review__rating"))
-        )
-        average_rating_of_current_seller = average_rating_of_current_seller.get(
-            'avg_rating'
-        )
-        if average_rating_of_current_seller:
-            self.order.seller.rating = average_rating_of_current_seller
-        else:
-            self.order.seller.rating = self.rating
-        self.order.seller.save()
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["order"], name="unique_review_per_order"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["updated_at", "id"], name="review_updated_idx"
+            ),
+        ]
 
-    def _update_rating_of_game_of_this_order(self):
+    def _get_saved_rating_change(self):
         """
-        Get all orders rating for game of this order, find average and set it
-        as this game overall rating.
+        Get rating this review currently holds in database along with Seller
+        and Game it counts towards, so it can be taken back before saving.
+
+        Returns:
+            RatingChange: Change removing saved rating, None if this review
+                is not saved yet.
         """
-        average_rating_of_current_game = (
-            Game.objects
-            .filter(id=self.order.game.id)
-            .aggregate(avg_rating=Avg("orders__review__rating"))
-        )
-        average_rating_of_current_game = average_rating_of_current_game.get(
-            'avg_rating'
+        if self._state.adding or self.pk is None:
+            return None
+        saved_review = (
+            Review.objects
+            .select_for_update(of=("self",))
+            .filter(id=self.pk)
+            .values_list("rating", "order__seller_id", "order__game_id")
+            .first()
         )
-        if average_rating_of_current_game:
-            self.order.game.rating = average_rating_of_current_game
-        else:
-            self.order.game.rating = self.rating
-        self.order.game.save()
+        if not saved_review:
+            return None
+        rating, seller_id, game_id = saved_review
+        return RatingChange(seller_id, game_id, added=None, removed=rating)
 
     def save(self, *args, **kwargs):
         """
-        After saving review for current order, All review ratings of orders
-        for game and seller of this order are updated
+        After saving review for current order, ratings of game and seller of
+        this order, and of this seller for this game, are updated by the
+        difference this review makes. Order is locked first, as it is by
+        'upsert_reviews', so that review writes of an Order never interleave.
         """
-        super().save(*args, **kwargs)
-        self._update_rating_of_game_of_this_order()
-        self._update_rating_of_seller_of_this_order()
+        with transaction.atomic():
+            seller_and_game = None
+            if self.order_id:
+                seller_and_game = (
+                    Order.objects
+                    .select_for_update()
+                    .filter(id=self.order_id)
+                    .values_list("seller_id", "game_id")
+                    .first()
+                )
+            changes = []
+            saved_change = self._get_saved_rating_change()
+            if saved_change:
+                changes.append(saved_change)
+            super().save(*args, **kwargs)
+            if seller_and_game:
+                changes.append(
+                    RatingChange(
+                        *seller_and_game, added=self.rating, removed=None
+                    )
+                )
+            apply_rating_changes(changes)
@@ -0,0 +1,373 @@
+"""
+This module keeps rating aggregates of Sellers and Games up to date whenever
+a Review is created, updated or deleted.
+
+Instead of averaging every review of a Seller or Game on each write, running
+totals and star counts are adjusted by the difference a review write makes,
+so the cost of a write does not grow with the number of reviews.
+"""
+
+# pylint: disable=no-member
+
+from collections import Counter, defaultdict, namedtuple
+
+from accounts.constants import FIVE_STAR
+from accounts.models import RatingAggregate, Seller
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import (Case, Count, ExpressionWrapper, F, FloatField, Q,
+                              Sum, Value, When)
+from django.utils import timezone
+from games.models import Game, SellerGame
+
+from orders.versions import (GAMES, SELLER_GAMES, SELLERS,
+                             bump_collection_versions, get_object_collection)
+
+HISTOGRAM_FIELDS = RatingAggregate.HISTOGRAM_FIELDS
+RATING_AGGREGATE_FIELDS = (
+    "rating", "rating_sum", "rating_count", *HISTOGRAM_FIELDS
+)
+RATING_VERSION_FIELDS = ("rating_version", "rating_updated_at")
+
+# Models keeping rating aggregates, along with RatingChange attributes which
+# identify their rows and fields of the model which those attributes match.
+RATED_MODELS = (
+    (Seller, ("seller_id",), ("id",)),
+    (Game, ("game_id",), ("id",)),
+    (SellerGame, ("seller_id", "game_id"), ("seller_id", "game_id")),
+)
+
+# Collections listing ratings of RATED_MODELS, in the same order.
+RATED_COLLECTIONS = (SELLERS, GAMES, SELLER_GAMES)
+
+RatingChange = namedtuple(
+    "RatingChange", ["seller_id", "game_id", "added", "removed"]
+)
+RatingChange.__doc__ = """
+Describes how a single review write changes ratings of a Seller and a Game.
+
+'added' is the rating which now counts towards them and 'removed' is the
+rating which no longer does, any of them can be None.
+"""
+
+
+def get_ranking_score(rating_sum, rating_count):
+    """
+    Confidence adjusted rating, which is average rating after adding
+    SELLER_RANKING_PRIOR_WEIGHT reviews of SELLER_RANKING_PRIOR_RATING to
+    actual reviews. It works both on numbers and on query expressions.
+
+    Args:
+        rating_sum: Sum of all review ratings.
+        rating_count: Number of all reviews.
+
+    Returns:
+        Ranking score, or expression computing it.
+    """
+    weight = settings.SELLER_RANKING_PRIOR_WEIGHT
+    prior_total = settings.SELLER_RANKING_PRIOR_RATING * weight
+    return (rating_sum + prior_total) / (rating_count + weight)
+
+
+def get_rating_aggregate_fields(model):
+    """
+    Get names of all fields of model which are derived from its reviews,
+    along with version stamps of them.
+
+    Returns:
+        (tuple): Rating aggregate field names of model.
+    """
+    fields = (*RATING_AGGREGATE_FIELDS, *RATING_VERSION_FIELDS)
+    if model is Seller:
+        return (*fields, "ranking_score")
+    return fields
+
+
+def get_histogram_field(rating):
+    """
+    Get name of the star count field a rating is counted in, ratings are
+    rounded half up to the nearest star from one to five.
+
+    Args:
+        rating (float): Rating of a review.
+
+    Returns:
+        (str): Name of one of the star count fields.
+    """
+    star = min(max(int(rating + 0.5), 1), len(HISTOGRAM_FIELDS))
+    return HISTOGRAM_FIELDS[star - 1]
+
+
+def get_histogram_filters(prefix=""):
+    """
+    Get conditions matching reviews counted in every star count field.
+
+    Args:
+        prefix (str): Lookup path from queried model to review rating.
+
+    Returns:
+        (dict): Star count field mapped to condition on review rating.
+    """
+    filters = {}
+    last_star = len(HISTOGRAM_FIELDS)
+    for star, field in enumerate(HISTOGRAM_FIELDS, start=1):
+        condition = Q()
+        if star > 1:
+            condition &= Q(**{f"{prefix}rating__gte": star - 0.5})
+        if star < last_star:
+            condition &= Q(**{f"{prefix}rating__lt": star + 0.5})
+        filters[field] = condition
+    return filters
+
+
+class _Delta:
+    """Difference a set of review writes makes to a single rated object."""
+
+    def __init__(self):
+        self.rating = 0.0
+        self.count = 0
+        self.histogram = Counter()
+
+    def add(self, rating, sign):
+        """Count rating in this delta as added (1) or removed (-1)."""
+        self.rating += sign * rating
+        self.count += sign
+        self.histogram[get_histogram_field(rating)] += sign
+
+    def is_empty(self):
+        """Check if this delta would leave its object unchanged."""
+        return (
+            not self.rating and not self.count
+            and not any(self.histogram.values())
+        )
+
+
+def _collect_deltas(changes, key_fields):
+    """
+    Sum up differences of all changes per object.
+
+    Args:
+        changes (list): RatingChange objects to be summed up.
+        key_fields (tuple): Names of RatingChange attributes which together
+            identify an object.
+
+    Returns:
+        (dict): Tuple of key values mapped to their _Delta.
+    """
+    deltas = defaultdict(_Delta)
+    for change in changes:
+        key = tuple(getattr(change, field) for field in key_fields)
+        if None in key:
+            continue
+        if change.added is not None:
+            deltas[key].add(change.added, 1)
+        if change.removed is not None:
+            deltas[key].add(change.removed, -1)
+    return deltas
+
+
+def get_rated_object_collections(model, keys):
+    """
+    Get collections of single rated objects, whose versions are bumped along
+    with collection listing them when their ratings change.
+
+    Args:
+        model (Model): Either Seller, Game or SellerGame.
+        keys (iterable): Tuples of values of lookup fields of objects, ID of
+            a Seller or Game and seller and game IDs of a SellerGame.
+
+    Returns:
+        (list): Names of collections of objects.
+    """
+    collection = next(
+        collection
+        for (rated_model, *_), collection in zip(RATED_MODELS, RATED_COLLECTIONS)
+        if rated_model is model
+    )
+    return [get_object_collection(collection, *key) for key in keys]
+
+
+def _get_rating_update_fields(model, delta, updated_at):
+    """
+    Build update expressions which move running totals and star counts by
+    given delta and derive new average rating, and ranking score of Sellers,
+    from them within the same UPDATE statement, which also bumps version of
+    rating.
+
+    Returns:
+        (dict): Field names mapped to their update expressions.
+    """
+    new_sum = F("rating_sum") + delta.rating
+    new_count = F("rating_count") + delta.count
+    fields = {
+        "rating_sum": new_sum,
+        "rating_count": new_count,
+        "rating_version": F("rating_version") + 1,
+        "rating_updated_at": updated_at,
+        "rating": Case(
+            When(rating_count=-delta.count, then=Value(float(FIVE_STAR))),
+            default=ExpressionWrapper(
+                new_sum / new_count, output_field=FloatField()
+            ),
+            output_field=FloatField(),
+        ),
+    }
+    if model is Seller:
+        fields["ranking_score"] = ExpressionWrapper(
+            get_ranking_score(new_sum, new_count), output_field=FloatField()
+        )
+    for field, count in delta.histogram.items():
+        if count:
+            fields[field] = F(field) + count
+    return fields
+
+
+def _apply_deltas(model, lookup_fields, deltas):
+    """
+    Apply collected deltas to every affected row of given model.
+
+    Args:
+        model (Model): Model whose rows are updated.
+        lookup_fields (tuple): Model fields matching values of delta keys.
+        deltas (dict): Deltas collected by '_collect_deltas'.
+
+    Returns:
+        (list): Keys of rows which were updated.
+    """
+    updated_at = timezone.now()
+    updated_keys = []
+    for key, delta in deltas.items():
+        if delta.is_empty():
+            continue
+        model.objects.filter(**dict(zip(lookup_fields, key))).update(
+            **_get_rating_update_fields(model, delta, updated_at)
+        )
+        updated_keys.append(key)
+    return updated_keys
+
+
+def apply_rating_changes(changes):
+    """
+    Update rating aggregates of all Sellers, Games and their SellerGame pairs
+    affected by changes, every affected row is updated only once.
+
+    It should be called inside the same transaction as the review write,
+    versions of rating collections and of every updated object are bumped
+    once it is committed.
+
+    Args:
+        changes (list): RatingChange objects describing review writes.
+    """
+    collections = list(RATED_COLLECTIONS)
+    for model, key_fields, lookup_fields in RATED_MODELS:
+        updated_keys = _apply_deltas(
+            model, lookup_fields, _collect_deltas(changes, key_fields)
+        )
+        collections += get_rated_object_collections(model, updated_keys)
+    transaction.on_commit(lambda: bump_collection_versions(*collections))
+
+
+def recompute_rating_aggregates(model, object_ids):
+    """
+    Rebuild rating aggregates of given Sellers, Games or SellerGame pairs from
+    their reviews, reviews of all given objects are summed up in a single
+    grouped query.
+
+    It has to be called inside a transaction, objects are locked before
+    their reviews are summed up and stay locked until rebuilt aggregates are
+    saved, so no rating change applied meanwhile can be overwritten.
+
+    Args:
+        model (Model): Either Seller, Game or SellerGame.
+        object_ids (list): IDs of objects whose aggregates are rebuilt.
+
+    Returns:
+        (list): Objects with rebuilt aggregates, along with ranking score of
+            Sellers and bumped version of changed ones, they are not saved
+            yet.
+    """
+    key_fields, lookup_fields = next(
+        (key_fields, lookup_fields)
+        for rated_model, key_fields, lookup_fields in RATED_MODELS
+        if rated_model is model
+    )
+    objects = list(
+        model.objects
+        .select_for_update()
+        .filter(id__in=object_ids)
+        .only(*lookup_fields, *get_rating_aggregate_fields(model))
+        .order_by("id")
+    )
+    object_keys = {
+        obj.id: tuple(getattr(obj, field) for field in lookup_fields)
+        for obj in objects
+    }
+    review_keys = [f"order__{field}" for field in key_fields]
+    reviews = apps.get_model("orders", "Review").objects.order_by()
+    for index, review_key in enumerate(review_keys):
+        reviews = reviews.filter(**{
+            f"{review_key}__in": {key[index] for key in object_keys.values()}
+        })
+    star_counts = {
+        field: Count("id", filter=condition)
+        for field, condition in get_histogram_filters().items()
+    }
+    totals = {
+        tuple(total[review_key] for review_key in review_keys): total
+        for total in (
+            reviews
+            .values(*review_keys)
+            .annotate(
+                rating_sum=Sum("rating"),
+                rating_count=Count("id"),
+                **star_counts
+            )
+        )
+    }
+    empty_total = dict.fromkeys(RATING_AGGREGATE_FIELDS, 0)
+    updated_at = timezone.now()
+    for obj in objects:
+        saved = [getattr(obj, field) for field in RATING_AGGREGATE_FIELDS]
+        total = totals.get(object_keys[obj.id], empty_total)
+        for field in RATING_AGGREGATE_FIELDS:
+            setattr(obj, field, total.get(field, 0))
+        if obj.rating_count:
+            obj.rating = obj.rating_sum / obj.rating_count
+        else:
+            obj.rating = float(FIVE_STAR)
+        if model is Seller:
+            obj.ranking_score = get_ranking_score(
+                obj.rating_sum, obj.rating_count
+            )
+        if saved != [getattr(obj, field) for field in RATING_AGGREGATE_FIELDS]:
+            obj.rating_version += 1
+            obj.rating_updated_at = updated_at
+    return objects
+
+
+def seed_seller_game_ratings(seller_game_ids):
+    """
+    Rebuild ratings of newly created SellerGames from reviews their Sellers
+    have already received for their Games, e.g. if a Seller offers a Game
+    again after he stopped offering it, so later review writes and deletes
+    adjust rating which counts those reviews.
+
+    Args:
+        seller_game_ids (list): IDs of created SellerGames.
+
+    Returns:
+        (list): SellerGames whose rating was changed and saved.
+    """
+    with transaction.atomic():
+        seller_games = [
+            seller_game
+            for seller_game in recompute_rating_aggregates(
+                SellerGame, seller_game_ids
+            )
+            if seller_game.rating_count
+        ]
+        SellerGame.objects.bulk_update(
+            seller_games, get_rating_aggregate_fields(SellerGame)
+        )
+    return seller_games
@@ -0,0 +1,154 @@
+"""
+This module writes reviews of many Orders at once, every review is inserted
+or updated in a single upsert and rating aggregates of all Sellers, Games
+and their pairs are updated once for the whole batch.
+"""
+
+# pylint: disable=no-member
+
+from collections import namedtuple
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from orders.models import Order, Review
+from orders.ratings import RatingChange, apply_rating_changes
+from orders.versions import (REVIEWS, bump_collection_versions,
+                             get_object_collection)
+
+ReviewWrite = namedtuple("ReviewWrite", ["order", "rating", "comment"])
+ReviewWrite.__doc__ = """
+Review to be written for an Order, which is replaced if it already has one.
+"""
+
+
+def _upsert_with_on_conflict(writes, updated_at):
+    """
+    Insert or update reviews with a single INSERT ... ON CONFLICT statement
+    of PostgreSQL.
+
+    Returns:
+        (dict): Order ID mapped to ID and update time of its review.
+    """
+    table = Review._meta.db_table
+    order_column = Review._meta.get_field("order").column
+    rows = ", ".join(["(%s, %s, %s, %s)"] * len(writes))
+    params = [
+        value
+        for write in writes
+        for value in (write.order.id, write.rating, write.comment, updated_at)
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} ({order_column}, rating, comment, updated_at) "
+            f"VALUES {rows} "
+            f"ON CONFLICT ({order_column}) DO UPDATE "
+            "SET rating = EXCLUDED.rating, comment = EXCLUDED.comment, "
+            "updated_at = EXCLUDED.updated_at "
+            f"RETURNING {order_column}, id, updated_at",
+            params,
+        )
+        return {
+            order_id: (review_id, review_updated_at)
+            for order_id, review_id, review_updated_at in cursor.fetchall()
+        }
+
+
+def _upsert_with_orm(writes, saved_reviews, updated_at):
+    """
+    Update existing reviews with a single bulk update and create missing
+    ones with a single bulk insert.
+
+    Returns:
+        (dict): Order ID mapped to ID and update time of its review.
+    """
+    created, updated = [], []
+    for write in writes:
+        saved_review = saved_reviews.get(write.order.id)
+        review = Review(
+            id=saved_review and saved_review[0],
+            order_id=write.order.id,
+            rating=write.rating,
+            comment=write.comment,
+            updated_at=updated_at,
+        )
+        (updated if saved_review else created).append(review)
+    Review.objects.bulk_update(updated, ["rating", "comment", "updated_at"])
+    Review.objects.bulk_create(created)
+    if created and created[0].id is None:
+        created_ids = dict(
+            Review.objects
+            .filter(order_id__in=[review.order_id for review in created])
+            .values_list("order_id", "id")
+        )
+        for review in created:
+            review.id = created_ids[review.order_id]
+    return {
+        review.order_id: (review.id, review.updated_at)
+        for review in (*updated, *created)
+    }
+
+
+def upsert_reviews(writes):
+    """
+    Create or replace reviews of given Orders, each Order may appear once.
+
+    Orders are locked first, so reviews they already have, and Sellers and
+    Games they count towards, can be read before they are replaced and no
+    other write of these Orders can slip in between. Rating aggregates then change by difference of all of them in
+    one update per affected row.
+
+    Args:
+        writes (list): ReviewWrite of every Order.
+
+    Returns:
+        (list): Written reviews, in order of writes.
+    """
+    if not writes:
+        return []
+    order_ids = [write.order.id for write in writes]
+    with transaction.atomic():
+        sellers_and_games = {
+            order_id: (seller_id, game_id)
+            for order_id, seller_id, game_id in (
+                Order.objects
+                .select_for_update()
+                .filter(id__in=order_ids)
+                .values_list("id", "seller_id", "game_id")
+            )
+        }
+        saved_reviews = {
+            order_id: (review_id, rating)
+            for review_id, order_id, rating in (
+                Review.objects
+                .select_for_update()
+                .filter(order_id__in=order_ids)
+                .values_list("id", "order_id", "rating")
+            )
+        }
+        updated_at = timezone.now()
+        if connection.vendor == "postgresql":
+            written = _upsert_with_on_conflict(writes, updated_at)
+        else:
+            written = _upsert_with_orm(writes, saved_reviews, updated_at)
+        apply_rating_changes([
+            RatingChange(
+                *sellers_and_games[write.order.id],
+                added=write.rating,
+                removed=saved_reviews.get(write.order.id, (None, None))[1],
+            )
+            for write in writes
+        ])
+        transaction.on_commit(lambda: bump_collection_versions(REVIEWS, *(
+            get_object_collection(REVIEWS, order_id) for order_id in order_ids
+        )))
+    return [
+        Review(
+            id=written[write.order.id][0],
+            order=write.order,
+            rating=write.rating,
+            comment=write.comment,
+            updated_at=written[write.order.id][1],
+        )
+        for write in writes
+    ]
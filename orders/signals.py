@@ -0,0 +1,152 @@
+"""This module catches signals sent for models of app Order"""
+
+# pylint: disable=unused-argument, no-member
+from accounts.models import Seller
+from django.db import transaction
+from django.db.models.signals import (m2m_changed, post_delete, post_save,
+                                      pre_delete)
+from django.dispatch import receiver
+from games.models import (Category, Game, SellerGame,
+                          seller_games_bulk_created)
+
+from orders.models import Order, Review
+from orders.ratings import (RatingChange, apply_rating_changes,
+                            get_rating_aggregate_fields,
+                            seed_seller_game_ratings)
+from orders.stats import OrderChange, apply_order_changes
+from orders.versions import (GAMES, ORDERS, REVIEWS, SELLER_GAMES, SELLERS,
+                             bump_collection_versions, get_object_collection)
+
+# Collections of API which list objects of every model, along with fields
+# identifying a single object within its collection. Reviews are identified
+# by their Order, as they are requested by it.
+MODEL_COLLECTIONS = {
+    Seller: (SELLERS, ("id",)),
+    Game: (GAMES, ("id",)),
+    SellerGame: (SELLER_GAMES, ("seller_id", "game_id")),
+    Review: (REVIEWS, ("order_id",)),
+    Order: (ORDERS, ("id",)),
+}
+
+
+@receiver(pre_delete, sender=Order)
+def remove_deleted_order_from_order_stats(instance, *args, **kwargs):
+    """
+    Everytime an Order is deleted, either directly or along with its Buyer
+    or Seller, it no longer counts towards order counters of its Seller.
+    """
+    apply_order_changes(
+        [OrderChange(instance.seller_id, added=None, removed=instance.status)],
+        create_missing=False
+    )
+
+
+@receiver(pre_delete, sender=Review)
+def remove_rating_of_deleted_review(instance, *args, **kwargs):
+    """
+    Everytime a Review is deleted, either directly or along with its Order,
+    its rating no longer counts towards rating of Seller and Game of its Order.
+    It is done before deletion since Order may be deleted first on cascade.
+
+    Order is locked first, as it is by every review write, and rating is read
+    back from database, so a rating replaced meanwhile is never taken back
+    and a review deleted meanwhile is not taken back twice.
+    """
+    if not instance.order_id:
+        return
+    seller_and_game = (
+        Order.objects
+        .select_for_update()
+        .filter(id=instance.order_id)
+        .values_list("seller_id", "game_id")
+        .first()
+    )
+    if not seller_and_game:
+        return
+    rating = (
+        Review.objects
+        .filter(id=instance.pk)
+        .values_list("rating", flat=True)
+        .first()
+    )
+    if rating is None:
+        return
+    seller_id, game_id = seller_and_game
+    apply_rating_changes(
+        [RatingChange(seller_id, game_id, added=None, removed=rating)]
+    )
+
+
+@receiver(post_save, sender=SellerGame)
+def seed_rating_of_created_seller_game(instance, created, *args, **kwargs):
+    """
+    Everytime a SellerGame is created, its rating is rebuilt from reviews
+    its Seller has already received for its Game.
+    """
+    if not created or kwargs.get("raw"):
+        return
+    for seller_game in seed_seller_game_ratings([instance.id]):
+        for field in get_rating_aggregate_fields(SellerGame):
+            setattr(instance, field, getattr(seller_game, field))
+
+
+@receiver(seller_games_bulk_created)
+def seed_ratings_of_bulk_created_seller_games(seller_games, *args, **kwargs):
+    """
+    Everytime SellerGames are created in bulk, their ratings are rebuilt
+    from reviews and versions of their collection and of every one of them
+    are bumped once transaction is committed, as they would be when saved
+    one by one.
+    """
+    seed_seller_game_ratings([seller_game.id for seller_game in seller_games])
+    collection, key_fields = MODEL_COLLECTIONS[SellerGame]
+    object_collections = [
+        get_object_collection(
+            collection,
+            *(getattr(seller_game, field) for field in key_fields)
+        )
+        for seller_game in seller_games
+    ]
+    transaction.on_commit(
+        lambda: bump_collection_versions(collection, *object_collections)
+    )
+
+
+def bump_version_of_changed_collection(sender, instance, *args, **kwargs):
+    """
+    Everytime a Seller, Game, SellerGame, Review or Order is saved or
+    deleted, versions of collection listing it and of the object itself are
+    bumped once transaction is committed.
+    """
+    collection, key_fields = MODEL_COLLECTIONS[sender]
+    object_collection = get_object_collection(
+        collection, *(getattr(instance, field) for field in key_fields)
+    )
+    transaction.on_commit(
+        lambda: bump_collection_versions(collection, object_collection)
+    )
+
+
+for model in MODEL_COLLECTIONS:
+    post_save.connect(bump_version_of_changed_collection, sender=model)
+    post_delete.connect(bump_version_of_changed_collection, sender=model)
+
+
+@receiver(m2m_changed, sender=Game.categories.through)
+def bump_version_of_games_of_changed_categories(action, *args, **kwargs):
+    """
+    Everytime categories of Games change, version of Games collection, which
+    can be filtered by categories, is bumped once transaction is committed.
+    """
+    if action in ("post_add", "post_remove", "post_clear"):
+        transaction.on_commit(lambda: bump_collection_versions(GAMES))
+
+
+@receiver(post_delete, sender=Category)
+def bump_version_of_games_of_deleted_category(*args, **kwargs):
+    """
+    Everytime a Category is deleted, version of Games collection is bumped
+    once transaction is committed, as its links to Games are deleted by
+    cascade without sending m2m_changed.
+    """
+    transaction.on_commit(lambda: bump_collection_versions(GAMES))
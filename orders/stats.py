@@ -0,0 +1,171 @@
+"""
+This module keeps per Seller order counters up to date whenever an Order is
+created, deleted or its status is changed, along with his recent buyers.
+
+Counters are kept on a single SellerOrderStats row per Seller and adjusted
+with F() expressions, so reading them never has to count Orders. Recent
+buyers are a short list of user names on the same row.
+"""
+
+# pylint: disable=no-member
+
+from collections import Counter, defaultdict, namedtuple
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models import Count, F, Max
+
+# Order status mapped to field of SellerOrderStats counting orders with it.
+STATUS_COUNT_FIELDS = {
+    "at": "active_orders",
+    "cp": "completed_orders",
+    "dl": "delivered_orders",
+    "cd": "canceled_orders",
+    "lt": "late_orders",
+}
+ORDER_COUNT_FIELDS = ("total_orders", *STATUS_COUNT_FIELDS.values())
+
+OrderChange = namedtuple("OrderChange", ["seller_id", "added", "removed"])
+OrderChange.__doc__ = """
+Describes how a single order write changes order counters of a Seller.
+
+'added' is the status of an order which now counts towards the Seller and
+'removed' is the status which no longer does, any of them can be None.
+"""
+
+
+def _get_stats_model():
+    """Get SellerOrderStats model without importing models of this app."""
+    return apps.get_model("orders", "SellerOrderStats")
+
+
+def _collect_deltas(changes):
+    """
+    Sum up counter differences of all changes per Seller.
+
+    Returns:
+        (dict): Seller ID mapped to Counter of field deltas.
+    """
+    deltas = defaultdict(Counter)
+    for change in changes:
+        if change.added is not None:
+            deltas[change.seller_id]["total_orders"] += 1
+            deltas[change.seller_id][STATUS_COUNT_FIELDS[change.added]] += 1
+        if change.removed is not None:
+            deltas[change.seller_id]["total_orders"] -= 1
+            deltas[change.seller_id][STATUS_COUNT_FIELDS[change.removed]] -= 1
+    return deltas
+
+
+def apply_order_changes(changes, create_missing=True):
+    """
+    Update order counters of all Sellers affected by changes, counters of
+    every Seller are updated with a single UPDATE.
+
+    It should be called inside the same transaction as the order write.
+
+    Args:
+        changes (list): OrderChange objects describing order writes.
+        create_missing (bool): Create counters of Sellers having none yet,
+            it should be False while Sellers may be getting deleted.
+    """
+    stats_model = _get_stats_model()
+    for seller_id, delta in _collect_deltas(changes).items():
+        fields = {
+            field: F(field) + count for field, count in delta.items() if count
+        }
+        if not fields:
+            continue
+        updated = stats_model.objects.filter(seller_id=seller_id).update(
+            **fields
+        )
+        if not updated and create_missing:
+            stats_model.objects.get_or_create(seller_id=seller_id)
+            stats_model.objects.filter(seller_id=seller_id).update(**fields)
+
+
+def count_orders_of_sellers(seller_ids):
+    """
+    Count orders of given Sellers by status with a single grouped query.
+
+    Args:
+        seller_ids (list): IDs of Sellers whose orders are counted.
+
+    Returns:
+        (dict): Seller ID mapped to dict of counter field and its value,
+            every given Seller and counter is included.
+    """
+    counts = {
+        seller_id: dict.fromkeys(ORDER_COUNT_FIELDS, 0)
+        for seller_id in seller_ids
+    }
+    status_counts = (
+        apps.get_model("orders", "Order").objects
+        .filter(seller_id__in=seller_ids)
+        .order_by()
+        .values("seller_id", "status")
+        .annotate(number_of_orders=Count("id"))
+    )
+    for status_count in status_counts:
+        seller_counts = counts[status_count["seller_id"]]
+        seller_counts["total_orders"] += status_count["number_of_orders"]
+        field = STATUS_COUNT_FIELDS.get(status_count["status"])
+        if field:
+            seller_counts[field] += status_count["number_of_orders"]
+    return counts
+
+
+def record_recent_buyer(seller_id, buyer_id):
+    """
+    Put Buyer in front of recent buyers of Seller, dropping his earlier
+    occurrence and buyers beyond SELLER_RECENT_BUYERS_LIMIT.
+
+    It should be called inside the same transaction as the order write,
+    after counters of Seller were updated so that his row exists.
+
+    Args:
+        seller_id (int): ID of Seller of the new order.
+        buyer_id (int): ID of Buyer of the new order.
+    """
+    user_name = (
+        apps.get_model("accounts", "Buyer").objects
+        .filter(id=buyer_id)
+        .values_list("user__user_name", flat=True)
+        .first()
+    )
+    stats = (
+        _get_stats_model().objects
+        .select_for_update()
+        .only("id", "recent_buyers")
+        .filter(seller_id=seller_id)
+        .first()
+    )
+    if user_name is None or stats is None:
+        return
+    recent_buyers = [
+        recent_buyer for recent_buyer in stats.recent_buyers
+        if recent_buyer != user_name
+    ]
+    stats.recent_buyers = (
+        [user_name, *recent_buyers][:settings.SELLER_RECENT_BUYERS_LIMIT]
+    )
+    stats.save(update_fields=["recent_buyers"])
+
+
+def find_recent_buyers(seller_id):
+    """
+    Find user names of last distinct buyers of Seller from his orders.
+
+    Returns:
+        (list): At most SELLER_RECENT_BUYERS_LIMIT user names, most recent
+            first.
+    """
+    return list(
+        apps.get_model("orders", "Order").objects
+        .filter(seller_id=seller_id)
+        .values("buyer__user__user_name")
+        .annotate(last_order_time=Max("order_start_time"))
+        .order_by("-last_order_time")
+        .values_list("buyer__user__user_name", flat=True)
+        [:settings.SELLER_RECENT_BUYERS_LIMIT]
+    )
@@ -0,0 +1,83 @@
+from accounts.models import Seller, User
+from django.conf import settings
+from django.core.cache import caches
+from django.test import TestCase
+from django.urls import reverse
+from games.models import Category, Game
+from rest_framework.test import APIClient
+
+
+class CachedApiResponseTestCase(TestCase):
+    """
+    Check that read only API responses are cached until something they are
+    built from is written, and only until then.
+    """
+
+    def setUp(self):
+        caches[settings.API_RESPONSE_CACHE].clear()
+        self.client = APIClient()
+        self.sellers = [
+            Seller.objects.create(
+                user=User.objects.create(
+                    email=f"seller{index}@example.com",
+                    user_name=f"seller{index}",
+                )
+            )
+            for index in range(2)
+        ]
+        self.game = Game.objects.create(name="Game", image="game.png")
+        self.category = Category.objects.create(name="Racing")
+
+    def get_seller_rating(self, seller):
+        """Get response with rating of a Seller."""
+        return self.client.get(reverse("api:seller_rating", args=[seller.id]))
+
+    def get_game_ids(self, **params):
+        """Get IDs of Games listed by API."""
+        response = self.client.get(reverse("api:all_game_ratings"), params)
+        return [row["id"] for row in response.data["results"]]
+
+    def test_repeated_request_is_served_from_cache(self):
+        response = self.get_seller_rating(self.sellers[0])
+        with self.assertNumQueries(0):
+            cached = self.get_seller_rating(self.sellers[0])
+        self.assertEqual(cached.content, response.content)
+        self.assertEqual(cached["ETag"], response["ETag"])
+
+    def test_write_invalidates_only_its_object(self):
+        self.get_seller_rating(self.sellers[0])
+        self.get_seller_rating(self.sellers[1])
+        with self.captureOnCommitCallbacks(execute=True):
+            Seller.objects.get(id=self.sellers[0].id).save()
+        with self.assertNumQueries(0):
+            self.get_seller_rating(self.sellers[1])
+        with self.assertNumQueries(1):
+            self.get_seller_rating(self.sellers[0])
+
+    def test_write_invalidates_lists(self):
+        self.assertEqual(self.get_game_ids(), [self.game.id])
+        with self.captureOnCommitCallbacks(execute=True):
+            other_game = Game.objects.create(name="Other", image="game.png")
+        self.assertEqual(self.get_game_ids(), [other_game.id, self.game.id])
+
+    def test_category_changes_invalidate_filtered_lists(self):
+        category_id = self.category.id
+        self.assertEqual(self.get_game_ids(category=category_id), [])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.category.games.add(self.game)
+        self.assertEqual(
+            self.get_game_ids(category=category_id), [self.game.id]
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.category.delete()
+        self.assertEqual(self.get_game_ids(category=category_id), [])
+
+    def test_formats_are_cached_apart(self):
+        self.get_seller_rating(self.sellers[0])
+        response = self.client.get(
+            reverse("api:seller_rating", args=[self.sellers[0].id]),
+            {"format": "packed"},
+        )
+        self.assertEqual(
+            response["ETag"], f'"seller-{self.sellers[0].id}-0-packed"'
+        )
@@ -0,0 +1,93 @@
+from accounts.models import Seller, User
+from django.db.models import F
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from orders.versions import (SELLERS, bump_collection_versions,
+                             get_object_collection)
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "conditional",
+        },
+        "responses": {
+            "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+        },
+    },
+    API_RESPONSE_CACHE="responses",
+)
+class ConditionalRatingTestCase(TestCase):
+    """
+    Check that conditional GETs of ratings and their lists are answered with
+    304 until rating or list changes, with responses never cached.
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.seller = Seller.objects.create(
+            user=User.objects.create(
+                email="seller@example.com", user_name="seller"
+            )
+        )
+        self.url = reverse("api:seller_rating", args=[self.seller.id])
+        self.list_url = reverse("api:all_seller_ratings")
+
+    def change_rating(self):
+        """Change rating of Seller as a review write would."""
+        Seller.objects.filter(id=self.seller.id).update(
+            rating=3, rating_version=F("rating_version") + 1
+        )
+        bump_collection_versions(
+            SELLERS, get_object_collection(SELLERS, self.seller.id)
+        )
+
+    def get_if_none_match(self, url, etag, **params):
+        """Get response to a GET conditional on ETag."""
+        return self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+
+    def test_rating_not_modified_until_it_changes(self):
+        response = self.client.get(self.url)
+        etag = response["ETag"]
+        self.assertEqual(etag, f'"seller-{self.seller.id}-0-json"')
+        self.assertIn("Last-Modified", response)
+        response = self.get_if_none_match(self.url, etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        response = self.client.get(
+            self.url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.change_rating()
+        response = self.get_if_none_match(self.url, etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["rating"], 3)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list_not_modified_until_collection_changes(self):
+        etag = self.client.get(self.list_url)["ETag"]
+        response = self.get_if_none_match(self.list_url, etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.change_rating()
+        response = self.get_if_none_match(self.list_url, etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_formats_are_tagged_apart(self):
+        etag = self.client.get(self.url)["ETag"]
+        response = self.get_if_none_match(self.url, etag, format="packed")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response["ETag"], f'"seller-{self.seller.id}-0-packed"'
+        )
+
+    def test_missing_rating_is_not_tagged(self):
+        response = self.client.get(
+            reverse("api:seller_rating", args=[self.seller.id + 1])
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertNotIn("ETag", response)
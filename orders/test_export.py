@@ -0,0 +1,72 @@
+import json
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from games.models import Game
+from rest_framework import status
+
+from orders.export import (NDJSON_CONTENT_TYPE, iter_export_rows,
+                           parse_since)
+
+
+class ExportTestCase(TestCase):
+    """
+    Check that exports stream one JSON row per line, earliest changed first,
+    and continue from time of last row seen.
+    """
+
+    def setUp(self):
+        self.games = [
+            Game.objects.create(name=f"Game {index}", image="game.png")
+            for index in range(3)
+        ]
+        now = timezone.now().replace(microsecond=123456)
+        for age, game in zip((1, 3, 2), self.games):
+            Game.objects.filter(id=game.id).update(
+                rating_updated_at=now - timezone.timedelta(minutes=age)
+            )
+        self.exported_ids = [
+            self.games[1].id, self.games[2].id, self.games[0].id
+        ]
+
+    def export(self, kind, **params):
+        """Get response of an export."""
+        return self.client.get(reverse("api:export_rows", args=[kind]), params)
+
+    def get_rows(self, response):
+        """Get rows of a streamed export."""
+        content = b"".join(response.streaming_content).decode()
+        return [json.loads(line) for line in content.splitlines()]
+
+    def test_export_rows_earliest_changed_first(self):
+        response = self.export("games")
+        self.assertEqual(response["Content-Type"], NDJSON_CONTENT_TYPE)
+        rows = self.get_rows(response)
+        self.assertEqual([row["id"] for row in rows], self.exported_ids)
+        self.assertEqual(rows[0]["rating_count"], 0)
+        self.assertEqual(rows[0]["five_star_count"], 0)
+
+    def test_export_continues_from_last_row_seen(self):
+        rows = self.get_rows(self.export("games"))
+        self.assertIn(".123456", rows[1]["rating_updated_at"])
+        rows = self.get_rows(
+            self.export("games", since=rows[1]["rating_updated_at"])
+        )
+        self.assertEqual([row["id"] for row in rows], self.exported_ids[1:])
+
+    def test_chunked_rows(self):
+        self.assertEqual(
+            [row["id"] for row in iter_export_rows("games", chunk_size=1)],
+            self.exported_ids,
+        )
+
+    def test_invalid_export(self):
+        response = self.export("games", since="yesterday")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.export("orders")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_parse_since(self):
+        self.assertIsNone(parse_since(""))
+        self.assertTrue(timezone.is_aware(parse_since("2026-01-02T03:04:05")))
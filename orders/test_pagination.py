@@ -0,0 +1,84 @@
+from accounts.models import Seller, User
+from django.conf import settings
+from django.core.cache import caches
+from django.test import TestCase
+from django.urls import reverse
+from games.models import Game, SellerGame
+from rest_framework.test import APIClient
+
+
+class KeysetCursorPaginationTestCase(TestCase):
+    """
+    Check that rating API lists are paginated by keyset cursor, best rated
+    first, with requested page size and optional approximate total.
+    """
+
+    def setUp(self):
+        caches[settings.API_RESPONSE_CACHE].clear()
+        self.client = APIClient()
+        self.seller = Seller.objects.create(
+            user=User.objects.create(
+                email="seller@example.com", user_name="seller"
+            )
+        )
+        self.games = [
+            Game.objects.create(name=f"Game {index}", image="game.png")
+            for index in range(4)
+        ]
+        for game, rating in zip(self.games, (4, 2, 4, 5)):
+            SellerGame.objects.create(seller=self.seller, game=game)
+            Game.objects.filter(id=game.id).update(rating=rating)
+            SellerGame.objects.filter(game=game).update(rating=rating)
+        self.listed_ids = [
+            self.games[3].id, self.games[2].id,
+            self.games[0].id, self.games[1].id,
+        ]
+
+    def get(self, url, **params):
+        """Get response data of an API list."""
+        return self.client.get(url, params).data
+
+    def get_all_pages(self, url, key="id", **params):
+        """Get values of key of every row, following next link of pages."""
+        data = self.get(url, **params)
+        values = [row[key] for row in data["results"]]
+        while data["next"]:
+            data = self.client.get(data["next"]).data
+            values.extend(row[key] for row in data["results"])
+        return values
+
+    def test_pages_of_game_ratings(self):
+        url = reverse("api:all_game_ratings")
+        self.assertEqual(
+            self.get_all_pages(url, page_size=3), self.listed_ids
+        )
+        data = self.get(url, page_size=3)
+        self.assertIsNone(data["previous"])
+        self.assertNotIn("approximate_count", data)
+        last_page = self.client.get(data["next"]).data
+        self.assertIsNone(last_page["next"])
+        first_page = self.client.get(last_page["previous"]).data
+        self.assertEqual(
+            [row["id"] for row in first_page["results"]], self.listed_ids[:3]
+        )
+
+    def test_pages_of_seller_games(self):
+        url = reverse(
+            "api:all_games_rating_for_given_seller", args=[self.seller.id]
+        )
+        self.assertEqual(
+            self.get_all_pages(url, key="game", page_size=1), self.listed_ids
+        )
+
+    def test_page_size(self):
+        url = reverse("api:all_game_ratings")
+        for page_size, number_of_rows in (("0", 1), ("2", 2), ("x", 4)):
+            with self.subTest(page_size=page_size):
+                data = self.get(url, page_size=page_size)
+                self.assertEqual(len(data["results"]), number_of_rows)
+
+    def test_approximate_count(self):
+        data = self.get(
+            reverse("api:all_game_ratings"), page_size=1, total="approximate"
+        )
+        self.assertEqual(data["approximate_count"], 4)
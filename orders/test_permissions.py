@@ -0,0 +1,142 @@
+from accounts.models import Buyer, Seller, User
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from games.models import Game
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from orders.api.permissions import (HasCompletedOrderOrReadOnly,
+                                    IsOrderRequirementsChangeableOrReadOnly)
+from orders.models import Order, Review
+
+
+class OrderPermissionTestCase(TestCase):
+    """
+    Check that only Buyer of an Order can review it once it is completed and
+    change its requirements within time limit of its Seller.
+    """
+
+    def setUp(self):
+        self.seller = Seller.objects.create(
+            user=User.objects.create(
+                email="seller@example.com", user_name="seller"
+            )
+        )
+        self.user = User.objects.create(
+            email="buyer@example.com", user_name="buyer"
+        )
+        self.buyer = Buyer.objects.create(user=self.user)
+        self.other_user = User.objects.create(
+            email="other@example.com", user_name="other"
+        )
+        Buyer.objects.create(user=self.other_user)
+        self.game = Game.objects.create(name="Game", image="game.png")
+        self.completed = self.create_order(Order.Status.COMPLETED)
+        self.active = self.create_order(Order.Status.ACTIVE)
+        self.client = APIClient()
+
+    def create_order(self, status):
+        """Create an Order of Buyer with given status."""
+        return Order.objects.create(
+            buyer=self.buyer,
+            seller=self.seller,
+            game=self.game,
+            price=10,
+            number_of_days_for_completing_the_order=1,
+            status=status,
+            gaming_account_id="account",
+            gaming_account_password="password",
+        )
+
+    def put_review(self, user, order):
+        """Write review of an Order as given user, get response status."""
+        if user:
+            self.client.force_login(user)
+        return self.client.put(
+            reverse("api:all_orders_review"),
+            {"order": order.id, "rating": 4},
+            format="json",
+        ).status_code
+
+    def get_request(self, user):
+        """Get a write request of given user."""
+        request = Request(APIRequestFactory().patch("/"))
+        request.user = user
+        return request
+
+    def test_only_buyer_reviews_completed_order(self):
+        self.assertEqual(
+            self.put_review(None, self.completed), status.HTTP_403_FORBIDDEN
+        )
+        self.assertEqual(
+            self.put_review(self.other_user, self.completed),
+            status.HTTP_403_FORBIDDEN,
+        )
+        self.assertEqual(
+            self.put_review(self.user, self.active), status.HTTP_403_FORBIDDEN
+        )
+        self.assertFalse(Review.objects.exists())
+        self.assertEqual(
+            self.put_review(self.user, self.completed),
+            status.HTTP_201_CREATED,
+        )
+
+    def test_user_without_buyer_is_denied(self):
+        self.assertEqual(
+            self.put_review(self.seller.user, self.completed),
+            status.HTTP_403_FORBIDDEN,
+        )
+
+    def test_only_buyer_changes_and_deletes_review(self):
+        Review.objects.create(order=self.completed, rating=4)
+        url = reverse("api:detail_order_review", args=[self.completed.id])
+        self.client.force_login(self.other_user)
+        response = self.client.patch(url, {"rating": 1}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(Review.objects.get(order=self.completed).rating, 4)
+        self.client.force_login(self.user)
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_requirements_change_within_time_limit(self):
+        url = reverse("api:update_order_requirements", args=[self.active.id])
+        self.client.force_login(self.other_user)
+        response = self.client.patch(url, {"price": 20}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.client.force_login(self.user)
+        response = self.client.patch(url, {"price": 20}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        Order.objects.filter(id=self.active.id).update(
+            order_start_time=timezone.now() - timezone.timedelta(hours=9)
+        )
+        response = self.client.patch(url, {"price": 30}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(Order.objects.get(id=self.active.id).price, 20)
+
+    def test_checks_are_memoized_on_request(self):
+        request = self.get_request(User.objects.get(id=self.user.id))
+        permission = HasCompletedOrderOrReadOnly()
+        with self.assertNumQueries(1):
+            self.assertTrue(
+                permission.has_object_permission(request, None, self.completed)
+            )
+            self.assertTrue(
+                permission.has_object_permission(request, None, self.completed)
+            )
+            self.assertFalse(
+                permission.has_object_permission(request, None, self.active)
+            )
+
+    def test_requirements_check_reuses_loaded_seller(self):
+        order = Order.objects.select_related("seller").get(id=self.active.id)
+        request = self.get_request(User.objects.get(id=self.user.id))
+        request.user.buyer  # pylint: disable=pointless-statement
+        with self.assertNumQueries(0):
+            self.assertTrue(
+                IsOrderRequirementsChangeableOrReadOnly()
+                .has_object_permission(request, None, order)
+            )
@@ -0,0 +1,169 @@
+from accounts.models import Buyer, Seller, User
+from django.test import TestCase
+from games.models import Game, SellerGame
+
+from orders.models import Order, Review
+from orders.ratings import (HISTOGRAM_FIELDS, RATING_AGGREGATE_FIELDS,
+                            recompute_rating_aggregates)
+from orders.reviews import ReviewWrite, upsert_reviews
+
+
+class RatingAggregateTestCase(TestCase):
+    """
+    Check that rating aggregates kept up to date by differences of review
+    writes always match aggregates rebuilt from all reviews.
+    """
+
+    def setUp(self):
+        self.sellers = [
+            Seller.objects.create(
+                user=User.objects.create(
+                    email=f"seller{index}@example.com",
+                    user_name=f"seller{index}",
+                )
+            )
+            for index in range(2)
+        ]
+        self.buyer = Buyer.objects.create(
+            user=User.objects.create(
+                email="buyer@example.com", user_name="buyer"
+            )
+        )
+        self.games = [
+            Game.objects.create(name=f"Game {index}", image="game.png")
+            for index in range(2)
+        ]
+        for seller in self.sellers:
+            for game in self.games:
+                SellerGame.objects.create(
+                    seller=seller, game=game, seller_price=10
+                )
+
+    def create_order(self, seller, game):
+        """Create a completed Order of buyer."""
+        return Order.objects.create(
+            buyer=self.buyer,
+            seller=seller,
+            game=game,
+            price=10,
+            number_of_days_for_completing_the_order=1,
+            status=Order.Status.COMPLETED,
+            gaming_account_id="account",
+            gaming_account_password="password",
+        )
+
+    def assertRatingsConsistent(self):
+        """
+        Check aggregates of every Seller, Game and SellerGame against ones
+        rebuilt from reviews, and that star counts add up to review count.
+        """
+        for model in (Seller, Game, SellerGame):
+            stored = {
+                row["id"]: row
+                for row in model.objects.values("id", *RATING_AGGREGATE_FIELDS)
+            }
+            for obj in recompute_rating_aggregates(model, list(stored)):
+                rebuilt = {
+                    field: getattr(obj, field)
+                    for field in RATING_AGGREGATE_FIELDS
+                }
+                with self.subTest(model=model.__name__, id=obj.id):
+                    self.assertEqual(
+                        {"id": obj.id, **rebuilt}, stored[obj.id]
+                    )
+                    self.assertEqual(
+                        sum(rebuilt[field] for field in HISTOGRAM_FIELDS),
+                        rebuilt["rating_count"],
+                    )
+
+    def get_seller_game(self, seller, game):
+        """Get SellerGame of a pair as saved in database."""
+        return SellerGame.objects.get(seller=seller, game=game)
+
+    def test_create_reviews(self):
+        seller, game = self.sellers[0], self.games[0]
+        Review.objects.create(order=self.create_order(seller, game), rating=4)
+        Review.objects.create(order=self.create_order(seller, game), rating=2)
+        Review.objects.create(
+            order=self.create_order(self.sellers[1], game), rating=3.5
+        )
+        self.assertRatingsConsistent()
+        seller_game = self.get_seller_game(seller, game)
+        self.assertEqual(seller_game.rating_count, 2)
+        self.assertEqual(seller_game.rating, 3)
+        self.assertEqual(seller_game.rating_histogram[2], 1)
+        self.assertEqual(seller_game.rating_histogram[4], 1)
+
+    def test_update_review(self):
+        review = Review.objects.create(
+            order=self.create_order(self.sellers[0], self.games[0]), rating=5
+        )
+        review.rating = 1
+        review.save()
+        self.assertRatingsConsistent()
+        seller = Seller.objects.get(id=self.sellers[0].id)
+        self.assertEqual(seller.rating_count, 1)
+        self.assertEqual(seller.rating_histogram[5], 0)
+        self.assertEqual(seller.rating_histogram[1], 1)
+
+    def test_upsert_reviews(self):
+        orders = [
+            self.create_order(seller, game)
+            for seller in self.sellers
+            for game in self.games
+        ]
+        upsert_reviews([ReviewWrite(order, 5, "") for order in orders])
+        upsert_reviews([
+            ReviewWrite(order, index + 1, "")
+            for index, order in enumerate(orders[:2])
+        ])
+        self.assertRatingsConsistent()
+        self.assertEqual(Review.objects.count(), len(orders))
+
+    def test_delete_review(self):
+        order = self.create_order(self.sellers[0], self.games[0])
+        Review.objects.create(order=order, rating=4)
+        Review.objects.create(
+            order=self.create_order(self.sellers[0], self.games[0]), rating=2
+        )
+        Review.objects.get(order=order).delete()
+        self.assertRatingsConsistent()
+        seller_game = self.get_seller_game(self.sellers[0], self.games[0])
+        self.assertEqual(seller_game.rating_count, 1)
+        self.assertEqual(seller_game.rating, 2)
+
+    def test_delete_reviewed_order(self):
+        order = self.create_order(self.sellers[0], self.games[0])
+        Review.objects.create(order=order, rating=4)
+        order.delete()
+        self.assertRatingsConsistent()
+        game = Game.objects.get(id=self.games[0].id)
+        self.assertEqual(game.rating_count, 0)
+        self.assertEqual(game.rating_sum, 0)
+
+    def test_move_reviewed_order_to_another_game(self):
+        order = self.create_order(self.sellers[0], self.games[0])
+        Review.objects.create(order=order, rating=3)
+        order.game = self.games[1]
+        order.save()
+        self.assertRatingsConsistent()
+        self.assertEqual(
+            self.get_seller_game(self.sellers[0], self.games[0]).rating_count,
+            0,
+        )
+        self.assertEqual(
+            self.get_seller_game(self.sellers[0], self.games[1]).rating_count,
+            1,
+        )
+
+    def test_recreate_seller_game(self):
+        seller, game = self.sellers[0], self.games[0]
+        Review.objects.create(order=self.create_order(seller, game), rating=4)
+        Review.objects.create(order=self.create_order(seller, game), rating=1)
+        self.get_seller_game(seller, game).delete()
+        seller_game = SellerGame.objects.create(
+            seller=seller, game=game, seller_price=10
+        )
+        self.assertRatingsConsistent()
+        self.assertEqual(seller_game.rating_count, 2)
+        self.assertEqual(self.get_seller_game(seller, game).rating_sum, 5)
@@ -0,0 +1,103 @@
+import json
+from unittest import skipIf, skipUnless
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase
+from django.urls import reverse
+from games.models import Game
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from orders.api import renderers
+from orders.api.renderers import MessagePackRenderer, pack_lists
+
+
+class PackListsTestCase(TestCase):
+    """Check that only lists of objects having the same fields are packed."""
+
+    def test_pack_lists(self):
+        self.assertEqual(
+            pack_lists({"results": [{"id": 1, "tags": [{"a": 1}]}]}),
+            {"results": {
+                "fields": ["id", "tags"],
+                "rows": [[1, {"fields": ["a"], "rows": [[1]]}]],
+            }},
+        )
+        self.assertEqual(
+            pack_lists([{"id": 1}, {"name": "x"}]), [{"id": 1}, {"name": "x"}]
+        )
+        self.assertEqual(pack_lists([1, 2]), [1, 2])
+        self.assertEqual(pack_lists([]), [])
+
+
+class RatingFieldsTestCase(TestCase):
+    """
+    Check that rating API serializes only fields selected in 'fields' query
+    parameter, packed when packed format is requested.
+    """
+
+    def setUp(self):
+        caches[settings.API_RESPONSE_CACHE].clear()
+        self.client = APIClient()
+        self.games = [
+            Game.objects.create(name=f"Game {index}", image="game.png")
+            for index in range(2)
+        ]
+        self.list_url = reverse("api:all_game_ratings")
+
+    def get_json(self, url, **params):
+        """Get decoded JSON content of response."""
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return json.loads(response.content)
+
+    def test_selected_fields(self):
+        data = self.get_json(self.list_url, fields="rating")
+        self.assertEqual(data["results"], [{"rating": 5.0}, {"rating": 5.0}])
+        data = self.get_json(
+            reverse("api:game_rating", args=[self.games[0].id]),
+            fields=" rating,id ",
+        )
+        self.assertEqual(data, {"id": self.games[0].id, "rating": 5.0})
+
+    def test_unknown_field(self):
+        response = self.client.get(self.list_url, {"fields": "price"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_fields_rejected_by_review_endpoints(self):
+        response = self.client.get(
+            reverse("api:all_orders_review"), {"fields": "rating"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_packed_list(self):
+        data = self.get_json(self.list_url, format="packed", fields="id")
+        self.assertEqual(data["results"], {
+            "fields": ["id"],
+            "rows": [[self.games[1].id], [self.games[0].id]],
+        })
+        self.assertIsNone(data["next"])
+
+    def test_packed_batch(self):
+        data = self.get_json(
+            self.list_url, format="packed", ids=f"{self.games[0].id},0"
+        )
+        self.assertEqual(data, {
+            "results": {
+                str(self.games[0].id): {"id": self.games[0].id, "rating": 5.0}
+            },
+            "missing": [0],
+        })
+
+    @skipUnless(renderers.msgpack, "msgpack is not installed")
+    def test_msgpack(self):
+        response = self.client.get(self.list_url, {"format": "msgpack"})
+        data = renderers.msgpack.unpackb(response.content)
+        self.assertEqual(len(data["results"]), 2)
+
+    @skipIf(renderers.msgpack, "msgpack is installed")
+    def test_msgpack_requires_msgpack(self):
+        with self.assertRaises(ImproperlyConfigured):
+            MessagePackRenderer().render({"id": 1})
@@ -0,0 +1,99 @@
+from accounts.models import Buyer, Seller, User
+from django.test import TestCase
+from django.urls import reverse
+from games.models import Game, SellerGame
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from orders.models import Order, Review
+from orders.reviews import ReviewWrite, upsert_reviews
+
+
+class ReviewWriteTestCase(TestCase):
+    """
+    Check that reviews are written with ratings within star range and count
+    towards Seller and Game their Orders have when they are written.
+    """
+
+    def setUp(self):
+        self.seller = Seller.objects.create(
+            user=User.objects.create(
+                email="seller@example.com", user_name="seller"
+            )
+        )
+        self.user = User.objects.create(
+            email="buyer@example.com", user_name="buyer"
+        )
+        buyer = Buyer.objects.create(user=self.user)
+        self.games = [
+            Game.objects.create(name=f"Game {index}", image="game.png")
+            for index in range(2)
+        ]
+        for game in self.games:
+            SellerGame.objects.create(seller=self.seller, game=game)
+        self.order = Order.objects.create(
+            buyer=buyer,
+            seller=self.seller,
+            game=self.games[0],
+            price=10,
+            number_of_days_for_completing_the_order=1,
+            status=Order.Status.COMPLETED,
+            gaming_account_id="account",
+            gaming_account_password="password",
+        )
+        self.client = APIClient()
+        self.client.force_login(self.user)
+
+    def get_rating_count(self, game):
+        """Get number of reviews counted towards a Game."""
+        return Game.objects.values_list("rating_count", flat=True).get(
+            id=game.id
+        )
+
+    def test_upsert_uses_game_of_locked_order(self):
+        stale_order = Order.objects.get(id=self.order.id)
+        Order.objects.filter(id=self.order.id).update(game=self.games[1])
+        upsert_reviews([ReviewWrite(stale_order, 4, "")])
+        self.assertEqual(self.get_rating_count(self.games[0]), 0)
+        self.assertEqual(self.get_rating_count(self.games[1]), 1)
+
+    def test_put_review_within_star_range(self):
+        response = self.client.put(
+            reverse("api:all_orders_review"),
+            {"order": self.order.id, "rating": 1, "comment": "slow"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Review.objects.get(order=self.order).rating, 1)
+
+    def test_put_review_out_of_star_range(self):
+        for rating in (0, 5.5, -1):
+            with self.subTest(rating=rating):
+                response = self.client.put(
+                    reverse("api:all_orders_review"),
+                    {"order": self.order.id, "rating": rating},
+                    format="json",
+                )
+                self.assertEqual(
+                    response.status_code, status.HTTP_400_BAD_REQUEST
+                )
+        self.assertFalse(Review.objects.exists())
+
+    def test_bulk_reviews_out_of_star_range(self):
+        response = self.client.post(
+            reverse("api:bulk_orders_review"),
+            [{"order": self.order.id, "rating": 6}],
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Review.objects.exists())
+
+    def test_patch_review_out_of_star_range(self):
+        Review.objects.create(order=self.order, rating=4)
+        response = self.client.patch(
+            reverse("api:detail_order_review", args=[self.order.id]),
+            {"rating": 7},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Review.objects.get(order=self.order).rating, 4)
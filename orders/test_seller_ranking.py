@@ -0,0 +1,67 @@
+from accounts.models import Seller, User
+from django.conf import settings
+from django.core.cache import caches
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from orders.ratings import get_ranking_score
+
+
+class SellerRankingListTestCase(TestCase):
+    """
+    Check that API list of Seller ratings is ordered by ranking score, with
+    ties broken by ID, on every page its cursors lead to.
+    """
+
+    def setUp(self):
+        caches[settings.API_RESPONSE_CACHE].clear()
+        self.client = APIClient()
+        self.unreviewed = self.create_seller("unreviewed")
+        self.single_review = self.create_seller("single", 5, 1)
+        self.many_reviews = self.create_seller("many", 9800, 2000)
+        self.tied = self.create_seller("tied")
+
+    def create_seller(self, name, rating_sum=0, rating_count=0):
+        """Create a Seller with given totals of review ratings."""
+        seller = Seller.objects.create(
+            user=User.objects.create(
+                email=f"{name}@example.com", user_name=name
+            )
+        )
+        if rating_count:
+            Seller.objects.filter(id=seller.id).update(
+                rating=rating_sum / rating_count,
+                rating_sum=rating_sum,
+                rating_count=rating_count,
+                ranking_score=get_ranking_score(rating_sum, rating_count),
+            )
+        return seller
+
+    def get_listed_ids(self, page_size):
+        """Get IDs of all listed Sellers, following cursor of every page."""
+        url = f"{reverse('api:all_seller_ratings')}?page_size={page_size}"
+        ids = []
+        while url:
+            response = self.client.get(url)
+            ids.extend(row["id"] for row in response.data["results"])
+            url = response.data["next"]
+        return ids
+
+    def test_ordered_by_ranking_score(self):
+        expected = [
+            self.many_reviews.id, self.single_review.id,
+            self.tied.id, self.unreviewed.id,
+        ]
+        self.assertEqual(self.get_listed_ids(10), expected)
+        self.assertEqual(self.get_listed_ids(1), expected)
+
+    def test_previous_page_follows_ranking_score(self):
+        url = f"{reverse('api:all_seller_ratings')}?page_size=1"
+        for _ in range(2):
+            url = self.client.get(url).data["next"]
+        response = self.client.get(self.client.get(url).data["previous"])
+        self.assertEqual(
+            [row["id"] for row in response.data["results"]],
+            [self.single_review.id],
+        )
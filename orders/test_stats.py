@@ -0,0 +1,175 @@
+from io import StringIO
+
+from accounts.models import Buyer, Seller, User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from games.models import Game
+
+from orders.models import Order, SellerOrderStats
+from orders.stats import ORDER_COUNT_FIELDS, count_orders_of_sellers
+
+
+class SellerOrderStatsTestCase(TestCase):
+    """
+    Check that order counters of Sellers follow every order write and that
+    drifted counters are found and repaired.
+    """
+
+    def setUp(self):
+        self.seller = Seller.objects.create(
+            user=User.objects.create(
+                email="seller@example.com", user_name="seller"
+            )
+        )
+        self.buyer = Buyer.objects.create(
+            user=User.objects.create(
+                email="buyer@example.com", user_name="buyer"
+            )
+        )
+        self.game = Game.objects.create(name="Game", image="game.png")
+
+    def create_order(self, status=Order.Status.ACTIVE, buyer=None):
+        """Create an Order of Seller with given status."""
+        return Order.objects.create(
+            buyer=buyer or self.buyer,
+            seller=self.seller,
+            game=self.game,
+            price=10,
+            number_of_days_for_completing_the_order=1,
+            status=status,
+            gaming_account_id="account",
+            gaming_account_password="password",
+        )
+
+    def get_counts(self):
+        """Get order counters of Seller as saved in database."""
+        return SellerOrderStats.objects.values(*ORDER_COUNT_FIELDS).get(
+            seller=self.seller
+        )
+
+    def assertCountersMatchOrders(self):
+        """Check counters of Seller against his orders counted by status."""
+        actual_counts = count_orders_of_sellers([self.seller.id])
+        self.assertEqual(self.get_counts(), actual_counts[self.seller.id])
+
+    def verify(self, *args):
+        """Run verify_order_stats and get its output."""
+        output = StringIO()
+        call_command("verify_order_stats", *args, stdout=output)
+        return output.getvalue()
+
+    def test_counters_follow_order_writes(self):
+        self.create_order()
+        order = self.create_order()
+        order.status = Order.Status.COMPLETED
+        order.save()
+        self.assertCountersMatchOrders()
+        self.assertEqual(self.get_counts()["completed_orders"], 1)
+        self.create_order(Order.Status.CANCELED).delete()
+        self.assertCountersMatchOrders()
+        self.assertEqual(self.get_counts()["total_orders"], 2)
+
+    def test_verify_without_drift(self):
+        self.create_order()
+        self.assertIn("No drift found", self.verify())
+
+    def test_verify_reports_drift_without_repairing(self):
+        self.create_order()
+        SellerOrderStats.objects.filter(seller=self.seller).update(
+            total_orders=5
+        )
+        output = self.verify()
+        self.assertIn(f"Seller {self.seller.id}", output)
+        self.assertIn("Counters of 1 Sellers drifted", output)
+        self.assertEqual(self.get_counts()["total_orders"], 5)
+
+    def test_verify_repairs_drift(self):
+        self.create_order()
+        self.create_order(Order.Status.COMPLETED)
+        SellerOrderStats.objects.filter(seller=self.seller).update(
+            total_orders=0, completed_orders=3
+        )
+        output = self.verify("--repair")
+        self.assertIn("Repaired counters of 1 Sellers", output)
+        self.assertCountersMatchOrders()
+        self.assertIn("No drift found", self.verify())
+
+    def test_verify_repairs_missing_counters(self):
+        self.create_order()
+        SellerOrderStats.objects.filter(seller=self.seller).delete()
+        output = self.verify("--repair")
+        self.assertIn("Repaired counters of 1 Sellers", output)
+        self.assertCountersMatchOrders()
+
+
+@override_settings(SELLER_RECENT_BUYERS_LIMIT=2)
+class RecentBuyersTestCase(TestCase):
+    """
+    Check that last distinct buyers of Seller are kept on his order stats,
+    most recent first, and can be rebuilt from his orders.
+    """
+
+    def setUp(self):
+        self.seller = Seller.objects.create(
+            user=User.objects.create(
+                email="seller@example.com", user_name="seller"
+            )
+        )
+        self.buyers = [
+            Buyer.objects.create(
+                user=User.objects.create(
+                    email=f"buyer{index}@example.com",
+                    user_name=f"buyer{index}",
+                )
+            )
+            for index in range(3)
+        ]
+        self.game = Game.objects.create(name="Game", image="game.png")
+
+    def create_orders(self, *buyer_indexes):
+        """Create an Order of Seller for every Buyer given by index."""
+        return [
+            Order.objects.create(
+                buyer=self.buyers[index],
+                seller=self.seller,
+                game=self.game,
+                price=10,
+                number_of_days_for_completing_the_order=1,
+                gaming_account_id="account",
+                gaming_account_password="password",
+            )
+            for index in buyer_indexes
+        ]
+
+    def get_recent_buyers(self):
+        """Get recent buyers of Seller as read by his profile."""
+        return Seller.objects.get(id=self.seller.id).recent_buyers
+
+    def test_new_orders_move_buyers_to_front(self):
+        self.assertEqual(self.get_recent_buyers(), [])
+        self.create_orders(0, 1, 0)
+        self.assertEqual(self.get_recent_buyers(), ["buyer0", "buyer1"])
+        self.create_orders(2)
+        self.assertEqual(self.get_recent_buyers(), ["buyer2", "buyer0"])
+
+    def test_updated_orders_keep_recent_buyers(self):
+        order, _ = self.create_orders(0, 1)
+        order.status = Order.Status.COMPLETED
+        order.save()
+        self.assertEqual(self.get_recent_buyers(), ["buyer1", "buyer0"])
+
+    def test_rebuild_from_latest_orders(self):
+        orders = self.create_orders(0, 1, 2, 0)
+        now = timezone.now()
+        for age, order in enumerate(reversed(orders)):
+            Order.objects.filter(id=order.id).update(
+                order_start_time=now - timezone.timedelta(hours=age)
+            )
+        SellerOrderStats.objects.filter(seller=self.seller).update(
+            recent_buyers=[]
+        )
+        output = StringIO()
+        call_command("rebuild_recent_buyers", stdout=output)
+        self.assertIn("Rebuilt recent buyers of 1 Sellers", output.getvalue())
+        self.assertEqual(self.get_recent_buyers(), ["buyer0", "buyer2"])
@@ -0,0 +1,104 @@
+"""
+This module keeps versions of API collections, such as list of all Seller
+ratings, in cache so that list endpoints can tell whether anything they list
+has changed without querying the database.
+
+Versions start from current time in milliseconds, so a version lost with an
+evicted cache key never repeats one handed out before. Cache has to be
+shared by all processes, such as Memcached or Redis, for versions bumped by
+one process to be seen by others.
+
+Every single object, such as rating of one Seller, also has a version of its
+own, kept as a collection named by 'get_object_collection', so a change of
+one object does not invalidate anything cached for other ones.
+"""
+
+import time
+
+from django.core.cache import cache
+
+SELLERS = "sellers"
+GAMES = "games"
+SELLER_GAMES = "seller_games"
+REVIEWS = "reviews"
+ORDERS = "orders"
+
+CACHE_KEY_PREFIX = "collection_version"
+
+
+def _get_cache_key(collection):
+    """Get cache key holding version of collection."""
+    return f"{CACHE_KEY_PREFIX}:{collection}"
+
+
+def _get_initial_version():
+    """Get version a collection starts from when it is not in cache."""
+    return int(time.time() * 1000)
+
+
+def get_object_collection(collection, *key):
+    """
+    Get name of collection holding only a single object of a collection.
+
+    Args:
+        collection (str): Name of collection, one of constants of this module.
+        key: Values identifying the object, such as its ID.
+
+    Returns:
+        (str): Name of collection of the object.
+    """
+    return ":".join((collection, *map(str, key)))
+
+
+def get_collection_version(collection):
+    """
+    Get current version of a collection.
+
+    Args:
+        collection (str): Name of collection, one of constants of this module.
+
+    Returns:
+        (int): Version of collection.
+    """
+    key = _get_cache_key(collection)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _get_initial_version(), timeout=None)
+        version = cache.get(key, _get_initial_version())
+    return version
+
+
+def get_collection_versions(collections):
+    """
+    Get current versions of many collections with a single cache lookup.
+
+    Args:
+        collections (list): Names of collections.
+
+    Returns:
+        (list): Versions of collections, in the same order.
+    """
+    versions = cache.get_many([
+        _get_cache_key(collection) for collection in collections
+    ])
+    return [
+        versions.get(_get_cache_key(collection))
+        or get_collection_version(collection)
+        for collection in collections
+    ]
+
+
+def bump_collection_versions(*collections):
+    """
+    Increment versions of given collections, after something they list has
+    been created, changed or deleted.
+
+    Args:
+        collections (str): Names of collections, constants of this module.
+    """
+    for collection in collections:
+        key = _get_cache_key(collection)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, _get_initial_version(), timeout=None)
@@ -6,6 +6,7 @@ from accounts.models import Seller
 from django.contrib import messages
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
+from gameboost.pagination import KeysetPaginator, get_page_urls
 from games.models import Game, SellerGame
 
 # pylint: disable=relative-beyond-top-level
@@ -53,11 +54,16 @@ def create_order(request, seller_game):
 def show_all_orders_of_current_user(request):
     """
     If user is logged in then redirect him to Admin page else show him his
-    Orders inlcuded Active, Completed and Cancelled.
+    Orders inlcuded Active, Completed and Cancelled, latest first, in pages
+    selected by "cursor" query parameter.
     """
     if request.user.is_superuser:
         return redirect('admin:login')
-    context = {
-        "orders": request.user.buyer.orders.select_related("game")
-    }
+    page = KeysetPaginator(
+        request.user.buyer.orders
+        .select_related("game", "seller")
+        .prefetch_related("game__categories"),
+        ordering=("-order_start_time", "-id"),
+    ).get_page(request.GET.get("cursor"))
+    context = {"orders": page.object_list, **get_page_urls(request, page)}
     return render(request, 'my_orders.html', context)
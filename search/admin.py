@@ -0,0 +1,8 @@
+"""Models to be displayed on Admin panel are registered here"""
+
+from django.contrib import admin
+
+# pylint: disable=relative-beyond-top-level
+from .models import SearchEntry
+
+admin.site.register(SearchEntry)
@@ -0,0 +1,14 @@
+"""Apps can be configure in this module."""
+
+from django.apps import AppConfig
+
+
+class SearchConfig(AppConfig):
+    """To configure App "Search" """
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'search'
+
+    def ready(self):
+        """Connect receivers of signals once all models are loaded."""
+        # pylint: disable=import-outside-toplevel, unused-import
+        from search import signals
@@ -0,0 +1,149 @@
+"""
+This module contains in-memory prefix index serving type-ahead suggestions
+of Game names, Category names and Seller user names without querying the
+database.
+
+Index is a sorted list of (key, kind, object ID) tuples, where keys are
+lowercase names and every word suffix of them, so suggestions matching a
+prefix are found with a binary search. It is built in background once the
+process starts serving requests, updated from model signals of this process
+and rebuilt in background every AUTOCOMPLETE_REFRESH_INTERVAL seconds to
+pick up changes made by other processes, see 'gameboost.indexes'.
+"""
+
+# pylint: disable=no-member
+
+from bisect import bisect_left, insort
+
+from accounts.models import Seller
+from django.conf import settings
+from gameboost.indexes import RefreshedIndex
+from games.models import Category, Game
+
+
+class Kind:
+    """Contains kinds of suggestions."""
+    GAME = "game"
+    CATEGORY = "category"
+    SELLER = "seller"
+
+
+def get_keys(name):
+    """
+    Get keys a name is found by, which are the whole name and every part of
+    it starting from one of its words, all in lowercase.
+
+    Args:
+        name (str): Name of a suggestion.
+
+    Returns:
+        (set): Keys of name.
+    """
+    words = name.casefold().split()
+    return {" ".join(words[index:]) for index in range(len(words))}
+
+
+class PrefixIndex(RefreshedIndex):
+    """
+    Sorted array of suggestion keys searched by prefix with bisect, all its
+    methods are thread safe.
+    """
+
+    refresh_interval_setting = "AUTOCOMPLETE_REFRESH_INTERVAL"
+
+    def __init__(self):
+        super().__init__()
+        self._keys = []
+        self._names = {}
+
+    def load(self):
+        """Get names of every suggestion from database along with keys."""
+        names = {
+            (Kind.GAME, game_id): name
+            for game_id, name in Game.objects.values_list("id", "name")
+        }
+        names.update(
+            ((Kind.CATEGORY, category_id), name)
+            for category_id, name in Category.objects.values_list("id", "name")
+        )
+        names.update(
+            ((Kind.SELLER, seller_id), user_name)
+            for seller_id, user_name in Seller.objects.values_list(
+                "id", "user__user_name"
+            )
+        )
+        keys = sorted(
+            (key, kind, object_id)
+            for (kind, object_id), name in names.items()
+            for key in get_keys(name)
+        )
+        return names, keys
+
+    def replace(self, state):
+        """Replace names and keys of every suggestion."""
+        self._names, self._keys = state
+
+    def _remove_keys(self, kind, object_id):
+        """Remove keys of a suggestion, lock has to be held by caller."""
+        name = self._names.pop((kind, object_id), None)
+        if name is None:
+            return
+        for key in get_keys(name):
+            entry = (key, kind, object_id)
+            index = bisect_left(self._keys, entry)
+            if index < len(self._keys) and self._keys[index] == entry:
+                del self._keys[index]
+
+    def update(self, kind, object_id, name):
+        """
+        Add a suggestion, or replace name of an existing one, if index is
+        built. Otherwise it will be loaded along with all others by the build.
+        """
+        self._update(self._set_name, kind, object_id, name)
+
+    def _set_name(self, kind, object_id, name):
+        """Replace keys of a suggestion, lock has to be held by caller."""
+        self._remove_keys(kind, object_id)
+        self._names[(kind, object_id)] = name
+        for key in get_keys(name):
+            insort(self._keys, (key, kind, object_id))
+
+    def remove(self, kind, object_id):
+        """Remove a suggestion if index is built."""
+        self._update(self._remove_keys, kind, object_id)
+
+    def suggest(self, prefix, limit=None):
+        """
+        Get suggestions whose name, or any of its words, starts with prefix.
+
+        Args:
+            prefix (str): Text entered by user.
+            limit (int): Maximum number of suggestions, AUTOCOMPLETE_LIMIT if
+                not given.
+
+        Returns:
+            (list): Dicts holding kind, ID and name of every suggestion,
+                ordered by matched key.
+        """
+        limit = limit or settings.AUTOCOMPLETE_LIMIT
+        prefix = " ".join(prefix.casefold().split())
+        if not prefix:
+            return []
+        self.ensure_fresh()
+        suggestions = {}
+        with self._lock:
+            index = bisect_left(self._keys, (prefix,))
+            while index < len(self._keys) and len(suggestions) < limit:
+                key, kind, object_id = self._keys[index]
+                if not key.startswith(prefix):
+                    break
+                suggestions.setdefault((kind, object_id), {
+                    "kind": kind,
+                    "id": object_id,
+                    "name": self._names[(kind, object_id)],
+                })
+                index += 1
+        return list(suggestions.values())
+
+
+prefix_index = PrefixIndex()
@@ -0,0 +1,185 @@
+"""
+This module contains search backends which find Games and Sellers whose
+search entries match a query, ranked by relevance.
+
+PostgreSQL is searched with trigram matching backed by GIN trigram indexes,
+SQLite with an FTS5 full text index, and any other database with a plain
+unindexed scan. Indexes of both are created by migrations of this app.
+"""
+
+# pylint: disable=no-member
+
+import re
+from collections import namedtuple
+
+from django.conf import settings
+from django.db import connection
+from django.utils.module_loading import import_string
+
+from search.models import SearchEntry
+
+SearchResults = namedtuple("SearchResults", ["object_ids", "has_next"])
+SearchResults.__doc__ = """
+IDs of objects found on requested page, most relevant first, and whether
+there are more results after this page.
+"""
+
+FTS_TABLE = "search_searchentry_fts"
+
+
+class BaseSearchBackend:
+    """
+    Backend searching entries with a case insensitive substring match,
+    ranking entries matched by title above those matched by body only.
+    """
+
+    def _find_object_ids(self, query, kind, offset, limit):
+        """Get IDs of up to 'limit' matching objects after 'offset'."""
+        entries = SearchEntry.objects.filter(kind=kind).order_by("title", "id")
+        title_matches = list(
+            entries
+            .filter(title__icontains=query)
+            .values_list("object_id", flat=True)[:offset + limit]
+        )
+        body_matches = list(
+            entries
+            .filter(body__icontains=query)
+            .exclude(title__icontains=query)
+            .values_list("object_id", flat=True)[:offset + limit]
+        )
+        object_ids = title_matches + body_matches
+        return object_ids[offset:offset + limit]
+
+    def search(self, query, kind, page=1, page_size=None):
+        """
+        Search entries of given kind matching query.
+
+        Args:
+            query (str): Text entered by user.
+            kind (str): One of SearchEntry.Kind values.
+            page (int): Number of requested page, starting from 1.
+            page_size (int): Number of results on a page, SEARCH_PAGE_SIZE if
+                not given.
+
+        Returns:
+            SearchResults: IDs of objects found on requested page.
+        """
+        page_size = page_size or settings.SEARCH_PAGE_SIZE
+        query = query.strip()
+        if not query:
+            return SearchResults([], False)
+        object_ids = self._find_object_ids(
+            query, kind, (page - 1) * page_size, page_size + 1
+        )
+        return SearchResults(object_ids[:page_size], len(object_ids) > page_size)
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """
+    Backend searching entries with trigram matching of pg_trgm, substring
+    and fuzzy word matches are both served by GIN trigram indexes and ranked
+    by their word similarity, title matches weighing twice as much.
+    """
+
+    SQL = """
+        SELECT object_id
+        FROM search_searchentry
+        WHERE kind = %(kind)s
+            AND (
+                title ILIKE %(pattern)s OR body ILIKE %(pattern)s
+                OR %(query)s <%% title
+            )
+        ORDER BY
+            2 * word_similarity(%(query)s, title)
+            + word_similarity(%(query)s, body) DESC,
+            id
+        LIMIT %(limit)s OFFSET %(offset)s
+    """
+
+    def _find_object_ids(self, query, kind, offset, limit):
+        escaped_query = re.sub(r"([%_\\])", r"\\\1", query)
+        with connection.cursor() as cursor:
+            cursor.execute(self.SQL, {
+                "kind": kind,
+                "query": query,
+                "pattern": f"%{escaped_query}%",
+                "limit": limit,
+                "offset": offset,
+            })
+            return [row[0] for row in cursor.fetchall()]
+
+
+class SQLiteSearchBackend(BaseSearchBackend):
+    """
+    Backend searching entries with FTS5 full text index, every word of query
+    has to match a word prefix in title or body and entries are ranked with
+    bm25 where title weighs ten times as much as body.
+    """
+
+    SQL = f"""
+        SELECT entry.object_id
+        FROM {FTS_TABLE}
+        JOIN search_searchentry AS entry ON entry.id = {FTS_TABLE}.rowid
+        WHERE {FTS_TABLE} MATCH %s AND entry.kind = %s
+        ORDER BY bm25({FTS_TABLE}, 10.0, 1.0), entry.id
+        LIMIT %s OFFSET %s
+    """
+
+    def _build_match_expression(self, query):
+        """Turn every word of query into a quoted FTS5 prefix query."""
+        words = re.findall(r"\w+", query)
+        return " ".join(f'"{word}"*' for word in words)
+
+    def _find_object_ids(self, query, kind, offset, limit):
+        match_expression = self._build_match_expression(query)
+        if not match_expression:
+            return []
+        with connection.cursor() as cursor:
+            cursor.execute(self.SQL, [match_expression, kind, limit, offset])
+            return [row[0] for row in cursor.fetchall()]
+
+
+VENDOR_BACKENDS = {
+    "postgresql": PostgresSearchBackend,
+    "sqlite": SQLiteSearchBackend,
+}
+
+
+def get_search_backend():
+    """
+    Get search backend set in SEARCH_BACKEND, or else the one suitable for
+    the database in use.
+
+    Returns:
+        BaseSearchBackend: Search backend to be used.
+    """
+    if settings.SEARCH_BACKEND:
+        return import_string(settings.SEARCH_BACKEND)()
+    return VENDOR_BACKENDS.get(connection.vendor, BaseSearchBackend)()
+
+
+def search_objects(queryset, query, kind, page=1, page_size=None):
+    """
+    Get requested page of objects of queryset matching query, most relevant
+    first.
+
+    Args:
+        queryset (QuerySet): Objects which can be found, its model has to be
+            the one of given kind.
+        query (str): Text entered by user.
+        kind (str): One of SearchEntry.Kind values.
+        page (int): Number of requested page, starting from 1.
+        page_size (int): Number of results on a page, SEARCH_PAGE_SIZE if
+            not given.
+
+    Returns:
+        (tuple): List of objects found on requested page and whether there
+            are more results after this page.
+    """
+    results = get_search_backend().search(query, kind, page, page_size)
+    objects = queryset.in_bulk(results.object_ids)
+    return (
+        [objects[object_id] for object_id in results.object_ids
+         if object_id in objects],
+        results.has_next,
+    )
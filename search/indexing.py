@@ -0,0 +1,100 @@
+"""
+This module keeps search entries of Games and Sellers in sync with text they
+are searched by, search indexes of entries are then kept up to date by the
+database itself.
+"""
+
+# pylint: disable=no-member
+
+from accounts.models import Seller
+from games.models import Game
+
+from search.models import SearchEntry
+
+SEARCH_ENTRY_FIELDS = ["title", "body"]
+
+
+def _save_entries(kind, texts):
+    """
+    Create or update search entries of given kind.
+
+    Args:
+        kind (str): One of SearchEntry.Kind values.
+        texts (dict): Object ID mapped to tuple of its title and body.
+    """
+    existing = {
+        entry.object_id: entry
+        for entry in SearchEntry.objects.filter(
+            kind=kind, object_id__in=texts.keys()
+        )
+    }
+    created, updated = [], []
+    for object_id, (title, body) in texts.items():
+        entry = existing.get(object_id)
+        if entry is None:
+            created.append(SearchEntry(
+                kind=kind, object_id=object_id, title=title, body=body
+            ))
+        elif (entry.title, entry.body) != (title, body):
+            entry.title, entry.body = title, body
+            updated.append(entry)
+    SearchEntry.objects.bulk_create(created)
+    SearchEntry.objects.bulk_update(updated, SEARCH_ENTRY_FIELDS)
+
+
+def index_games(game_ids):
+    """
+    Index name, description and category names of given Games.
+
+    Args:
+        game_ids (iterable): IDs of Games to be indexed, IDs of Games which
+            no longer exist are removed from index.
+    """
+    game_ids = set(game_ids)
+    games = Game.objects.filter(id__in=game_ids).prefetch_related("categories")
+    texts = {
+        game.id: (
+            game.name,
+            " ".join(
+                [game.description]
+                + [category.name for category in game.categories.all()]
+            ),
+        )
+        for game in games
+    }
+    _save_entries(SearchEntry.Kind.GAME, texts)
+    remove_from_index(SearchEntry.Kind.GAME, game_ids - texts.keys())
+
+
+def index_sellers(seller_ids):
+    """
+    Index user name and about info of given Sellers.
+
+    Args:
+        seller_ids (iterable): IDs of Sellers to be indexed, IDs of Sellers
+            which no longer exist are removed from index.
+    """
+    seller_ids = set(seller_ids)
+    texts = {
+        seller_id: (user_name, about_info)
+        for seller_id, user_name, about_info in (
+            Seller.objects
+            .filter(id__in=seller_ids)
+            .values_list("id", "user__user_name", "user__about_info")
+        )
+    }
+    _save_entries(SearchEntry.Kind.SELLER, texts)
+    remove_from_index(SearchEntry.Kind.SELLER, seller_ids - texts.keys())
+
+
+def remove_from_index(kind, object_ids):
+    """
+    Remove search entries of given objects.
+
+    Args:
+        kind (str): One of SearchEntry.Kind values.
+        object_ids (iterable): IDs of objects to be removed.
+    """
+    object_ids = list(object_ids)
+    if object_ids:
+        SearchEntry.objects.filter(kind=kind, object_id__in=object_ids).delete()
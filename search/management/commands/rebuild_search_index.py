@@ -0,0 +1,73 @@
+"""Management command to rebuild search entries of every Game and Seller."""
+
+from accounts.models import Seller
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from games.models import Game
+
+from search.indexing import index_games, index_sellers, remove_from_index
+from search.models import SearchEntry
+
+# pylint: disable=no-member
+
+INDEXED_MODELS = (
+    (Game, SearchEntry.Kind.GAME, index_games),
+    (Seller, SearchEntry.Kind.SELLER, index_sellers),
+)
+
+
+class Command(BaseCommand):
+    """
+    Rebuild search entries of every Game and Seller and remove entries of
+    objects which no longer exist. Objects are walked in chunks ordered by
+    their ID.
+    """
+
+    help = "Rebuild search entries of every Game and Seller."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size", type=int, default=1000,
+            help="Number of objects indexed in a single transaction.",
+        )
+
+    def _walk_ids(self, queryset, field, chunk_size):
+        """Yield chunks of values of field, ordered by it."""
+        last_id = 0
+        while True:
+            ids = list(
+                queryset
+                .filter(**{f"{field}__gt": last_id})
+                .order_by(field)
+                .values_list(field, flat=True)[:chunk_size]
+            )
+            if not ids:
+                return
+            yield ids
+            last_id = ids[-1]
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        for model, kind, index_objects in INDEXED_MODELS:
+            indexed = removed = 0
+            for object_ids in self._walk_ids(
+                model.objects.all(), "id", chunk_size
+            ):
+                with transaction.atomic():
+                    index_objects(object_ids)
+                indexed += len(object_ids)
+            for object_ids in self._walk_ids(
+                SearchEntry.objects.filter(kind=kind), "object_id", chunk_size
+            ):
+                existing = set(
+                    model.objects
+                    .filter(id__in=object_ids)
+                    .values_list("id", flat=True)
+                )
+                stale = set(object_ids) - existing
+                remove_from_index(kind, stale)
+                removed += len(stale)
+            self.stdout.write(self.style.SUCCESS(
+                f"Indexed {indexed} {model.__name__}s, "
+                f"removed {removed} stale entries"
+            ))
@@ -0,0 +1,28 @@
+# Generated by Django 3.2.25 on 2026-10-18 15:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('accounts.seller', 'Seller'), ('games.game', 'Game')], max_length=20, verbose_name='Kind of object')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='ID of object')),
+                ('title', models.CharField(max_length=100, verbose_name='Title')),
+                ('body', models.TextField(blank=True, default='', verbose_name='Body')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='searchentry',
+            constraint=models.UniqueConstraint(fields=('kind', 'object_id'), name='unique_search_entry'),
+        ),
+    ]
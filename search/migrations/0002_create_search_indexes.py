@@ -0,0 +1,75 @@
+# Generated by Django 3.2.25 on 2026-10-18 16:05
+
+from django.db import migrations
+
+POSTGRES_FORWARD_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX search_entry_title_trgm_idx ON search_searchentry "
+    "USING gin (title gin_trgm_ops)",
+    "CREATE INDEX search_entry_body_trgm_idx ON search_searchentry "
+    "USING gin (body gin_trgm_ops)",
+]
+POSTGRES_REVERSE_SQL = [
+    "DROP INDEX IF EXISTS search_entry_body_trgm_idx",
+    "DROP INDEX IF EXISTS search_entry_title_trgm_idx",
+]
+
+SQLITE_FORWARD_SQL = [
+    "CREATE VIRTUAL TABLE search_searchentry_fts USING fts5("
+    "title, body, content='search_searchentry', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER search_searchentry_fts_insert "
+    "AFTER INSERT ON search_searchentry BEGIN "
+    "INSERT INTO search_searchentry_fts(rowid, title, body) "
+    "VALUES (new.id, new.title, new.body); END",
+    "CREATE TRIGGER search_searchentry_fts_delete "
+    "AFTER DELETE ON search_searchentry BEGIN "
+    "INSERT INTO search_searchentry_fts(search_searchentry_fts, rowid, title, body) "
+    "VALUES ('delete', old.id, old.title, old.body); END",
+    "CREATE TRIGGER search_searchentry_fts_update "
+    "AFTER UPDATE ON search_searchentry BEGIN "
+    "INSERT INTO search_searchentry_fts(search_searchentry_fts, rowid, title, body) "
+    "VALUES ('delete', old.id, old.title, old.body); "
+    "INSERT INTO search_searchentry_fts(rowid, title, body) "
+    "VALUES (new.id, new.title, new.body); END",
+]
+SQLITE_REVERSE_SQL = [
+    "DROP TRIGGER IF EXISTS search_searchentry_fts_update",
+    "DROP TRIGGER IF EXISTS search_searchentry_fts_delete",
+    "DROP TRIGGER IF EXISTS search_searchentry_fts_insert",
+    "DROP TABLE IF EXISTS search_searchentry_fts",
+]
+
+
+def _run_vendor_sql(schema_editor, statements):
+    """Run statements of database vendor in use, if it has any."""
+    for statement in statements.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(statement)
+
+
+def create_search_indexes(apps, schema_editor):
+    """
+    Create trigram indexes on PostgreSQL or FTS5 index along with triggers
+    keeping it in sync on SQLite.
+    """
+    _run_vendor_sql(schema_editor, {
+        "postgresql": POSTGRES_FORWARD_SQL, "sqlite": SQLITE_FORWARD_SQL,
+    })
+
+
+def drop_search_indexes(apps, schema_editor):
+    """Drop search indexes created by 'create_search_indexes'."""
+    _run_vendor_sql(schema_editor, {
+        "postgresql": POSTGRES_REVERSE_SQL, "sqlite": SQLITE_REVERSE_SQL,
+    })
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
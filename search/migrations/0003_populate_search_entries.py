@@ -0,0 +1,52 @@
+# Generated by Django 3.2.25 on 2026-10-18 16:06
+
+from django.db import migrations
+
+
+def populate_search_entries(apps, schema_editor):
+    """Create search entries of every existing Game and Seller."""
+    Game = apps.get_model("games", "Game")
+    Seller = apps.get_model("accounts", "Seller")
+    SearchEntry = apps.get_model("search", "SearchEntry")
+    entries = [
+        SearchEntry(
+            kind="games.game",
+            object_id=game.id,
+            title=game.name,
+            body=" ".join(
+                [game.description]
+                + [category.name for category in game.categories.all()]
+            ),
+        )
+        for game in Game.objects.prefetch_related("categories")
+    ]
+    entries += [
+        SearchEntry(
+            kind="accounts.seller",
+            object_id=seller_id,
+            title=user_name,
+            body=about_info,
+        )
+        for seller_id, user_name, about_info in Seller.objects.values_list(
+            "id", "user__user_name", "user__about_info"
+        )
+    ]
+    SearchEntry.objects.bulk_create(entries, batch_size=1000)
+
+
+def remove_search_entries(apps, schema_editor):
+    """Remove all search entries."""
+    apps.get_model("search", "SearchEntry").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0002_create_search_indexes'),
+        ('games', '0024_recount_number_of_games_of_sellers'),
+        ('accounts', '0031_auto_20261018_2022'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_search_entries, remove_search_entries),
+    ]
@@ -0,0 +1,36 @@
+"""
+This module contains model holding searchable text of Games and Sellers,
+which search backends index and query.
+"""
+
+# pylint: disable=too-few-public-methods
+
+from django.db import models
+
+
+class SearchEntry(models.Model):
+    """
+    Searchable text of a single Game or Seller. 'title' holds name of Game or
+    user name of Seller, and 'body' holds description and category names of
+    Game or about info of Seller.
+    """
+
+    class Kind(models.TextChoices):
+        """Contains Choices available for searchable objects"""
+        SELLER = "accounts.seller", "Seller"
+        GAME = "games.game", "Game"
+
+    kind = models.CharField("Kind of object", max_length=20, choices=Kind.choices)
+    object_id = models.PositiveBigIntegerField("ID of object")
+    title = models.CharField("Title", max_length=100)
+    body = models.TextField("Body", blank=True, default="")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["kind", "object_id"], name="unique_search_entry"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}_{self.object_id}"
@@ -0,0 +1,185 @@
+"""
+This module catches signals of models holding searchable text and updates
+their search entries accordingly.
+"""
+
+# pylint: disable=unused-argument, no-member
+
+from accounts.models import Seller, User
+from django.core.signals import request_started
+from django.db import transaction
+from django.db.models.signals import (m2m_changed, post_delete, post_save,
+                                      pre_delete)
+from django.dispatch import receiver
+from games.models import Category, Game
+
+from search.autocomplete import Kind, prefix_index
+from search.indexing import index_games, index_sellers, remove_from_index
+from search.models import SearchEntry
+
+
+@receiver(post_save, sender=Game)
+def index_saved_game(instance, *args, **kwargs):
+    """Everytime a Game is saved, its search entry is updated."""
+    index_games([instance.id])
+
+
+@receiver(post_delete, sender=Game)
+def remove_deleted_game_from_index(instance, *args, **kwargs):
+    """Everytime a Game is deleted, its search entry is removed."""
+    remove_from_index(SearchEntry.Kind.GAME, [instance.id])
+
+
+@receiver(m2m_changed, sender=Game.categories.through)
+def index_games_of_changed_categories(
+    instance, action, reverse, pk_set, *args, **kwargs
+):
+    """
+    Everytime categories of a Game change, either from Game or from Category
+    side, search entries of affected Games are updated.
+    """
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            index_games([instance.id])
+        return
+    if action == "pre_clear":
+        instance._cleared_game_ids = list(
+            instance.games.values_list("id", flat=True)
+        )
+    elif action == "post_clear":
+        index_games(getattr(instance, "_cleared_game_ids", []))
+    elif action in ("post_add", "post_remove"):
+        index_games(pk_set)
+
+
+@receiver(post_save, sender=Category)
+def index_games_of_saved_category(instance, created, *args, **kwargs):
+    """
+    Everytime a Category is renamed, search entries of its Games are updated.
+    """
+    if not created:
+        index_games(instance.games.values_list("id", flat=True))
+
+
+@receiver(pre_delete, sender=Category)
+def remember_games_of_deleted_category(instance, *args, **kwargs):
+    """Before a Category is deleted, remember Games it belongs to."""
+    instance._deleted_game_ids = list(
+        instance.games.values_list("id", flat=True)
+    )
+
+
+@receiver(post_delete, sender=Category)
+def index_games_of_deleted_category(instance, *args, **kwargs):
+    """
+    Everytime a Category is deleted, search entries of its former Games are
+    updated.
+    """
+    index_games(getattr(instance, "_deleted_game_ids", []))
+
+
+# Fields of User which search entries of Sellers are built from.
+SELLER_USER_FIELDS = frozenset(("user_name", "about_info"))
+
+
+def _saves_any_field(update_fields, fields):
+    """Check if a save limited to update_fields, if any, saves any fields."""
+    return update_fields is None or not fields.isdisjoint(update_fields)
+
+
+@receiver(post_save, sender=User)
+def index_seller_of_saved_user(
+    instance, created, *args, update_fields=None, **kwargs
+):
+    """
+    Everytime a User is saved, search entry of his Seller, if he is one, is
+    updated, unless only fields it is not built from were saved, such as
+    last login time.
+    """
+    if not created and _saves_any_field(update_fields, SELLER_USER_FIELDS):
+        index_sellers(
+            Seller.objects.filter(user=instance).values_list("id", flat=True)
+        )
+
+
+@receiver(post_save, sender=Seller)
+def index_created_seller(instance, created, *args, **kwargs):
+    """Everytime a Seller is created, a search entry is created for him."""
+    if created:
+        index_sellers([instance.id])
+
+
+@receiver(post_delete, sender=Seller)
+def remove_deleted_seller_from_index(instance, *args, **kwargs):
+    """Everytime a Seller is deleted, his search entry is removed."""
+    remove_from_index(SearchEntry.Kind.SELLER, [instance.id])
+
+
+@receiver(post_save, sender=Game)
+@receiver(post_save, sender=Category)
+def add_saved_name_to_suggestions(sender, instance, *args, **kwargs):
+    """
+    Everytime a Game or Category is saved, its name in type-ahead suggestions
+    is updated once transaction is committed.
+    """
+    kind = Kind.GAME if sender is Game else Kind.CATEGORY
+    transaction.on_commit(
+        lambda: prefix_index.update(kind, instance.id, instance.name)
+    )
+
+
+@receiver(post_delete, sender=Game)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Seller)
+def remove_deleted_name_from_suggestions(sender, instance, *args, **kwargs):
+    """
+    Everytime a Game, Category or Seller is deleted, it is removed from
+    type-ahead suggestions once transaction is committed.
+    """
+    kind = {Game: Kind.GAME, Category: Kind.CATEGORY, Seller: Kind.SELLER}[sender]
+    object_id = instance.id
+    transaction.on_commit(lambda: prefix_index.remove(kind, object_id))
+
+
+@receiver(post_save, sender=Seller)
+def add_created_seller_to_suggestions(instance, created, *args, **kwargs):
+    """
+    Everytime a Seller is created, his user name is added to type-ahead
+    suggestions once transaction is committed.
+    """
+    if created:
+        user_name = instance.user.user_name
+        transaction.on_commit(
+            lambda: prefix_index.update(Kind.SELLER, instance.id, user_name)
+        )
+
+
+@receiver(post_save, sender=User)
+def update_user_name_in_suggestions(
+    instance, created, *args, update_fields=None, **kwargs
+):
+    """
+    Everytime a User who is a Seller is saved, his user name in type-ahead
+    suggestions is updated once transaction is committed, unless his user
+    name was not saved.
+    """
+    if created or not _saves_any_field(update_fields, {"user_name"}):
+        return
+    user_name = instance.user_name
+    for seller_id in Seller.objects.filter(user=instance).values_list(
+        "id", flat=True
+    ):
+        transaction.on_commit(
+            lambda seller_id=seller_id: prefix_index.update(
+                Kind.SELLER, seller_id, user_name
+            )
+        )
+
+
+@receiver(request_started)
+def warm_prefix_index(*args, **kwargs):
+    """
+    Once process starts serving requests, type-ahead suggestions start being
+    built in background, so they are ready before they are first needed.
+    """
+    prefix_index.warm()
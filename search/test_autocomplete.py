@@ -0,0 +1,95 @@
+from unittest import mock
+
+from accounts.models import Seller, User
+from django.test import TestCase
+from django.urls import reverse
+from games.models import Category, Game
+
+from search.autocomplete import Kind, PrefixIndex, get_keys, prefix_index
+
+
+class PrefixIndexTestCase(TestCase):
+    """
+    Check that type-ahead suggestions are found by prefix of any word of
+    their name and stay up to date with signals, even during a rebuild.
+    """
+
+    def setUp(self):
+        self.game = Game.objects.create(name="Speed Racer", image="game.png")
+        self.category = Category.objects.create(name="Racing")
+        self.seller = Seller.objects.create(
+            user=User.objects.create(
+                email="seller@example.com", user_name="racer_x"
+            )
+        )
+        self.index = PrefixIndex()
+        self.index.build()
+
+    def get_suggested(self, index, prefix, limit=None):
+        """Get kind and ID of every suggestion of prefix."""
+        return [
+            (suggestion["kind"], suggestion["id"])
+            for suggestion in index.suggest(prefix, limit)
+        ]
+
+    def test_get_keys(self):
+        self.assertEqual(get_keys("Speed  Racer"), {"speed racer", "racer"})
+
+    def test_suggest_by_prefix_of_any_word(self):
+        self.assertEqual(
+            self.get_suggested(self.index, " RAC "),
+            [
+                (Kind.GAME, self.game.id),
+                (Kind.SELLER, self.seller.id),
+                (Kind.CATEGORY, self.category.id),
+            ],
+        )
+        self.assertEqual(
+            self.get_suggested(self.index, "speed r"),
+            [(Kind.GAME, self.game.id)],
+        )
+        self.assertEqual(
+            self.get_suggested(self.index, "rac", 1),
+            [(Kind.GAME, self.game.id)],
+        )
+        self.assertEqual(self.get_suggested(self.index, ""), [])
+
+    def test_signals_update_suggestions(self):
+        prefix_index.build()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.game.name = "Slow Driver"
+            self.game.save()
+            self.seller.user.user_name = "driver"
+            self.seller.user.save()
+            self.category.delete()
+        self.assertEqual(
+            self.get_suggested(prefix_index, "dri"),
+            [(Kind.GAME, self.game.id), (Kind.SELLER, self.seller.id)],
+        )
+        self.assertEqual(self.get_suggested(prefix_index, "rac"), [])
+
+    def test_updates_during_rebuild_are_kept(self):
+        load = self.index.load
+
+        def load_before_update():
+            state = load()
+            self.index.update(Kind.GAME, self.game.id, "Turbo")
+            self.index.remove(Kind.CATEGORY, self.category.id)
+            return state
+
+        with mock.patch.object(self.index, "load", load_before_update):
+            self.index.build()
+        self.assertEqual(
+            self.get_suggested(self.index, "tur"), [(Kind.GAME, self.game.id)]
+        )
+        self.assertEqual(
+            self.get_suggested(self.index, "rac"),
+            [(Kind.SELLER, self.seller.id)],
+        )
+
+    def test_autocomplete_view(self):
+        prefix_index.build()
+        response = self.client.get(reverse("search:autocomplete"), {"q": "sp"})
+        self.assertEqual(response.json(), {"suggestions": [
+            {"kind": Kind.GAME, "id": self.game.id, "name": "Speed Racer"}
+        ]})
@@ -0,0 +1,103 @@
+from unittest import mock
+
+from accounts.models import Seller, User
+from django.test import TestCase
+from games.models import Category, Game
+
+from search import signals
+from search.backends import (BaseSearchBackend, get_search_backend,
+                             search_objects)
+from search.models import SearchEntry
+
+
+class SearchTestCase(TestCase):
+    """
+    Check that search entries follow writes of Games, Categories and
+    Sellers, and that backends find objects by them, best matches first.
+    """
+
+    def setUp(self):
+        self.racing = Category.objects.create(name="Racing")
+        self.speed = Game.objects.create(
+            name="Speed Racer", description="Fast cars", image="game.png"
+        )
+        self.farm = Game.objects.create(
+            name="Farm Life", description="Tractor racer", image="game.png"
+        )
+        self.user = User.objects.create(
+            email="seller@example.com", user_name="booster",
+            about_info="Fast boosting",
+        )
+        self.seller = Seller.objects.create(user=self.user)
+
+    def search_games(self, query, backend=None):
+        """Get IDs of all Games found by query."""
+        backend = backend or get_search_backend()
+        return backend.search(query, SearchEntry.Kind.GAME).object_ids
+
+    def get_entry(self, kind, object_id):
+        """Get title and body of search entry of an object."""
+        return SearchEntry.objects.values_list("title", "body").get(
+            kind=kind, object_id=object_id
+        )
+
+    def test_games_are_found(self):
+        self.assertEqual(self.search_games("speed"), [self.speed.id])
+        self.assertEqual(
+            self.search_games("racer"), [self.speed.id, self.farm.id]
+        )
+        self.assertEqual(self.search_games("  "), [])
+
+    def test_title_matches_rank_first_in_base_backend(self):
+        self.assertEqual(
+            self.search_games("racer", BaseSearchBackend()),
+            [self.speed.id, self.farm.id],
+        )
+        self.assertEqual(
+            self.search_games("fast", BaseSearchBackend()), [self.speed.id]
+        )
+
+    def test_search_objects_pages(self):
+        games, has_next = search_objects(
+            Game.objects.all(), "racer", SearchEntry.Kind.GAME, page_size=1
+        )
+        self.assertEqual((games, has_next), ([self.speed], True))
+        games, has_next = search_objects(
+            Game.objects.all(), "racer", SearchEntry.Kind.GAME, 2, 1
+        )
+        self.assertEqual((games, has_next), ([self.farm], False))
+
+    def test_entries_follow_categories(self):
+        self.racing.games.add(self.farm)
+        self.assertEqual(
+            self.get_entry(SearchEntry.Kind.GAME, self.farm.id),
+            ("Farm Life", "Tractor racer Racing"),
+        )
+        self.racing.name = "Driving"
+        self.racing.save()
+        self.assertEqual(self.search_games("driving"), [self.farm.id])
+        self.racing.delete()
+        self.assertEqual(self.search_games("driving"), [])
+
+    def test_entries_of_deleted_objects_are_removed(self):
+        self.speed.delete()
+        self.seller.delete()
+        self.assertEqual(self.search_games("racer"), [self.farm.id])
+        self.assertFalse(
+            SearchEntry.objects.filter(kind=SearchEntry.Kind.SELLER).exists()
+        )
+
+    def test_entries_follow_seller_user_names(self):
+        self.user.user_name = "carry"
+        self.user.save()
+        self.assertEqual(
+            self.get_entry(SearchEntry.Kind.SELLER, self.seller.id),
+            ("carry", "Fast boosting"),
+        )
+
+    def test_saves_of_other_user_fields_are_not_indexed(self):
+        with mock.patch.object(signals, "index_sellers") as index_sellers:
+            self.user.save(update_fields=["last_login"])
+            index_sellers.assert_not_called()
+            self.user.save(update_fields=["about_info"])
+            index_sellers.assert_called_once()
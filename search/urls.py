@@ -0,0 +1,12 @@
+"""URL Configuration for Search app"""
+
+from django.urls import path
+
+# pylint: disable=relative-beyond-top-level, invalid-name
+from . import views
+
+app_name = "search"
+
+urlpatterns = [
+    path('autocomplete/', views.autocomplete, name='autocomplete'),
+]
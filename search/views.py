@@ -0,0 +1,18 @@
+"""Contains all the view functions of Search app."""
+
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+
+from search.autocomplete import prefix_index
+
+
+@require_GET
+def autocomplete(request):
+    """
+    Get type-ahead suggestions of Games, Categories and Sellers whose name
+    starts with text in query parameter "q", answered from in-memory prefix
+    index without querying the database.
+    """
+    return JsonResponse(
+        {"suggestions": prefix_index.suggest(request.GET.get("q", ""))}
+    )